@@ -0,0 +1,62 @@
+"""Markup sent per rerun of the game screen, and the cost of filling in a template.
+
+Drives the real app headlessly with Streamlit's AppTest and counts the
+bytes of Markdown and HTML the script emits on each rerun. Stylesheets go
+out once per session, on the first run that needs them; later reruns send
+only the markup. The template timing compares ASSETS.render with the
+equivalent inline f-string.
+
+Run from the repository root:
+
+    python -m benchmarks.asset_benchmark --reruns 20
+"""
+
+import argparse
+import os
+import timeit
+
+from streamlit.testing.v1 import AppTest
+
+from models.assets import ASSETS
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def markup_bytes(at):
+    """UTF-8 bytes of every Markdown and HTML element on screen"""
+    text = [element.value for element in at.markdown]
+    text += [element.proto.body for element in at.get("html")]
+    return sum(len(value.encode("utf-8")) for value in text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.button(key="begin_button").click().run()
+    at.text_input[0].input("Bench").run()
+    at.button[0].click().run()
+    first = markup_bytes(at)
+    later = []
+    for _ in range(args.reruns):
+        at.run()
+        later.append(markup_bytes(at))
+
+    values = {"target": "Goblin", "gold": 12, "xp": 30}
+    template = ASSETS.template("victory_badge").source
+    number = 100_000
+    render = timeit.timeit(lambda: ASSETS.render("victory_badge", **values), number=number) / number
+    inline = timeit.timeit(lambda: template.format(**values), number=number) / number
+
+    print(f"Game screen markup over {args.reruns} reruns")
+    print(f"{'first run (with stylesheet)':<30}{first:>8} bytes")
+    print(f"{'each later rerun':<30}{max(later):>8} bytes")
+    print(f"{'victory badge render':<30}{render * 1e6:>8.2f} us")
+    print(f"{'inline str.format':<30}{inline * 1e6:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Monte Carlo combat balancing: a million fights with NumPy, checked against the scalar engine.
+
+Run from the repository root:
+
+    python -m benchmarks.balance_benchmark --fights 1000000
+    python -m benchmarks.balance_benchmark --report   # print the per-matchup table
+"""
+
+import argparse
+import time
+
+from models.balance import matchup_grid, simulate, simulate_scalar
+from models.enemy_archetypes import ENEMY_ARCHETYPES
+from models.npc import NPC
+
+CLASSES = ("warrior", "mage", "rogue")
+LEVELS = range(1, 11)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fights", type=int, default=1_000_000, help="total fights across all matchups")
+    parser.add_argument("--report", action="store_true")
+    args = parser.parse_args()
+
+    matchups = matchup_grid(CLASSES, LEVELS, list(ENEMY_ARCHETYPES))
+    per_matchup = max(1, args.fights // len(matchups))
+    start = time.perf_counter()
+    report = simulate(matchups, per_matchup, seed=0)
+    elapsed = time.perf_counter() - start
+    print(f"{len(matchups)} matchups x {per_matchup} fights = {len(matchups) * per_matchup} fights "
+          f"in {elapsed:.2f} s (NumPy)")
+
+    # The same rules through CombatState, one fight at a time, for a few matchups
+    dragon = NPC("Ancient Dragon", 200, 10, 100, 100, is_boss=True)
+    checks = matchup_grid(("mage",), (3, 6), [ENEMY_ARCHETYPES.get("Troll"), dragon])
+    vector = simulate(checks, 20000, seed=1)
+    print(f"\n{'check':<30}{'NumPy win':>11}{'engine win':>12}{'NumPy turns':>13}{'engine turns':>14}")
+    scalar_time = 0
+    for i, matchup in enumerate(checks):
+        start = time.perf_counter()
+        won, turns, _ = simulate_scalar(matchup, 5000, seed=i)
+        scalar_time += time.perf_counter() - start
+        print(f"{matchup.label:<30}{vector.won[i].mean():>11.1%}{won.mean():>12.1%}"
+              f"{vector.turns[i][vector.won[i]].mean():>13.2f}{turns[won].mean():>14.2f}")
+    print(f"engine: {len(checks) * 5000} fights in {scalar_time:.2f} s")
+
+    if args.report:
+        print()
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Combat turns: a one-on-one duel against a 20-enemy horde resolved in one batched pass.
+
+Run from the repository root:
+
+    python -m benchmarks.encounter_benchmark --turns 20000 --horde 20
+"""
+
+import argparse
+import random
+import time
+
+from models.combat import CombatState
+from models.enemy_archetypes import ENEMY_ARCHETYPES
+from models.player import Player
+
+ENDLESS_HP = 10 ** 12  # nobody dies, so every step is a full turn
+
+
+def time_turns(enemy_count, turns, seed):
+    rng = random.Random(seed)
+    player = Player("Bench", None)
+    player.hp = ENDLESS_HP
+    enemies = ENEMY_ARCHETYPES.spawn_many(5, enemy_count, rng)
+    for enemy in enemies:
+        enemy.hp = ENDLESS_HP
+    combat = CombatState(player, enemies, rng)
+    step = combat.step
+    start = time.perf_counter()
+    for _ in range(turns):
+        step("attack")
+    elapsed = time.perf_counter() - start
+    assert combat.turn == turns and not combat.over
+    return elapsed / turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20_000)
+    parser.add_argument("--horde", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    duel = time_turns(1, args.turns, args.seed)
+    horde = time_turns(args.horde, args.turns, args.seed)
+    print(f"{args.turns} turns each")
+    print(f"{'1 vs 1 duel':<26}{duel * 1e6:>8.1f} us/turn")
+    print(f"{f'1 vs {args.horde} horde, batched':<26}{horde * 1e6:>8.1f} us/turn")
+    print(f"{f'{args.horde} duels, one per turn':<26}{duel * args.horde * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
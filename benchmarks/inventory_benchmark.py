@@ -0,0 +1,49 @@
+"""Stacked Inventory against the plain item list it replaced, for a loot-heavy player.
+
+Run from the repository root:
+
+    python -m benchmarks.inventory_benchmark
+"""
+
+import random
+import timeit
+
+from models.inventory import Inventory
+from models.item import Item
+
+
+def loot(count, seed=0):
+    rng = random.Random(seed)
+    return [Item.create_random_item(rng.randint(1, 3), rng) for _ in range(count)]
+
+
+def main():
+    items = loot(500)
+    names = [item.name for item in items[:100]]
+    as_list = list(items)
+    inventory = Inventory(items)
+
+    def list_render():
+        return [f"📦 {item.name}" for item in as_list]
+
+    def stack_render():
+        return [f"📦 {stack.item.name} x{stack.count}" for stack in inventory.stacks()]
+
+    rows = [
+        ("build", lambda: list(items), lambda: Inventory(items)),
+        ("find x100", lambda: [next(i for i in as_list if i.name == n) for n in names],
+         lambda: [inventory.find(n) for n in names]),
+        ("weapons", lambda: [i for i in as_list if i.item_type == "weapon"],
+         lambda: inventory.by_type("weapon")),
+        ("render rows", list_render, stack_render),
+    ]
+    print(f"{len(items)} items -> {inventory.slots} stacks (rows to render)")
+    print(f"{'operation':<14}{'list':>12}{'Inventory':>12}")
+    for label, baseline, stacked in rows:
+        a = min(timeit.repeat(baseline, number=200, repeat=3)) / 200
+        b = min(timeit.repeat(stacked, number=200, repeat=3)) / 200
+        print(f"{label:<14}{a * 1e6:>9.1f} us{b * 1e6:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Logging a long fight: an unbounded list re-rendered in full against a ring-buffer journal read a page at a time.
+
+Run from the repository root:
+
+    python -m benchmarks.journal_benchmark --events 5000
+"""
+
+import argparse
+import time
+
+from models.journal import COMBAT_LOG_CAPACITY, MESSAGE_LOG_CAPACITY, Journal
+
+PAGE = 20  # events a rerun renders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5_000)
+    args = parser.parse_args()
+    n = args.events
+
+    # One rerun per event, each formatting what it shows, as the combat log did before and does now
+    start = time.perf_counter()
+    log = []
+    for i in range(n):
+        log.append(i)
+        rendered = [f"event {event}" for event in log]
+    unbounded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    journal = Journal(COMBAT_LOG_CAPACITY)
+    for i in range(n):
+        journal.append(i)
+        rendered = [f"event {event}" for _, event in journal.page(0, PAGE)]
+    paged = time.perf_counter() - start
+
+    # The message log: append then trim by slicing, against overwriting the oldest slot
+    start = time.perf_counter()
+    messages = []
+    for i in range(n):
+        messages.append(f"message {i}")
+        if len(messages) > MESSAGE_LOG_CAPACITY:
+            messages = messages[-MESSAGE_LOG_CAPACITY:]
+    sliced = time.perf_counter() - start
+
+    start = time.perf_counter()
+    journal = Journal(MESSAGE_LOG_CAPACITY)
+    for i in range(n):
+        journal.append(f"message {i}")
+    ring = time.perf_counter() - start
+    assert list(journal) == messages
+
+    print(f"{n} events, one rerun each")
+    print(f"{'combat log, full list':<26}{unbounded * 1e3:>9.1f} ms")
+    print(f"{'combat log, one page':<26}{paged * 1e3:>9.1f} ms")
+    print(f"{'message log, slicing':<26}{sliced * 1e3:>9.1f} ms")
+    print(f"{'message log, ring':<26}{ring * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Rolling loot for many chests: item templates against building every Item from scratch.
+
+Run from the repository root:
+
+    python -m benchmarks.loot_benchmark --chests 100000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from models.item import Item
+from models.item_templates import ITEM_TEMPLATES
+
+
+def legacy_random_item(level, rng):
+    """create_random_item as it was before item templates"""
+    item_types = {
+        "weapon": [
+            ("Rusty Sword", "A worn but serviceable blade", 5, {"damage": 3}),
+            ("Steel Sword", "A reliable weapon", 10, {"damage": 5}),
+            ("Magic Sword", "Glows with mysterious energy", 20, {"damage": 8}),
+        ],
+        "armor": [
+            ("Leather Armor", "Basic protection", 5, {"defense": 2}),
+            ("Chain Mail", "Solid metal protection", 15, {"defense": 4}),
+            ("Plate Armor", "Heavy but effective", 25, {"defense": 6}),
+        ],
+        "consumable": [
+            ("Health Potion", "Restores HP", 5, {"heal": 20}, True),
+            ("Strength Potion", "Temporarily boosts attack", 8, {"temp_attack": 3}, True),
+            ("Defense Potion", "Temporarily boosts defense", 8, {"temp_defense": 3}, True),
+        ]
+    }
+    item_type = rng.choice(list(item_types.keys()))
+    base_item = rng.choice(item_types[item_type])
+    effects = base_item[3].copy()
+    for key in effects:
+        effects[key] = int(effects[key] * (1 + (level - 1) * 0.2))
+    combat_usable = len(base_item) > 4 and base_item[4]
+    return Item(name=base_item[0], description=base_item[1], item_type=item_type,
+                value=base_item[2] * level, combat_usable=combat_usable, effects=effects)
+
+
+def run(label, roll, chests):
+    rng = random.Random(0)
+    levels = [rng.randint(1, 20) for _ in range(chests)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loot = [roll(level, rng) for level in levels]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<22}{elapsed * 1e3:>9.1f} ms{size / 2 ** 20:>9.1f} MB{size / len(loot):>8.0f} B/item")
+    return loot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'':<22}{'time':>12}{'memory':>12}{'':>14}")
+    old = run("Item per chest", legacy_random_item, args.chests)
+    new = run("ItemTemplate.roll", ITEM_TEMPLATES.roll, args.chests)
+    # Same seed, same draws: both should roll the same loot
+    assert [(i.name, i.value, dict(i.effects)) for i in old] == [(i.name, i.value, dict(i.effects)) for i in new]
+
+
+if __name__ == "__main__":
+    main()
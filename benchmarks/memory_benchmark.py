@@ -0,0 +1,83 @@
+"""Bytes per entity for the slotted model classes against a per-instance __dict__ layout.
+
+The "__dict__" column rebuilds each object as a plain class instance holding
+the same attribute values, which is how the models were laid out before they
+declared __slots__. Only the objects themselves are measured; the values
+(strings, dicts, item lists) are shared by both layouts.
+
+Run from the repository root:
+
+    python -m benchmarks.memory_benchmark
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from models.enemy import Enemy
+from models.item import Item
+from models.npc import NPC
+from models.quest import Quest
+from models.room import Room
+
+
+class DictLayout:
+    """Stand-in for a model class without __slots__"""
+
+
+def slot_names(cls):
+    names = []
+    for klass in reversed(cls.__mro__):
+        names.extend(name for name in klass.__dict__.get("__slots__", ()) if name != "__weakref__")
+    return names
+
+
+def as_dict_layout(obj):
+    plain = DictLayout()
+    for name in slot_names(type(obj)):
+        setattr(plain, name, getattr(obj, name))
+    return plain
+
+
+def as_slotted(obj):
+    copy = object.__new__(type(obj))
+    for name in slot_names(type(obj)):
+        setattr(copy, name, getattr(obj, name))
+    return copy
+
+
+def measure(build):
+    """Bytes allocated per object by build()"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    samples = {
+        "Item": lambda: Item.create_random_item(rng.randint(1, 5), rng),
+        "Enemy": lambda: Enemy.create_random_enemy(rng.randint(1, 5), rng),
+        "NPC": lambda: NPC("Villager", 30, 2, 5, 10),
+        "Room": lambda: Room("Room", "An empty room."),
+        "Quest": lambda: Quest(1, "Slay the wolves", "kill", "Wolf", 3, {"gold": 50}),
+    }
+    print(f"{'entity':<8}{'__dict__':>12}{'__slots__':>12}{'saved':>8}")
+    for label, make in samples.items():
+        originals = [make() for _ in range(args.count)]
+        slotted = measure(lambda: [as_slotted(obj) for obj in originals])
+        dict_based = measure(lambda: [as_dict_layout(obj) for obj in originals])
+        print(f"{label:<8}{dict_based:>10.0f} B{slotted:>10.0f} B{1 - slotted / dict_based:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Route-finding latency on a large compiled world.
+
+Run from the repository root:
+
+    python -m benchmarks.pathfinding_benchmark --rooms 50000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.room_graph_benchmark import build_graph_world, grid_size
+from models.pathfinding import Landmarks, PathFinder
+
+
+def per_call(func, pairs):
+    started = time.perf_counter()
+    for start, goal in pairs:
+        func(start, goal)
+    return (time.perf_counter() - started) / len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    width, height = grid_size(args.rooms)
+    graph = build_graph_world(width, height)
+    rooms = [graph.room(room_id) for room_id in (0, len(graph) // 2, len(graph) - 1)]
+    rng = random.Random(1)
+    goals = [graph.room(rng.randrange(len(graph))) for _ in range(args.queries)]
+
+    finder = PathFinder.for_graph(graph)
+    started = time.perf_counter()
+    finder.route(rooms[0], goals[0])
+    cold = time.perf_counter() - started
+
+    pairs = [(rooms[0], goal) for goal in goals]
+    cached_distance = per_call(finder.distance, pairs)
+    cached_route = per_call(finder.route, pairs)
+
+    # A new exit is folded into the cached table instead of rebuilding it
+    started = time.perf_counter()
+    rooms[0].connect("up", rooms[1])
+    incremental = time.perf_counter() - started
+    assert finder.distance(rooms[0], rooms[1]) == 1
+
+    started = time.perf_counter()
+    landmarks = Landmarks(0, finder.neighbors, count=4)
+    landmark_build = time.perf_counter() - started
+    alt = PathFinder.for_graph(graph, heuristic=landmarks)
+    alt_route = per_call(alt.route, [(rooms[2], goal) for goal in goals[:20]])
+
+    print(f"{len(graph)} rooms ({width}x{height} grid), {args.queries} random destinations")
+    print(f"first route (builds distance table) {cold * 1e3:9.2f} ms")
+    print(f"cached distance lookup              {cached_distance * 1e3:9.4f} ms")
+    print(f"cached route reconstruction         {cached_route * 1e3:9.4f} ms")
+    print(f"incremental update after shortcut   {incremental * 1e3:9.2f} ms")
+    print(f"landmark precomputation (4)         {landmark_build * 1e3:9.2f} ms")
+    print(f"uncached A* + ALT route             {alt_route * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
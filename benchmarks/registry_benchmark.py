@@ -0,0 +1,35 @@
+"""Room lookup cost by name and by handle as worlds grow.
+
+Run from the repository root:
+
+    python -m benchmarks.registry_benchmark
+"""
+
+import random
+import timeit
+
+from models.room import Room
+from models.world import World
+
+
+def build_world(size):
+    return World(rooms={f"Room {i}": Room(f"Room {i}", "An empty room.") for i in range(size)})
+
+
+def main():
+    print(f"{'rooms':>8}{'by_name':>12}{'by_id':>12}{'World() rebuild':>18}")
+    rebuild = min(timeit.repeat(World, number=200, repeat=3)) / 200
+    for size in (100, 10_000, 100_000):
+        world = build_world(size)
+        registry = world.registry
+        rng = random.Random(size)
+        names = [f"Room {rng.randrange(size)}" for _ in range(1000)]
+        handles = [registry.handle(name) for name in names]
+
+        by_name = min(timeit.repeat(lambda: [registry.by_name(n) for n in names], number=100, repeat=3)) / 1e5
+        by_id = min(timeit.repeat(lambda: [registry.by_id(h) for h in handles], number=100, repeat=3)) / 1e5
+        print(f"{size:>8}{by_name * 1e9:>9.0f} ns{by_id * 1e9:>9.0f} ns{rebuild * 1e6:>15.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Memory and traversal benchmark: dict-of-objects rooms vs. compiled RoomGraph.
+
+Run from the repository root:
+
+    python -m benchmarks.room_graph_benchmark --rooms 40000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections import deque
+
+from models.room import Room
+from models.room_graph import RoomGraphBuilder
+
+
+def grid_size(rooms):
+    side = int(rooms ** 0.5)
+    return side, max(1, rooms // side)
+
+
+def build_object_world(width, height):
+    rooms = [Room(f"Room {x},{y}", "A featureless stretch of wilderness.")
+             for y in range(height) for x in range(width)]
+    for y in range(height):
+        for x in range(width):
+            room = rooms[y * width + x]
+            if x + 1 < width:
+                room.connect("east", rooms[y * width + x + 1])
+            if y + 1 < height:
+                room.connect("south", rooms[(y + 1) * width + x])
+    return rooms
+
+
+def build_graph_world(width, height):
+    builder = RoomGraphBuilder()
+    for y in range(height):
+        for x in range(width):
+            builder.add_room(f"Room {x},{y}", "A featureless stretch of wilderness.")
+    for y in range(height):
+        for x in range(width):
+            room_id = y * width + x
+            if x + 1 < width:
+                builder.connect(room_id, "east", room_id + 1)
+            if y + 1 < height:
+                builder.connect(room_id, "south", room_id + width)
+    return builder.build()
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def walk_objects(start):
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for neighbor in queue.popleft().exits.values():
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return len(seen)
+
+
+def walk_graph(graph, start):
+    offsets, targets = graph.offsets, graph.targets
+    seen = bytearray(len(graph))
+    seen[start] = 1
+    queue = deque([start])
+    visited = 1
+    while queue:
+        room_id = queue.popleft()
+        for neighbor in targets[offsets[room_id]:offsets[room_id + 1]]:
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                visited += 1
+                queue.append(neighbor)
+    return visited
+
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=40000)
+    args = parser.parse_args()
+
+    width, height = grid_size(args.rooms)
+    total = width * height
+
+    rooms, object_bytes = measure(lambda: build_object_world(width, height))
+    object_count, object_time = timed(walk_objects, rooms[0])
+    del rooms
+
+    graph, graph_bytes = measure(lambda: build_graph_world(width, height))
+    graph_count, graph_time = timed(walk_graph, graph, 0)
+    assert object_count == graph_count == total
+
+    print(f"{total} rooms ({width}x{height} grid)")
+    print(f"{'':12}{'memory':>14}{'bytes/room':>12}{'BFS':>12}")
+    print(f"{'objects':12}{object_bytes / 1e6:>11.1f} MB{object_bytes / total:>12.0f}{object_time * 1e3:>9.1f} ms")
+    print(f"{'RoomGraph':12}{graph_bytes / 1e6:>11.1f} MB{graph_bytes / total:>12.0f}{graph_time * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Saving a late-game session: time and size of full snapshots and delta saves.
+
+Builds a late-game character on a grid world file (every room visited,
+one in ten changed, a full inventory with large stacks) and on an open
+world after a long walk, then times SaveSlot.save for the first, full
+snapshot and for a delta save after a small change (some gold, one room),
+and SaveSlot.load for reading it all back. "pickle" is the same save
+sections pickled, for comparison; the Player object graph itself cannot be
+pickled, since rooms hold weak references to their world.
+
+With --check the run fails (exit status 1) when a save takes longer than
+--budget-ms. Run from the repository root:
+
+    python -m benchmarks.save_benchmark --rooms 400 --runs 20
+"""
+
+import argparse
+import os
+import pickle
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.world_template_benchmark import write_grid_world
+from models.enemy import Enemy
+from models.item import Item
+from models.item_templates import ITEM_TEMPLATES
+from models.player import Player
+from models.procedural import ChunkedWorld
+from models.progression import PROGRESSION
+from models.rng import RandomStreams
+from models.savegame import SaveSlot, capture
+from models.world import World
+from models.world_loader import WorldFile
+from models.world_template import WorldTemplate
+
+LEVEL = 40
+WALK_STEPS = 2000
+
+
+def new_session(world):
+    start = world.get_starting_room()
+    world.starting_room = start
+    player = Player("Benchmark Hero", "warrior")
+    player.current_room = start
+    player.discovered_rooms = {start.name}
+    return {"world": world, "player": player, "discovered_secrets": set(), "rng": RandomStreams(7)}
+
+
+def late_game(player, rng):
+    """Levels, gold, quests and a full inventory of stacked loot"""
+    player.add_xp(PROGRESSION.threshold(LEVEL) - player.total_xp)
+    player.gold = 98765
+    player.quests = {"forest_guardian_defeated": True, "shadow_lord_defeated": True}
+    player.spells = {"reveal", "fireball"}
+    items = [ITEM_TEMPLATES.roll(LEVEL, rng) for _ in range(40)]
+    items += [Item("Healing Potion", "Restores 50 HP", "potion", 50) for _ in range(200)]
+    items += [Item(f"Trophy {i}", "A keepsake from a hard-won fight", "misc", 10 * i) for i in range(8)]
+    player.inventory_capacity = 100
+    player.inventory = items
+    player.equipped_weapon = ITEM_TEMPLATES.create("Magic Sword", LEVEL)
+    player.equipped_armor = ITEM_TEMPLATES.create("Plate Armor", LEVEL)
+    player.add_status_effect("attack_boost", 5, 3)
+
+
+def play_world_file(world, player):
+    for i, name in enumerate(list(world.rooms)):
+        room = world.rooms[name]
+        room.on_enter(player)
+        player.visited_rooms.add(name)
+        player.discovered_rooms.add(name)
+        if i % 10 == 0:
+            room.items.remove(room.items[0])
+            room.npcs[0].hp -= 10
+        player.current_room = room
+
+
+def play_open_world(world, player, rng):
+    room = player.current_room
+    for _ in range(WALK_STEPS):
+        room = room.exits[rng.choice(list(room.exits))]
+        world.focus(room)
+        room.on_enter(player)
+        player.discovered_rooms.add(room.name)
+        if room.items:
+            player.inventory.append(room.items.pop())
+        for npc in room.npcs:
+            npc.hp -= 3
+    player.current_room = room
+
+
+def small_change(player, rng):
+    """What happens between two saves: a fight's gold and wounds, a new enemy in the room"""
+    player.gold += rng.randint(1, 50)
+    player.hp = max(1, player.hp - rng.randint(1, 5))
+    player.current_room.npcs.append(Enemy.create_random_enemy(LEVEL, rng))
+
+
+def measure(game_state, directory, runs, rng, world_file):
+    slot = SaveSlot(game_state["player"].name, directory)
+    full_times, delta_times, load_times = [], [], []
+    full_size = delta_size = 0
+    for _ in range(runs):
+        slot.delete()
+        start = time.perf_counter()
+        _, full_size = slot.save(game_state)
+        full_times.append(time.perf_counter() - start)
+        small_change(game_state["player"], rng)
+        start = time.perf_counter()
+        kind, delta_size = slot.save(game_state)
+        delta_times.append(time.perf_counter() - start)
+        assert kind == "delta"
+        start = time.perf_counter()
+        SaveSlot(game_state["player"].name, directory).load(world_file)
+        load_times.append(time.perf_counter() - start)
+    pickled = len(pickle.dumps(capture(game_state), pickle.HIGHEST_PROTOCOL))
+    return (statistics.median(full_times), full_size, statistics.median(delta_times), delta_size,
+            statistics.median(load_times), pickled)
+
+
+def report(label, result):
+    full_time, full_size, delta_time, delta_size, load_time, pickled = result
+    print(f"{label:<12}{'full':<8}{full_time * 1e3:>9.2f}{full_size / 1024:>10.1f}")
+    print(f"{'':<12}{'delta':<8}{delta_time * 1e3:>9.2f}{delta_size / 1024:>10.1f}")
+    print(f"{'':<12}{'load':<8}{load_time * 1e3:>9.2f}")
+    print(f"{'':<12}{'pickle':<8}{'':>9}{pickled / 1024:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=400)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="most a full or delta save may take")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 when over budget")
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        world_file = os.path.join(tmp, "grid.world")
+        write_grid_world(world_file, args.rooms)
+        saves = os.path.join(tmp, "saves")
+
+        session = new_session(World.from_template(WorldTemplate(WorldFile(world_file))))
+        late_game(session["player"], rng)
+        play_world_file(session["world"], session["player"])
+        world_result = measure(session, saves, args.runs, rng, world_file)
+
+        session = new_session(ChunkedWorld(seed=11))
+        late_game(session["player"], rng)
+        play_open_world(session["world"], session["player"], rng)
+        open_result = measure(session, saves, args.runs, rng, world_file)
+
+    print(f"Late-game saves (level {LEVEL}), median of {args.runs} runs")
+    print(f"{'world':<12}{'save':<8}{'ms':>9}{'KiB':>10}")
+    report(f"{args.rooms} rooms", world_result)
+    report("open world", open_result)
+
+    slowest = max(world_result[0], world_result[2], open_result[0], open_result[2]) * 1e3
+    if args.check and slowest > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
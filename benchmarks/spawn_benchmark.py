@@ -0,0 +1,69 @@
+"""Spawning a dungeon floor of enemies: archetype stat tables against per-enemy formulas.
+
+Run from the repository root:
+
+    python -m benchmarks.spawn_benchmark --enemies 100000
+"""
+
+import argparse
+import random
+import time
+
+from models.enemy import Enemy
+from models.enemy_archetypes import ENEMY_ARCHETYPES
+from models.item_templates import ITEM_TEMPLATES
+
+
+def legacy_random_enemy(player_level, rng):
+    """create_random_enemy as it was before archetypes"""
+    enemy_types = [
+        ("Goblin", 8, 2, 1, 8, 4),
+        ("Orc", 12, 3, 2, 12, 6),
+        ("Troll", 15, 4, 2, 15, 8),
+        ("Dragon", 20, 5, 3, 20, 10),
+        ("Ghost", 10, 3, 1, 10, 5),
+        ("Skeleton", 8, 2, 1, 8, 4),
+        ("Zombie", 12, 2, 2, 10, 5),
+        ("Witch", 8, 4, 1, 12, 6),
+        ("Demon", 15, 4, 2, 15, 8),
+        ("Giant Spider", 10, 3, 1, 10, 5)
+    ]
+    name, base_hp, base_attack, base_defense, base_xp, base_gold = rng.choice(enemy_types)
+    level = max(1, player_level + rng.randint(-2, 2))
+    drops = []
+    if rng.random() < 0.3:
+        drops.append(ITEM_TEMPLATES.roll(level, rng))
+    return Enemy(name=name, level=level, hp=base_hp, attack=base_attack, defense=base_defense,
+                 xp_value=base_xp, gold_value=base_gold, drops=drops)
+
+
+def snapshot(enemies):
+    return [(e.name, e.level, e.hp, e.attack_power, e.defense, e.xp_reward, e.loot_gold,
+             [item.name for item in e.drops]) for e in enemies]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enemies", type=int, default=100_000)
+    parser.add_argument("--level", type=int, default=12)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    old = [legacy_random_enemy(args.level, rng) for _ in range(args.enemies)]
+    legacy = time.perf_counter() - start
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    new = ENEMY_ARCHETYPES.spawn_many(args.level, args.enemies, rng)
+    batched = time.perf_counter() - start
+
+    # Same seed, same draws: both should spawn the same enemies
+    assert snapshot(old) == snapshot(new)
+    print(f"{args.enemies} enemies around level {args.level}")
+    print(f"{'per-enemy formulas':<22}{legacy * 1e3:>9.1f} ms")
+    print(f"{'spawn_many':<22}{batched * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Cold start of the app: import time of its own modules and time to first render.
+
+Import times come from ``python -X importtime -c "import app"`` in a fresh
+interpreter. Time to first render starts a fresh interpreter, runs the
+app's intro screen with Streamlit's AppTest, then plays through to the game
+screen. Every measurement runs after a warm-up start so the bytecode cache
+is written, as it is on a server after its first launch.
+
+With --check the run fails (exit status 1) when the app's own modules take
+longer than --budget-ms to import, or when a module that is meant to load
+lazily (LAZY_MODULES) is imported at startup. Run from the repository root:
+
+    python -m benchmarks.startup_benchmark --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+OWN_PACKAGES = ("app", "game", "models")
+LAZY_MODULES = ("numpy",)  # only the batch code paths need these
+
+FIRST_RENDER = f"""
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({APP!r}, default_timeout=60)
+at.run()
+intro = time.perf_counter() - start
+at.button(key="begin_button").click().run()
+at.text_input[0].input("Bench").run()
+at.button[0].click().run()
+print(intro, time.perf_counter() - start)
+"""
+
+
+def environment():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=environment(), capture_output=True, text=True)
+
+
+def import_times():
+    """{module: (self us, cumulative us)} for everything `import app` loads"""
+    times = {}
+    for line in python("-X", "importtime", "-c", "import app").stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative))
+    return times
+
+
+def own(name):
+    return name.split(".")[0] in OWN_PACKAGES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=20.0,
+                        help="most the app's own modules may spend importing, app.py's own body excluded")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 when over budget")
+    args = parser.parse_args()
+
+    python("-c", "import app")  # warm-up: writes the bytecode cache
+    samples = [import_times() for _ in range(args.runs)]
+    modules = [name for name in samples[-1] if own(name)]
+    median = {name: statistics.median(s[name][0] for s in samples if name in s) for name in modules}
+    models_ms = sum(us for name, us in median.items() if name != "app") / 1e3
+    total_ms = statistics.median(s["app"][1] for s in samples) / 1e3
+    eager = [name for name in LAZY_MODULES if name in samples[-1]]
+
+    renders = []
+    for _ in range(args.runs):
+        result = python("-c", FIRST_RENDER)
+        intro, game = result.stdout.split()[-2:]
+        renders.append((float(intro), float(game)))
+
+    print(f"Startup over {args.runs} fresh interpreters (medians)")
+    print(f"{'import app, total':<32}{total_ms:>9.1f} ms")
+    print(f"{'  app modules (models, game)':<32}{models_ms:>9.1f} ms   budget {args.budget_ms:.0f} ms")
+    for name in sorted(median, key=median.get, reverse=True)[:5]:
+        print(f"{'    ' + name:<32}{median[name] / 1e3:>9.1f} ms")
+    print(f"{'lazy modules loaded at startup':<32}{', '.join(eager) or 'none':>9}")
+    print(f"{'first render (intro screen)':<32}{statistics.median(r[0] for r in renders) * 1e3:>9.0f} ms")
+    print(f"{'game screen reached':<32}{statistics.median(r[1] for r in renders) * 1e3:>9.0f} ms")
+
+    if args.check and (models_ms > args.budget_ms or eager):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Per-interaction cost of an Attack click: a full script rerun against a rerun of the combat fragment alone.
+
+Drives the real app headlessly with Streamlit's AppTest. The full rerun is
+what every click cost before the UI was split into fragments; the fragment
+run executes only combat_panel (which includes the player's status), which is
+what Streamlit re-executes for an Attack click now.
+
+Run from the repository root:
+
+    python -m benchmarks.ui_benchmark --clicks 50 --horde 20
+"""
+
+import argparse
+import os
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from models.enemy_archetypes import ENEMY_ARCHETYPES
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+ENDLESS_HP = 10 ** 9
+
+FRAGMENT_SCRIPT = """
+import app
+app.combat_panel()
+"""
+
+
+def start_fight(horde):
+    """An app in a fight against a horde nobody can finish off"""
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.button(key="begin_button").click().run()
+    at.text_input[0].input("Bench").run()
+    at.button[0].click().run()
+    game_state = at.session_state.game_state
+    room = game_state['player'].current_room
+    for _ in range(horde):
+        enemy = ENEMY_ARCHETYPES.get("Goblin").create(1)
+        enemy.hp = ENDLESS_HP
+        room.npcs.append(enemy)
+    game_state['player'].hp = ENDLESS_HP
+    at.run()
+    [b for b in at.button if b.label == "Attack ⚔️"][-1].click().run()
+    return at
+
+
+def attack_button(at):
+    return next(b for b in at.button if b.label == "Attack 🗡️")
+
+
+def time_clicks(at, clicks):
+    start = time.perf_counter()
+    for _ in range(clicks):
+        attack_button(at).click().run()
+    return (time.perf_counter() - start) / clicks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clicks", type=int, default=50)
+    parser.add_argument("--horde", type=int, default=20)
+    args = parser.parse_args()
+
+    full = start_fight(args.horde)
+    fragment = AppTest.from_string(FRAGMENT_SCRIPT, default_timeout=60)
+    for key in ("state_manager", "game_state", "message_log", "ui_fragments"):
+        fragment.session_state[key] = full.session_state[key]
+    fragment.run()
+
+    full_time = time_clicks(full, args.clicks)
+    fragment_time = time_clicks(fragment, args.clicks)
+    assert full.session_state.game_state['combat_state'].turn >= args.clicks
+
+    print(f"Attack clicks against a {args.horde}-enemy horde, {args.clicks} each")
+    print(f"{'full script rerun':<26}{full_time * 1e3:>9.1f} ms/click")
+    print(f"{'combat fragment rerun':<26}{fragment_time * 1e3:>9.1f} ms/click")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Memory per game session: a private world per session against one shared WorldTemplate.
+
+Writes a grid world file with an item and an NPC in every room, then opens
+it for many sessions. Each session walks every room once, rendering it, and
+changes a few: takes an item, wounds an NPC, opens an exit. "private" is
+World.load, where every session decodes and keeps its own rooms, items and
+NPCs; "template" is World.from_template over one process-wide template.
+
+Run from the repository root:
+
+    python -m benchmarks.world_template_benchmark --rooms 400 --sessions 50
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from models.item import Item
+from models.npc import NPC
+from models.room import Room
+from models.world import World
+from models.world_loader import WorldFile, write_world_file
+from models.world_template import WorldTemplate
+
+CHANGED_EVERY = 10  # a session changes one room in this many
+
+
+def write_grid_world(path, rooms):
+    side = max(1, int(rooms ** 0.5))
+    grid = [Room(f"Room {i}", "Wind moves through tall grass under a pale sky.") for i in range(side * side)]
+    for i, room in enumerate(grid):
+        if (i + 1) % side:
+            room.connect("east", grid[i + 1])
+        if i + side < len(grid):
+            room.connect("south", grid[i + side])
+        room.items.append(Item(f"Trinket {i}", "A small keepsake", "misc", 5))
+        room.npcs.append(NPC(f"Wolf {i}", hp=30, attack_power=4, loot_gold=3, xp_reward=8))
+    write_world_file(path, grid, grid[0].name)
+
+
+def play(world):
+    """Visit every room and change some of them, as a session would"""
+    for i, name in enumerate(list(world.rooms)):
+        room = world.rooms[name]
+        room.describe()
+        if i % CHANGED_EVERY == 0:
+            room.items.remove(room.items[0])
+            room.npcs[0].hp -= 10
+            room.connect("up", world.rooms[world.start_room_name])
+
+
+def template_opener(path):
+    """Opens session worlds over one template, built by the first call"""
+    template = None
+
+    def open_world():
+        nonlocal template
+        if template is None:
+            template = WorldTemplate(WorldFile(path))
+        return World.from_template(template)
+    return open_world
+
+
+def measure(open_world, sessions):
+    """(bytes retained per session, seconds per session)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    worlds = []
+    for _ in range(sessions):
+        world = open_world()
+        play(world)
+        worlds.append(world)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / sessions, elapsed / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=400)
+    parser.add_argument("--sessions", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.world")
+        write_grid_world(path, args.rooms)
+        private_bytes, private_time = measure(lambda: World.load(path), args.sessions)
+        # The template is built inside the measurement, so its one-off cost is spread over the sessions
+        template_bytes, template_time = measure(template_opener(path), args.sessions)
+
+    print(f"{args.sessions} sessions on a {args.rooms}-room world, each changing one room in {CHANGED_EVERY}")
+    print(f"{'world':<10}{'KiB/session':>13}{'ms/session':>12}")
+    print(f"{'private':<10}{private_bytes / 1024:>13.1f}{private_time * 1e3:>12.2f}")
+    print(f"{'template':<10}{template_bytes / 1024:>13.1f}{template_time * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# models/abilities.py
+
+import json
+import os
+import random
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+ABILITIES_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "abilities.json")
+
+HEAL_CAP = 100  # a healing boss never goes above this HP
+DEFAULT_SETS_CACHED = 256  # default sets kept compiled for archetypes without their own
+
+
+class Ability:
+    """One special move: damage to the player, healing for the user and a status inflicted.
+
+    ``text`` is the narration, with ``{name}`` standing for whoever uses it;
+    ``weight`` is how likely the move is relative to the others in its set.
+    """
+
+    __slots__ = ("name", "text", "damage", "heal", "status", "weight")
+
+    def __init__(self, name, text, damage=0, heal=0, status=None, weight=1):
+        if weight <= 0:
+            raise ValueError(f"ability {name!r} needs a positive weight")
+        self.name = name
+        self.text = text
+        self.damage = damage
+        self.heal = heal
+        self.status = status
+        self.weight = weight
+
+    @classmethod
+    def from_record(cls, record):
+        return cls(record["name"], record["text"], damage=record.get("damage", 0), heal=record.get("heal", 0),
+                   status=record.get("status"), weight=record.get("weight", 1))
+
+    def for_user(self, name):
+        """A copy with the narration filled in for one user"""
+        return Ability(self.name, self.text.format(name=name), self.damage, self.heal, self.status, self.weight)
+
+    def apply(self, user, target):
+        """Use the move on a target and return its narration"""
+        if self.damage:
+            target.hp -= self.damage
+        if self.heal:
+            user.hp = min(user.hp + self.heal, HEAL_CAP)
+        if self.status:
+            target.add_status(self.status)
+        return self.text
+
+    def __repr__(self):
+        return f"Ability({self.name!r})"
+
+
+class AbilitySet:
+    """The moves one NPC archetype can use, compiled for weighted picks.
+
+    Cumulative weights are worked out once, so a pick is one uniform draw
+    and one binary search however many moves there are.
+    """
+
+    __slots__ = ("abilities", "cumulative", "total")
+
+    def __init__(self, abilities):
+        self.abilities = tuple(abilities)
+        if not self.abilities:
+            raise ValueError("an ability set needs at least one ability")
+        self.cumulative = list(accumulate(ability.weight for ability in self.abilities))
+        self.total = self.cumulative[-1]
+
+    def pick(self, rng=None):
+        """One weighted random ability"""
+        return self.abilities[bisect_right(self.cumulative, (rng or random).random() * self.total)]
+
+    def chances(self):
+        """(ability, probability) for every move in the set"""
+        return [(ability, ability.weight / self.total) for ability in self.abilities]
+
+    def __iter__(self):
+        return iter(self.abilities)
+
+    def __len__(self):
+        return len(self.abilities)
+
+
+class AbilityRegistry:
+    """Ability sets by NPC archetype (the NPC's name), loaded from data.
+
+    Archetypes without their own set use the default moves, compiled for
+    that archetype's name the first time it is asked for and kept in a small
+    cache apart from the registered sets, so a new boss needs only a data
+    entry or nothing at all, and looking up an unknown name leaves the
+    registry as it was.
+    """
+
+    def __init__(self, archetypes=None, default=(), max_default_sets=DEFAULT_SETS_CACHED):
+        self._default = tuple(default)  # Ability templates for archetypes without their own set
+        self._sets = {}  # archetype name -> AbilitySet
+        self._default_sets = OrderedDict()  # archetype name -> compiled default AbilitySet, least recent first
+        self.max_default_sets = max_default_sets
+        for name, abilities in (archetypes or {}).items():
+            self.register(name, abilities)
+
+    @classmethod
+    def from_data(cls, data):
+        return cls({name: [Ability.from_record(record) for record in records]
+                    for name, records in data.get("archetypes", {}).items()},
+                   [Ability.from_record(record) for record in data.get("default", [])])
+
+    @classmethod
+    def load(cls, path=ABILITIES_FILE):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_data(json.load(f))
+
+    def register(self, name, abilities):
+        if name in self._sets:
+            raise ValueError(f"duplicate ability set {name!r}")
+        ability_set = self._sets[name] = AbilitySet(ability.for_user(name) for ability in abilities)
+        return ability_set
+
+    def get(self, name):
+        """The compiled ability set for an archetype"""
+        ability_set = self._sets.get(name)
+        if ability_set is None:
+            ability_set = self._default_set(name)
+        return ability_set
+
+    def _default_set(self, name):
+        """The default moves compiled for an archetype, from the cache when possible"""
+        ability_set = self._default_sets.get(name)
+        if ability_set is None:
+            if not self._default:
+                raise KeyError(name)
+            ability_set = self._default_sets[name] = AbilitySet(ability.for_user(name) for ability in self._default)
+            while len(self._default_sets) > self.max_default_sets:
+                self._default_sets.popitem(last=False)
+        else:
+            self._default_sets.move_to_end(name)
+        return ability_set
+
+    def __contains__(self, name):
+        return name in self._sets
+
+    def __iter__(self):
+        return iter(self._sets)
+
+    def __len__(self):
+        return len(self._sets)
+
+
+# Boss specials from data/abilities.json
+ABILITIES = AbilityRegistry.load()
@@ -0,0 +1,145 @@
+# models/assets.py
+
+import hashlib
+import json
+import os
+import re
+from string import Formatter
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def content_hash(text):
+    """A short hex digest of an asset's text, to tell versions of it apart"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _compact(text):
+    """Text with each line stripped and joined onto one line.
+
+    Whitespace between HTML tags and CSS rules means nothing to the browser,
+    and a single line keeps Markdown from reading indented HTML as a code block.
+    """
+    return " ".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+class Stylesheet:
+    """A CSS file, compacted and hashed when loaded.
+
+    ``key`` names this version of the sheet, so a browser that already has it
+    can be skipped and one holding an older version can swap it out.
+    """
+
+    __slots__ = ("name", "css", "hash")
+
+    def __init__(self, name, source):
+        self.name = name
+        self.css = _compact(_CSS_COMMENT.sub("", source))
+        self.hash = content_hash(self.css)
+
+    @property
+    def key(self):
+        return f"{self.name}-{self.hash}"
+
+    def __repr__(self):
+        return f"Stylesheet({self.name!r}, {self.hash})"
+
+
+class Template:
+    """An HTML file compiled once into a format string with ``{field}`` placeholders."""
+
+    __slots__ = ("name", "source", "fields", "hash", "_format")
+
+    def __init__(self, name, source):
+        self.name = name
+        self.source = _compact(source)
+        self.fields = frozenset(field for _, field, _, _ in Formatter().parse(self.source) if field)
+        self.hash = content_hash(self.source)
+        self._format = self.source.format_map
+
+    def render(self, **values):
+        """The template filled in; a missing field raises KeyError"""
+        return self._format(values)
+
+    def __repr__(self):
+        return f"Template({self.name!r}, fields={sorted(self.fields)})"
+
+
+def injection_script(stylesheets):
+    """A <script> that adds each sheet to the page head unless that version is already there.
+
+    Older versions of the same sheet are removed, so the head never holds
+    two copies of one stylesheet.
+    """
+    sheets = json.dumps([[sheet.name, sheet.key, sheet.css] for sheet in stylesheets]).replace("</", "<\\/")
+    return ("<script>(function () {"
+            f"var head = document.head; {sheets}.forEach(function (sheet) {{"
+            "var id = 'asset-' + sheet[1]; if (document.getElementById(id)) return;"
+            "head.querySelectorAll('style[data-asset=\"' + sheet[0] + '\"]').forEach(function (old) { old.remove(); });"
+            "var style = document.createElement('style'); style.id = id; style.dataset.asset = sheet[0];"
+            "style.textContent = sheet[2]; head.appendChild(style);"
+            "}); })();</script>")
+
+
+class AssetRegistry:
+    """Stylesheets and HTML templates by name, read from disk once.
+
+    ``css/<name>.css`` files become Stylesheets and ``templates/<name>.html``
+    files become Templates, so adding a page's styling or markup needs a file
+    and no code.
+    """
+
+    def __init__(self, stylesheets=(), templates=()):
+        self._stylesheets = {}  # name -> Stylesheet
+        self._templates = {}  # name -> Template
+        for sheet in stylesheets:
+            self.register(sheet)
+        for template in templates:
+            self.register(template)
+
+    @classmethod
+    def load(cls, root=ASSETS_DIR):
+        return cls(_read(root, "css", ".css", Stylesheet), _read(root, "templates", ".html", Template))
+
+    def register(self, asset):
+        table = self._stylesheets if isinstance(asset, Stylesheet) else self._templates
+        if asset.name in table:
+            raise ValueError(f"duplicate asset {asset.name!r}")
+        table[asset.name] = asset
+        return asset
+
+    def stylesheet(self, name):
+        return self._stylesheets[name]
+
+    def template(self, name):
+        return self._templates[name]
+
+    def render(self, name, /, **values):
+        """Fill in the template `name`"""
+        return self._templates[name]._format(values)
+
+    def __contains__(self, name):
+        return name in self._stylesheets or name in self._templates
+
+    def __iter__(self):
+        yield from self._stylesheets
+        yield from self._templates
+
+    def __len__(self):
+        return len(self._stylesheets) + len(self._templates)
+
+
+def _read(root, folder, suffix, kind):
+    directory = os.path.join(root, folder)
+    assets = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(suffix):
+            with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                assets.append(kind(filename[:-len(suffix)], f.read()))
+    return assets
+
+
+# Stylesheets and templates from assets/, loaded once per process
+ASSETS = AssetRegistry.load()
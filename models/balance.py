@@ -0,0 +1,229 @@
+# models/balance.py
+
+import random
+import warnings
+
+import numpy as np
+
+from models.combat import (ARMOR_ABSORB, BOSS_DAMAGE_MULTIPLIER, BOSS_SPECIAL_CHANCE, CRIT_CHANCE,
+                           CRIT_MULTIPLIER, ENEMY_DAMAGE_ROLL, PLAYER_DAMAGE_ROLL, CombatState)
+from models.abilities import ABILITIES, HEAL_CAP
+from models.enemy_archetypes import EnemyArchetype
+from models.item import Item
+from models.npc import NPC
+from models.player import STATUS_DAMAGE, Player
+from models.progression import PROGRESSION
+
+# Player statuses as bit flags so a whole batch fits in one uint8 array
+STATUS_BITS = {"Burning": 1, "Poisoned": 2, "Stunned": 4}
+
+LEVEL_SPREAD = 2  # spawned enemies are up to this many levels either side of the player
+
+
+class Matchup:
+    """A player of some class and level, with optional gear, against one kind of opponent.
+
+    The opponent is an EnemyArchetype (its level rolled around the player's,
+    as spawning does) or a fixed NPC such as a boss.
+    """
+
+    __slots__ = ("character_class", "level", "opponent", "weapon", "armor")
+
+    def __init__(self, character_class, level, opponent, weapon=0, armor=0):
+        self.character_class = character_class
+        self.level = level
+        self.opponent = opponent
+        self.weapon = weapon  # weapon damage bonus, 0 for none
+        self.armor = armor  # armor defense rating, 0 for none
+
+    @property
+    def label(self):
+        return f"{self.character_class} L{self.level} vs {self.opponent.name}"
+
+
+def matchup_grid(classes, levels, opponents, weapon=0, armor=0):
+    """Every (class, level, opponent) combination"""
+    return [Matchup(c, level, opponent, weapon, armor)
+            for c in classes for level in levels for opponent in opponents]
+
+
+def _specials(opponent):
+    """(damage, heal, status bits, probability) for each special move an opponent can use"""
+    if not getattr(opponent, "is_boss", False):
+        return [(0, 0, 0, 1.0)]
+    return [(ability.damage, ability.heal, STATUS_BITS.get(ability.status, 0), chance)
+            for ability, chance in ABILITIES.get(opponent.name).chances()]
+
+
+class BalanceReport:
+    """Per-matchup outcome arrays from a batch of simulated fights.
+
+    Every array has shape (matchups, fights). ``won`` is True for victories,
+    ``turns`` counts rounds fought and ``hp_left`` is the player's HP at the
+    end. Fights still going after ``max_turns`` count as not won.
+    """
+
+    def __init__(self, matchups, won, turns, hp_left):
+        self.matchups = matchups
+        self.won = won
+        self.turns = turns
+        self.hp_left = hp_left
+
+    def rows(self):
+        """Summary dicts, one per matchup"""
+        win_rate = self.won.mean(axis=1)
+        turns = np.where(self.won, self.turns, np.nan)
+        hp_left = np.where(self.won, self.hp_left, np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # matchups the player never wins
+            turns_p50, turns_p90 = np.nanpercentile(turns, [50, 90], axis=1)
+            hp_p10, hp_p50 = np.nanpercentile(hp_left, [10, 50], axis=1)
+            turns_mean = np.nanmean(turns, axis=1)
+        return [{"matchup": m.label, "win_rate": float(win_rate[i]), "turns_mean": float(turns_mean[i]),
+                 "turns_p50": float(turns_p50[i]), "turns_p90": float(turns_p90[i]),
+                 "hp_left_p10": float(hp_p10[i]), "hp_left_p50": float(hp_p50[i])}
+                for i, m in enumerate(self.matchups)]
+
+    def format(self):
+        lines = [f"{'matchup':<34}{'win':>7}{'turns p50':>11}{'p90':>6}{'hp left p10':>13}{'p50':>7}"]
+        for row in self.rows():
+            lines.append(f"{row['matchup']:<34}{row['win_rate']:>7.1%}{row['turns_p50']:>11.0f}"
+                         f"{row['turns_p90']:>6.0f}{row['hp_left_p10']:>13.0f}{row['hp_left_p50']:>7.0f}")
+        return "\n".join(lines)
+
+
+def simulate(matchups, fights, seed=None, max_turns=500):
+    """Fight every matchup `fights` times at once with NumPy; returns a BalanceReport.
+
+    Follows the rules of CombatState round by round, on arrays holding every
+    fight still in progress: the player hits (level-scaled roll, weapon bonus,
+    crits), then a surviving enemy either uses a boss special or hits back
+    (boss multiplier, armor absorption), then the player's statuses burn.
+    ``seed`` is an int or a NumPy Generator, e.g. RandomStreams.generator("balance").
+    """
+    rng = np.random.default_rng(seed)
+    groups = len(matchups)
+    total = groups * fights
+    group = np.repeat(np.arange(groups), fights)
+
+    level = np.array([m.level for m in matchups], dtype=np.int64)[group]
+    player_hp = np.array([PROGRESSION.stats(m.character_class, m.level)[0] for m in matchups], dtype=float)[group]
+    weapon = np.array([m.weapon for m in matchups], dtype=np.int64)[group]
+    armor = np.array([m.armor for m in matchups], dtype=float)[group]
+    is_boss = np.array([bool(getattr(m.opponent, "is_boss", False)) for m in matchups])[group]
+
+    # Opponent HP: archetypes are rolled within LEVEL_SPREAD levels of the player, NPCs are fixed
+    enemy_hp = np.empty(total)
+    for g, m in enumerate(matchups):
+        block = slice(g * fights, (g + 1) * fights)
+        if isinstance(m.opponent, EnemyArchetype):
+            top = m.level + LEVEL_SPREAD
+            table = np.array([0] + [m.opponent.stats(lvl)[0] for lvl in range(1, top + 1)], dtype=float)
+            levels = np.maximum(1, m.level + rng.integers(-LEVEL_SPREAD, LEVEL_SPREAD + 1, fights))
+            enemy_hp[block] = table[levels]
+        else:
+            enemy_hp[block] = m.opponent.hp
+
+    specials = [_specials(m.opponent) for m in matchups]
+    width = max(len(moves) for moves in specials)
+    special_damage = np.zeros((groups, width))
+    special_heal = np.zeros((groups, width))
+    special_status = np.zeros((groups, width), dtype=np.uint8)
+    special_cumulative = np.full((groups, width), 2.0)  # padding past 1 is never picked
+    for g, moves in enumerate(specials):
+        for k, (damage, heal, bits, _) in enumerate(moves):
+            special_damage[g, k] = damage
+            special_heal[g, k] = heal
+            special_status[g, k] = bits
+        special_cumulative[g, :len(moves)] = np.cumsum([chance for *_, chance in moves])
+        special_cumulative[g, len(moves) - 1] = 1.0  # no rounding gap at the top
+
+    status = np.zeros(total, dtype=np.uint8)
+    turns = np.zeros(total, dtype=np.int32)
+    won = np.zeros(total, dtype=bool)
+    burn, poison = STATUS_DAMAGE["Burning"], STATUS_DAMAGE["Poisoned"]
+    low, high = PLAYER_DAMAGE_ROLL
+    enemy_low, enemy_high = ENEMY_DAMAGE_ROLL
+
+    active = np.arange(total)
+    for _ in range(max_turns):
+        if active.size == 0:
+            break
+        idx = active
+        n = idx.size
+
+        # Player attack
+        damage = rng.integers(low, high + 1, n) * level[idx]
+        bonus = weapon[idx]
+        damage += np.where(bonus > 0, (rng.random(n) * bonus).astype(np.int64) + 1, 0)
+        damage = np.where(rng.random(n) < CRIT_CHANCE, damage * CRIT_MULTIPLIER, damage)
+        enemy_hp[idx] -= damage
+        turns[idx] += 1
+        alive = enemy_hp[idx] > 0
+        won[idx[~alive]] = True
+        idx = idx[alive]
+        n = idx.size
+
+        # Enemy turn: boss specials...
+        special = is_boss[idx] & (rng.random(n) < BOSS_SPECIAL_CHANCE)
+        s_idx = idx[special]
+        if s_idx.size:
+            g = group[s_idx]
+            # Weighted pick: count the cumulative chances the draw has passed
+            move = (rng.random(s_idx.size)[:, None] >= special_cumulative[g]).sum(axis=1)
+            player_hp[s_idx] -= special_damage[g, move]
+            heal = special_heal[g, move]
+            healed = heal > 0
+            h_idx = s_idx[healed]
+            enemy_hp[h_idx] = np.minimum(enemy_hp[h_idx] + heal[healed], HEAL_CAP)
+            status[s_idx] |= special_status[g, move]
+
+        # ...or a regular hit, softened by armor
+        a_idx = idx[~special]
+        hit = rng.integers(enemy_low, enemy_high + 1, a_idx.size).astype(float)
+        hit = np.where(is_boss[a_idx], hit * BOSS_DAMAGE_MULTIPLIER, hit)
+        rating = armor[a_idx]
+        absorbed = np.minimum(hit * ARMOR_ABSORB, rating)
+        hit = np.where(rating > 0, np.maximum(1, hit - absorbed), hit)
+        player_hp[a_idx] -= hit
+
+        # Ongoing status damage, HP floored at 0
+        bits = status[idx]
+        player_hp[idx] = np.maximum(0, player_hp[idx] - np.where(bits & 1, burn, 0) - np.where(bits & 2, poison, 0))
+        active = idx[player_hp[idx] > 0]
+
+    shape = (groups, fights)
+    return BalanceReport(matchups, won.reshape(shape), turns.reshape(shape), player_hp.reshape(shape))
+
+
+def _scalar_fighters(matchup, rng):
+    player = Player("Balancer", matchup.character_class)
+    player.add_xp(PROGRESSION.threshold(matchup.level))
+    if matchup.weapon:
+        player.weapon = Item("Test Weapon", "", "weapon", effects={"damage": matchup.weapon})
+    if matchup.armor:
+        player.armor = Item("Test Armor", "", "armor", effects={"defense": matchup.armor})
+    opponent = matchup.opponent
+    if isinstance(opponent, EnemyArchetype):
+        enemy = opponent.create(max(1, matchup.level + rng.randint(-LEVEL_SPREAD, LEVEL_SPREAD)))
+    else:
+        enemy = NPC(opponent.name, opponent.hp, opponent.attack_power, opponent.loot_gold,
+                    opponent.xp_reward, opponent.is_boss)
+    return player, enemy
+
+
+def simulate_scalar(matchup, fights, seed=None, max_turns=500):
+    """Fight one matchup with the real CombatState engine; returns (won, turns, hp_left) arrays"""
+    rng = random.Random(seed)
+    won, turns, hp_left = np.zeros(fights, dtype=bool), np.zeros(fights, dtype=np.int32), np.zeros(fights)
+    for i in range(fights):
+        player, enemy = _scalar_fighters(matchup, rng)
+        combat = CombatState(player, enemy, rng)
+        while not combat.over and combat.turn < max_turns:
+            events = combat.step("attack")
+            if events and events[-1].kind == "defeat":
+                player.hp = 0  # the engine revives the player; the balancer wants the fight's end state
+        won[i] = combat.outcome == "victory"
+        turns[i] = combat.turn
+        hp_left[i] = max(0, player.hp)
+    return won, turns, hp_left
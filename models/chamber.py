@@ -0,0 +1,79 @@
+# models/chamber.py
+
+from functools import cache
+
+from models.item import Item
+
+# Hidden Chamber Constants
+SECRET_PHRASE = "whispers of the ancients"
+HINT_TEXT = "Listen to the whispers of the cavern walls..."
+
+# Door Animation Frames
+DOOR_FRAMES = (
+    """
+    +----------+
+    |    ||    |
+    |    ||    |
+    |    ||    |
+    +----------+
+    """,
+    """
+    +----------+
+    |   |  |   |
+    |   |  |   |
+    |   |  |   |
+    +----------+
+    """,
+    """
+    +----------+
+    |  |    |  |
+    |  |    |  |
+    |  |    |  |
+    +----------+
+    """,
+    """
+    +----------+
+    | |      | |
+    | |      | |
+    | |      | |
+    +----------+
+    """,
+    """
+    +----------+
+    |          |
+    |          |
+    |          |
+    +----------+
+    """
+)
+CLOSING_DOOR_FRAMES = DOOR_FRAMES[::-1]  # reversed once here, not on every door animation
+
+DOOR_OPENING_FRAMES = (
+    "╔════╗\n║    ║\n║    ║\n╚════╝",
+    "╔════╗\n║ ░░ ║\n║ ░░ ║\n╚════╝",
+    "╔════╗\n║ ▒▒ ║\n║ ▒▒ ║\n╚════╝",
+    "╔════╗\n║ ▓▓ ║\n║ ▓▓ ║\n╚════╝",
+    "╔════╗\n║ ██ ║\n║ ██ ║\n╚════╝"
+)
+
+DOOR_CLOSING_FRAMES = DOOR_OPENING_FRAMES[::-1]
+
+
+@cache
+def chamber_loot():
+    """The loot the Hidden Chamber holds, built on first use and shared after that"""
+    return (
+        Item("Ancient Relic", "A mysterious artifact pulsing with magical energy", item_type="artifact", value=500),
+        Item("Enchanted Scroll", "Contains powerful forgotten spells", item_type="scroll", value=300),
+        Item("Crystal Shard", "A fragment of pure magical essence", item_type="material", value=250),
+    )
+
+
+@cache
+def special_chamber_loot():
+    """The rarer chamber treasures, built on first use"""
+    return (
+        Item("Ancient Scroll", "A mysterious scroll covered in glowing runes", "scroll", "legendary"),
+        Item("Crystal Staff", "A staff humming with magical energy", "weapon", "epic"),
+        Item("Mystic Amulet", "An amulet that pulses with an otherworldly light", "accessory", "rare"),
+    )
@@ -0,0 +1,86 @@
+# models/cinematics.py
+
+import html
+from collections import deque
+
+FRAME_SECONDS = 0.4  # how long each frame of a sequence stays on screen
+
+
+def _frame_html(frame):
+    """A text frame escaped for a <pre>, on one line so Markdown keeps the block together"""
+    lines = frame.rstrip().lstrip("\n").splitlines()
+    return "&#10;".join(html.escape(line.rstrip()) for line in lines)
+
+
+class Cinematic:
+    """A timed sequence of text frames, optionally followed by a caption.
+
+    ``frames`` are shown one after another for ``frame_seconds`` each and the
+    last one stays up; ``caption`` is HTML that fades in once they finish.
+    ``css_class`` styles the whole sequence. The animations come from the
+    "cinematic" stylesheet in assets/css, which must be on the page.
+    """
+
+    __slots__ = ("name", "frames", "caption", "css_class", "frame_seconds")
+
+    def __init__(self, name, frames=(), caption="", css_class="", frame_seconds=FRAME_SECONDS):
+        self.name = name
+        self.frames = tuple(frames)
+        self.caption = caption
+        self.css_class = css_class
+        self.frame_seconds = frame_seconds
+
+    @property
+    def duration(self):
+        """Seconds until the last frame is up and the caption starts to fade in"""
+        return len(self.frames) * self.frame_seconds
+
+    def to_html(self):
+        """The whole sequence as one HTML block, timed by CSS animation delays"""
+        step = self.frame_seconds
+        classes = f"cinematic {self.css_class}".rstrip()
+        parts = [f'<div class="{classes}">']
+        if self.frames:
+            parts.append('<div class="cinematic-stage">')
+            frames = [_frame_html(frame) for frame in self.frames]
+            # An invisible copy of the widest frame gives the stage its size
+            parts.append(f'<pre class="cinematic-frame sizer">{max(frames, key=len)}</pre>')
+            last = len(frames) - 1
+            for i, frame in enumerate(frames):
+                hold = " hold" if i == last else ""
+                parts.append(f'<pre class="cinematic-frame{hold}" style="animation-duration: {step}s; '
+                             f'animation-delay: {i * step:.2f}s">{frame}</pre>')
+            parts.append('</div>')
+        if self.caption:
+            parts.append(f'<div class="cinematic-caption" style="animation-delay: {self.duration:.2f}s">'
+                         f'{self.caption}</div>')
+        parts.append('</div>')
+        return "\n".join(parts)
+
+    def __repr__(self):
+        return f"Cinematic({self.name!r}, {len(self.frames)} frames)"
+
+
+class CinematicQueue:
+    """Sequences waiting to be shown on the next render.
+
+    Game logic pushes a sequence and returns straight away; the interface
+    drains the queue once per rerun and hands each sequence to the browser.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self):
+        self._pending = deque()
+
+    def push(self, cinematic):
+        self._pending.append(cinematic)
+
+    def drain(self):
+        """Every queued sequence, oldest first, leaving the queue empty"""
+        pending = list(self._pending)
+        self._pending.clear()
+        return pending
+
+    def __len__(self):
+        return len(self._pending)
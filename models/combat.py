@@ -0,0 +1,368 @@
+# models/combat.py
+
+import random
+from bisect import bisect_right
+from functools import cache
+
+from models.journal import COMBAT_LOG_CAPACITY, Journal
+
+# Combat rules, shared with anything that simulates fights
+PLAYER_DAMAGE_ROLL = (3, 8)  # per player level
+CRIT_CHANCE = 0.1
+CRIT_MULTIPLIER = 2
+ENEMY_DAMAGE_ROLL = (2, 6)
+BOSS_DAMAGE_MULTIPLIER = 1.5
+BOSS_SPECIAL_CHANCE = 0.3
+ARMOR_ABSORB = 0.3  # armor absorbs up to this share of a hit, capped by its defense
+GOLD_BONUS_ROLL = (1, 20)
+XP_BONUS_ROLL = (5, 15)
+BOSS_REWARD_MULTIPLIER = 2
+
+# Boss name -> (player.quests key, secret discovered, quest title)
+BOSS_QUESTS = {
+    "Ancient Dragon": ("slay_dragon", "Dragon Slayer", "Slay the Ancient Dragon!"),
+    "Shadow Knight": ("found_amulet", "Shadow Knight Defeated", "Defeat the Shadow Knight!"),
+}
+
+COMBAT_STATUSES = ("Burning", "Poisoned", "Stunned")  # cleared when a fight is won
+
+# Every face of each damage die, so a roll is one rng.choice
+PLAYER_DAMAGE_FACES = tuple(range(PLAYER_DAMAGE_ROLL[0], PLAYER_DAMAGE_ROLL[1] + 1))
+ENEMY_DAMAGE_FACES = tuple(range(ENEMY_DAMAGE_ROLL[0], ENEMY_DAMAGE_ROLL[1] + 1))
+
+
+class CombatEvent:
+    """Something that happened in a fight, for the interface to render.
+
+    kind is one of "attack", "special", "armor", "enemy_attack", "status",
+    "quest", "slain", "victory", "defeat" or "fled"; the other fields are
+    filled in as that kind needs.
+    """
+
+    __slots__ = ("kind", "actor", "target", "amount", "hits", "hp", "critical", "text", "gold", "xp", "secret")
+
+    def __init__(self, kind, actor=None, target=None, amount=0, hits=1, hp=None, critical=False, text=None,
+                 gold=0, xp=0, secret=None):
+        self.kind = kind
+        self.actor = actor  # name of whoever acted
+        self.target = target  # name of whoever it was done to
+        self.amount = amount  # damage dealt or absorbed
+        self.hits = hits  # blows summed into amount, for a horde's attacks
+        self.hp = hp  # target's HP after the event
+        self.critical = critical
+        self.text = text  # narration from specials, statuses, quests and level-ups
+        self.gold = gold
+        self.xp = xp
+        self.secret = secret  # secret discovered by completing a quest
+
+    def __repr__(self):
+        return f"CombatEvent({self.kind!r}, actor={self.actor!r}, target={self.target!r}, amount={self.amount!r}, hp={self.hp!r})"
+
+
+def weapon_bonus(player):
+    weapon = player.weapon
+    return weapon.effects.get("damage", 0) if weapon else 0
+
+
+def armor_rating(player):
+    armor = player.armor
+    return armor.effects.get("defense", 0) if armor else 0
+
+
+def roll_player_damage(player, rng):
+    """(damage, critical) for one player attack"""
+    damage = rng.choice(PLAYER_DAMAGE_FACES) * player.level
+    bonus = weapon_bonus(player)
+    if bonus > 0:
+        damage += rng.randint(1, bonus)
+    critical = rng.random() < CRIT_CHANCE
+    if critical:
+        damage *= CRIT_MULTIPLIER
+    return damage, critical
+
+
+@cache
+def _volley_ways(hits, rating):
+    """{(damage, absorbed): ways to roll it} over every roll of `hits` regular blows on armor `rating`"""
+    if hits == 0:
+        return {(0, 0): 1}
+    blows = []
+    for roll in ENEMY_DAMAGE_FACES:
+        absorbed = min(roll * ARMOR_ABSORB, rating)
+        blows.append((max(1, roll - absorbed), absorbed))
+    ways = {}
+    for (damage, absorbed), count in _volley_ways(hits - 1, rating).items():
+        for hit, soak in blows:
+            key = (round(damage + hit, 9), round(absorbed + soak, 9))  # merge float sums that only differ by rounding
+            ways[key] = ways.get(key, 0) + count
+    return ways
+
+
+@cache
+def volley(hits, rating):
+    """Every total `hits` regular enemy blows can do through armor `rating`, compiled for one draw.
+
+    Returns (outcomes, bounds): outcomes are (damage, absorbed) pairs and
+    bounds their cumulative odds, so ``outcomes[bisect_right(bounds,
+    rng.random())]`` rolls a whole volley with the same odds as rolling each
+    blow. Worked out once per hit count and rating.
+    """
+    ways = _volley_ways(hits, rating)
+    total = len(ENEMY_DAMAGE_FACES) ** hits
+    outcomes, bounds, running = [], [], 0
+    for outcome, count in sorted(ways.items()):
+        outcomes.append(outcome)
+        running += count
+        bounds.append(running / total)
+    bounds.pop()  # anything past the second-to-last bound is the last outcome
+    return tuple(outcomes), bounds
+
+
+def _wore_off(combatant, expired):
+    """Status events for the timed effects that just ran out on a combatant"""
+    return [CombatEvent("status", target=combatant.name,
+                        text=f"⏳ {combatant.name}'s {effect.name.replace('_', ' ')} wears off.")
+            for effect in expired]
+
+
+def _as_list(combatants):
+    return list(combatants) if isinstance(combatants, (list, tuple)) else [combatants]
+
+
+class CombatState:
+    """One encounter between the player's party and one or more enemies, advanced with step(action).
+
+    ``party`` and ``enemies`` are each one combatant or a list of them. Every
+    step resolves a whole turn in one pass: the party swings first, then the
+    surviving enemies act in an initiative order rolled when the encounter
+    starts, then statuses tick and the dead are counted. Bosses act one by
+    one; the regular hits on each party member are drawn as one volley from
+    a precomputed table (see ``volley``), so a horde's turn costs about what
+    a duel's does. Both sides are only recounted when someone falls to the
+    engine, so fighters should be hurt through step rather than directly.
+
+    Rewards for each enemy slain go to the party's lead, ``player``. The
+    engine only changes the models and returns CombatEvents; it never renders
+    anything, so fights can run headless for tests, batches and benchmarks.
+    """
+
+    ACTIONS = ("attack", "flee")
+
+    def __init__(self, party, enemies, rng=None):
+        self.party = _as_list(party)
+        self.enemies = _as_list(enemies)
+        self.rng = rng or random
+        self.initiative = list(self.enemies)  # enemy turn order for the whole encounter
+        self.rng.shuffle(self.initiative)
+        self.fighting = self.living_party()  # party members still on their feet
+        self.standing = []  # enemies still up, in initiative order
+        self._bosses = []
+        self._regulars = []
+        self._muster()
+        self.turn = 0
+        self.events = Journal(COMBAT_LOG_CAPACITY)  # the latest events, for the combat log
+        self.outcome = None  # "victory", "defeat" or "fled" once the fight is over
+        self.gold_won = 0
+        self.xp_won = 0
+
+    @property
+    def player(self):
+        """The party's lead, who picks the actions and collects the rewards"""
+        return self.party[0]
+
+    @property
+    def enemy(self):
+        """The first enemy, the whole opposition in a duel"""
+        return self.enemies[0]
+
+    @property
+    def over(self):
+        return self.outcome is not None
+
+    def living_enemies(self):
+        return [enemy for enemy in self.enemies if enemy.hp > 0]
+
+    def living_party(self):
+        return [member for member in self.party if member.hp > 0]
+
+    def _muster(self):
+        """Recount the standing enemies, split into bosses and regulars; returns those who fell"""
+        fallen = [enemy for enemy in self.standing if enemy.hp <= 0]
+        self.standing = [enemy for enemy in self.initiative if enemy.hp > 0]
+        self._bosses = [enemy for enemy in self.standing if enemy.is_boss]
+        self._regulars = [enemy for enemy in self.standing if not enemy.is_boss]
+        return fallen
+
+    def step(self, action, target=None):
+        """Resolve one turn with the lead's action and return the events it produced.
+
+        ``target`` is the enemy the party attacks; by default the first standing in initiative order.
+        """
+        if action not in self.ACTIONS:
+            raise ValueError(f"unknown combat action {action!r}")
+        if self.over:
+            return []
+        party = self.fighting
+        if not self.standing or not party:
+            # Nothing left to fight; end quietly
+            self.outcome = "victory" if party else "defeat"
+            return []
+
+        if action == "flee":
+            events = [CombatEvent("fled", actor=self.player.name)]
+            self.outcome = "fled"
+        else:
+            events = self._turn(party, target)
+        self.events.extend(events)
+        return events
+
+    def _turn(self, party, target):
+        rng = self.rng
+        events = []
+        fallen = []
+
+        # The party swings first, all at the chosen target while it stands
+        for member in party:
+            if target is None or target.hp <= 0:
+                if not self.standing:
+                    break  # the party has cut down everyone
+                target = self.standing[0]
+            damage, critical = roll_player_damage(member, rng)
+            target.hp -= damage
+            events.append(CombatEvent("attack", actor=member.name, target=target.name, amount=damage,
+                                      hp=target.hp if target.hp > 0 else 0, critical=critical))
+            if target.hp <= 0:
+                fallen += self._muster()
+
+        if self.standing:
+            self._enemy_phase(party, events)
+
+            # Ongoing damage from statuses on both sides; timed effects on the enemies still up run down a turn
+            for member in party:
+                text = member.apply_status_damage()
+                if text:
+                    events.append(CombatEvent("status", target=member.name, text=text))
+            burned = False
+            for enemy in self.standing:
+                if enemy.status_effects.version:  # a store that has never changed is empty
+                    text = enemy.process_status_effects()
+                    if text:
+                        events.append(CombatEvent("status", target=enemy.name, text=text))
+                    if enemy.hp <= 0:
+                        burned = True
+                    else:
+                        expired = enemy.status_effects.tick()
+                        if expired:
+                            events.extend(_wore_off(enemy, expired))
+            if burned:
+                fallen += self._muster()
+
+        # Timed effects on the party run down a turn, the winning turn included
+        down = False
+        for member in party:
+            if member.hp > 0:
+                expired = member.status_effects.tick()
+                if expired:
+                    events.extend(_wore_off(member, expired))
+            else:
+                down = True
+
+        self.turn += 1
+        for enemy in fallen:
+            events.extend(self._reward(enemy))
+        if not self.standing:
+            events.append(self._victory())
+        elif down:
+            self.fighting = self.living_party()
+            if not self.fighting:
+                events.extend(self._defeat())
+        return events
+
+    def _enemy_phase(self, party, events):
+        """Every standing enemy's move: boss specials one by one, then each party member's volley"""
+        rng = self.rng
+        targets = party  # all standing: nothing has hit them yet this turn
+        bosses = []
+        for enemy in self._bosses:
+            if rng.random() < BOSS_SPECIAL_CHANCE:
+                target = targets[0] if len(targets) == 1 else rng.choice(targets)
+                text = enemy.special_attack(target, rng)
+                if text:
+                    events.append(CombatEvent("special", actor=enemy.name, target=target.name, text=text,
+                                              hp=max(0, target.hp)))
+            else:
+                bosses.append(enemy)
+
+        if len(targets) == 1:
+            if self._regulars or bosses:
+                self._volley(events, targets[0], self._regulars, bosses)
+            return
+        by_target = {}
+        hitters = self._regulars + bosses
+        for enemy, target in zip(hitters, rng.choices(targets, k=len(hitters))):
+            _, regulars, heavies = by_target.setdefault(id(target), (target, [], []))
+            (heavies if enemy.is_boss else regulars).append(enemy)
+        for target, regulars, heavies in by_target.values():
+            self._volley(events, target, regulars, heavies)
+
+    def _volley(self, events, target, regulars, bosses):
+        """One party member takes every regular blow aimed at them in one draw, plus each boss's hit"""
+        rng = self.rng
+        rating = armor_rating(target) if target.armor else 0
+        damage = absorbed = 0
+        if regulars:
+            outcomes, bounds = volley(len(regulars), rating)
+            damage, absorbed = outcomes[bisect_right(bounds, rng.random())]
+        for _ in bosses:
+            hit = rng.choice(ENEMY_DAMAGE_FACES) * BOSS_DAMAGE_MULTIPLIER
+            soak = min(hit * ARMOR_ABSORB, rating)
+            damage += max(1, hit - soak)
+            absorbed += soak
+
+        hits = len(regulars) + len(bosses)
+        if target.armor:
+            events.append(CombatEvent("armor", actor=target.name, amount=absorbed, hits=hits))
+        target.hp -= damage
+        attacker = (regulars or bosses)[0].name if hits == 1 else None
+        events.append(CombatEvent("enemy_attack", actor=attacker, target=target.name, amount=damage, hits=hits,
+                                  hp=target.hp if target.hp > 0 else 0))
+
+    def _reward(self, enemy):
+        """Pay the lead for one slain enemy, completing its quest if it is a boss"""
+        player, rng = self.player, self.rng
+        events = []
+        gold = enemy.loot_gold + rng.randint(*GOLD_BONUS_ROLL)
+        xp = enemy.xp_reward + rng.randint(*XP_BONUS_ROLL)
+        if enemy.is_boss:
+            gold *= BOSS_REWARD_MULTIPLIER
+            xp *= BOSS_REWARD_MULTIPLIER
+            quest = BOSS_QUESTS.get(enemy.name)
+            if quest:
+                key, secret, title = quest
+                player.quests[key] = True
+                events.append(CombatEvent("quest", actor=enemy.name, text=title, secret=secret))
+
+        player.gold += gold
+        self.gold_won += gold
+        self.xp_won += xp
+        level_up = player.gain_xp(xp)
+        events.append(CombatEvent("slain", actor=player.name, target=enemy.name, gold=gold, xp=xp, text=level_up))
+        return events
+
+    def _victory(self):
+        for member in self.party:
+            member.status_effects.remove(*COMBAT_STATUSES)
+        self.outcome = "victory"
+        defeated = self.enemy.name if len(self.enemies) == 1 else f"{len(self.enemies)} foes"
+        return CombatEvent("victory", actor=self.player.name, target=defeated, gold=self.gold_won, xp=self.xp_won)
+
+    def _defeat(self):
+        events = []
+        for member in self.party:
+            lost_gold = member.gold // 2
+            member.gold -= lost_gold
+            member.hp = member.level * 50  # back on their feet with some HP
+            member.status_effects.clear()
+            events.append(CombatEvent("defeat", target=member.name, gold=lost_gold))
+        self.outcome = "defeat"
+        return events
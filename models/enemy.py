@@ -1,8 +1,9 @@
 from models.npc import NPC
-from models.item import Item
 import random
 
 class Enemy(NPC):
+    __slots__ = ("level", "defense", "drops", "max_hp")
+
     def __init__(self, name, level=1, hp=10, attack=2, defense=1, xp_value=10, gold_value=5, drops=None):
         super().__init__(name=name, hp=hp + (level - 1) * 5, 
                         attack_power=attack + (level - 1) * 2,
@@ -22,46 +23,14 @@ class Enemy(NPC):
         self.hp = max(0, self.hp - actual_damage)
         return actual_damage
     
-    def calculate_damage(self):
+    def calculate_damage(self, rng=None):
         # Basic damage calculation with some randomness
-        base_damage = self.attack
-        variation = random.randint(-2, 2)
+        base_damage = self.attack_power
+        variation = (rng or random).randint(-2, 2)
         return max(1, base_damage + variation)
     
     @classmethod
-    def create_random_enemy(cls, player_level):
+    def create_random_enemy(cls, player_level, rng=None):
         """Create a random enemy appropriate for the player's level"""
-        enemy_types = [
-            ("Goblin", 8, 2, 1, 8, 4),
-            ("Orc", 12, 3, 2, 12, 6),
-            ("Troll", 15, 4, 2, 15, 8),
-            ("Dragon", 20, 5, 3, 20, 10),
-            ("Ghost", 10, 3, 1, 10, 5),
-            ("Skeleton", 8, 2, 1, 8, 4),
-            ("Zombie", 12, 2, 2, 10, 5),
-            ("Witch", 8, 4, 1, 12, 6),
-            ("Demon", 15, 4, 2, 15, 8),
-            ("Giant Spider", 10, 3, 1, 10, 5)
-        ]
-        
-        # Select random enemy type
-        name, base_hp, base_attack, base_defense, base_xp, base_gold = random.choice(enemy_types)
-        
-        # Scale level based on player level
-        level = max(1, player_level + random.randint(-2, 2))
-        
-        # Create drops list
-        drops = []
-        if random.random() < 0.3:  # 30% chance to drop an item
-            drops.append(Item.create_random_item(level))
-        
-        return cls(
-            name=name,
-            level=level,
-            hp=base_hp,
-            attack=base_attack,
-            defense=base_defense,
-            xp_value=base_xp,
-            gold_value=base_gold,
-            drops=drops
-        ) 
\ No newline at end of file
+        from models.enemy_archetypes import ENEMY_ARCHETYPES
+        return ENEMY_ARCHETYPES.spawn(player_level, rng)
@@ -0,0 +1,144 @@
+# models/enemy_archetypes.py
+
+import random
+
+from models.enemy import Enemy
+from models.item_templates import ITEM_TEMPLATES
+from models.status_effects import EffectStore
+
+# Levels whose stats are computed when an archetype is registered; higher levels are filled in on first use
+DEFAULT_LEVEL_CAP = 50
+
+DROP_CHANCE = 0.3  # chance a spawned enemy carries a random item
+
+
+class EnemyArchetype:
+    """A kind of enemy and its stats at every level.
+
+    Stats follow the same per-level curves as Enemy.__init__ (+5 hp, +2
+    attack, +1 defense per level, gold and xp scaling with level), but are
+    worked out once into a table of (hp, attack, defense, xp, gold) rows.
+    """
+
+    __slots__ = ("name", "base_hp", "base_attack", "base_defense", "base_xp", "base_gold", "_levels")
+
+    def __init__(self, name, hp, attack, defense, xp, gold, level_cap=DEFAULT_LEVEL_CAP):
+        self.name = name
+        self.base_hp = hp
+        self.base_attack = attack
+        self.base_defense = defense
+        self.base_xp = xp
+        self.base_gold = gold
+        self._levels = [None]  # level -> stats row; index 0 unused
+        self._extend(level_cap)
+
+    def _row(self, level):
+        return (self.base_hp + (level - 1) * 5,
+                self.base_attack + (level - 1) * 2,
+                self.base_defense + (level - 1),
+                self.base_xp * level,
+                self.base_gold * level)
+
+    def _extend(self, level):
+        for lvl in range(len(self._levels), level + 1):
+            self._levels.append(self._row(lvl))
+
+    def stats(self, level):
+        """(hp, attack, defense, xp, gold) at a level"""
+        if level >= len(self._levels):
+            self._extend(level)
+        return self._levels[level]
+
+    def create(self, level=1, drops=None):
+        return ArchetypeEnemy(self, level, drops)
+
+    def __repr__(self):
+        return f"EnemyArchetype({self.name!r})"
+
+
+class ArchetypeEnemy(Enemy):
+    """An Enemy spawned from an EnemyArchetype, its stats read from the level table."""
+
+    __slots__ = ("archetype",)
+
+    def __init__(self, archetype, level=1, drops=None):
+        hp, attack, defense, xp, gold = archetype.stats(level)
+        self.archetype = archetype
+        self.name = archetype.name
+        self.hp = hp
+        self.max_hp = hp
+        self.attack_power = attack
+        self.defense = defense
+        self.xp_reward = xp
+        self.loot_gold = gold
+        self.level = level
+        self.is_boss = False
+        self.drops = drops if drops else []
+        self.status_effects = EffectStore()
+
+
+class EnemyArchetypeRegistry:
+    """Enemy archetypes by name, used to spawn random enemies around a player's level."""
+
+    def __init__(self, archetypes=(), level_cap=DEFAULT_LEVEL_CAP):
+        self.level_cap = level_cap
+        self._archetypes = {}  # name -> EnemyArchetype
+        self._pool = []  # archetypes in registration order, for random picks
+        for archetype in archetypes:
+            self.register(archetype)
+
+    def register(self, archetype):
+        if archetype.name in self._archetypes:
+            raise ValueError(f"duplicate enemy archetype {archetype.name!r}")
+        archetype._extend(self.level_cap)
+        self._archetypes[archetype.name] = archetype
+        self._pool.append(archetype)
+        return archetype
+
+    def get(self, name):
+        return self._archetypes[name]
+
+    def __contains__(self, name):
+        return name in self._archetypes
+
+    def __iter__(self):
+        return iter(self._pool)
+
+    def __len__(self):
+        return len(self._pool)
+
+    def spawn(self, player_level, rng=None):
+        """One random enemy within two levels of the player"""
+        rng = rng or random
+        archetype = rng.choice(self._pool)
+        level = max(1, player_level + rng.randint(-2, 2))
+        drops = [ITEM_TEMPLATES.roll(level, rng)] if rng.random() < DROP_CHANCE else None
+        return ArchetypeEnemy(archetype, level, drops)
+
+    def spawn_many(self, player_level, n, rng=None):
+        """n random enemies, e.g. a whole dungeon floor, in one call"""
+        rng = rng or random
+        choice, randint, chance = rng.choice, rng.randint, rng.random
+        pool, roll = self._pool, ITEM_TEMPLATES.roll
+        enemies = []
+        for _ in range(n):
+            archetype = choice(pool)
+            level = max(1, player_level + randint(-2, 2))
+            drops = [roll(level, rng)] if chance() < DROP_CHANCE else None
+            enemies.append(ArchetypeEnemy(archetype, level, drops))
+        return enemies
+
+
+# Enemies that create_random_enemy can spawn
+ENEMY_ARCHETYPES = EnemyArchetypeRegistry([
+    EnemyArchetype("Goblin", 8, 2, 1, 8, 4),
+    EnemyArchetype("Orc", 12, 3, 2, 12, 6),
+    EnemyArchetype("Troll", 15, 4, 2, 15, 8),
+    EnemyArchetype("Dragon", 20, 5, 3, 20, 10),
+    EnemyArchetype("Ghost", 10, 3, 1, 10, 5),
+    EnemyArchetype("Skeleton", 8, 2, 1, 8, 4),
+    EnemyArchetype("Zombie", 12, 2, 2, 10, 5),
+    EnemyArchetype("Witch", 8, 4, 1, 12, 6),
+    EnemyArchetype("Demon", 15, 4, 2, 15, 8),
+    EnemyArchetype("Giant Spider", 10, 3, 1, 10, 5),
+])
@@ -0,0 +1,233 @@
+# models/inventory.py
+
+from models.name_index import fold
+
+
+def stack_key(item):
+    """Items with the same key are interchangeable and share a stack"""
+    return (item.name, item.item_type, item.rarity, item.value,
+            tuple(sorted(item.effects.items())))
+
+
+class ItemStack:
+    """Identical items held together; one inventory slot however many there are."""
+
+    __slots__ = ("key", "items")
+
+    def __init__(self, key):
+        self.key = key
+        self.items = []
+
+    @property
+    def item(self):
+        """The item a Use/Sell/Drop on this stack acts on (the newest one)"""
+        return self.items[-1]
+
+    @property
+    def count(self):
+        return len(self.items)
+
+    @property
+    def name(self):
+        return self.items[-1].name
+
+    def __repr__(self):
+        return f"ItemStack({self.name!r} x{self.count})"
+
+
+class Inventory:
+    """A player's items, stacked, with indexes by name, item_type and rarity.
+
+    Iterating, ``len``, ``in``, ``append``/``remove`` and ``find`` behave as
+    on the plain item list this replaces, so existing callers keep working.
+    Identical items (same ``stack_key``) share an ItemStack, and inventory
+    capacity is counted in stacks (``slots``), not items. Lookups by name,
+    type or rarity, and membership tests, are dict lookups; displays should
+    iterate ``stacks()`` so 500 potions render as one row.
+    """
+
+    def __init__(self, items=(), on_change=None):
+        self.on_change = on_change  # called after every change
+        self.version = 0  # bumped on every change
+        self._stacks = {}  # stack key -> ItemStack, in the order first added
+        self._by_name = {}  # folded name -> {stack key: ItemStack}
+        self._by_type = {}  # item_type -> {stack key: ItemStack}
+        self._by_rarity = {}  # rarity -> {stack key: ItemStack}
+        self._where = {}  # id(item) -> ItemStack holding it
+        self._count = 0
+        if items:
+            self.add_many(items)
+
+    def _changed(self):
+        self.version += 1
+        if self.on_change:
+            self.on_change()
+
+    # Adding and removing
+
+    def _put(self, item):
+        key = stack_key(item)
+        stack = self._stacks.get(key)
+        if stack is None:
+            stack = self._stacks[key] = ItemStack(key)
+            self._by_name.setdefault(fold(item.name), {})[key] = stack
+            self._by_type.setdefault(item.item_type, {})[key] = stack
+            self._by_rarity.setdefault(item.rarity, {})[key] = stack
+        stack.items.append(item)
+        self._where[id(item)] = stack
+        self._count += 1
+
+    def _take(self, stack, item):
+        items = stack.items
+        for i in range(len(items) - 1, -1, -1):
+            if items[i] is item:
+                del items[i]
+                break
+        else:
+            raise ValueError(f"{item.name!r} is not in the inventory")
+        self._count -= 1
+        if not any(other is item for other in items):
+            del self._where[id(item)]
+        if not items:
+            self._drop_stack(stack)
+
+    def _drop_stack(self, stack):
+        key = stack.key
+        item_name, item_type, rarity = key[0], key[1], key[2]
+        del self._stacks[key]
+        for index, value in ((self._by_name, fold(item_name)), (self._by_type, item_type),
+                             (self._by_rarity, rarity)):
+            bucket = index[value]
+            del bucket[key]
+            if not bucket:
+                del index[value]
+
+    def append(self, item):
+        self._put(item)
+        self._changed()
+
+    add = append
+
+    def add_many(self, items):
+        """Add several items with a single change notification"""
+        added = False
+        for item in items:
+            self._put(item)
+            added = True
+        if added:
+            self._changed()
+
+    extend = add_many
+
+    def __iadd__(self, items):
+        self.add_many(items)
+        return self
+
+    def remove(self, item):
+        """Remove this exact item; ValueError if it is not held"""
+        stack = self._where.get(id(item))
+        if stack is None:
+            raise ValueError(f"{item.name!r} is not in the inventory")
+        self._take(stack, item)
+        self._changed()
+
+    def remove_many(self, items):
+        """Remove several items with a single change notification"""
+        removed = False
+        for item in items:
+            stack = self._where.get(id(item))
+            if stack is None:
+                raise ValueError(f"{item.name!r} is not in the inventory")
+            self._take(stack, item)
+            removed = True
+        if removed:
+            self._changed()
+
+    def take(self, name, count=1):
+        """Remove and return up to `count` items with this name (any case)"""
+        taken = []
+        for stack in list(self._by_name.get(fold(name), {}).values()):
+            while stack.items and len(taken) < count:
+                item = stack.items[-1]
+                self._take(stack, item)
+                taken.append(item)
+            if len(taken) == count:
+                break
+        if taken:
+            self._changed()
+        return taken
+
+    def pop(self):
+        """Remove and return the most recently stacked item"""
+        if not self._stacks:
+            raise IndexError("pop from empty inventory")
+        stack = next(reversed(self._stacks.values()))
+        item = stack.item
+        self._take(stack, item)
+        self._changed()
+        return item
+
+    def clear(self):
+        if self._stacks:
+            self._stacks.clear()
+            self._by_name.clear()
+            self._by_type.clear()
+            self._by_rarity.clear()
+            self._where.clear()
+            self._count = 0
+            self._changed()
+
+    # Lookups
+
+    def find(self, name):
+        """Return an item with this name (any case), or None"""
+        bucket = self._by_name.get(fold(name))
+        if not bucket:
+            return None
+        return next(iter(bucket.values())).item
+
+    def find_all(self, name):
+        """Return every item with this name (any case)"""
+        return [item for stack in self._by_name.get(fold(name), {}).values() for item in stack.items]
+
+    def count_named(self, name):
+        return sum(stack.count for stack in self._by_name.get(fold(name), {}).values())
+
+    def by_type(self, item_type):
+        """Stacks of the given item_type ("weapon", "consumable", ...)"""
+        return list(self._by_type.get(item_type, {}).values())
+
+    def by_rarity(self, rarity):
+        """Stacks of the given rarity"""
+        return list(self._by_rarity.get(rarity, {}).values())
+
+    def stacks(self):
+        """Every stack, in the order each was first added"""
+        return list(self._stacks.values())
+
+    @property
+    def slots(self):
+        """Inventory slots in use: one per stack"""
+        return len(self._stacks)
+
+    def fits(self, item, capacity):
+        """Whether adding this item keeps the inventory within `capacity` slots"""
+        return stack_key(item) in self._stacks or len(self._stacks) < capacity
+
+    def copy(self):
+        return Inventory(self)
+
+    def __contains__(self, item):
+        return id(item) in self._where
+
+    def __iter__(self):
+        return iter([item for stack in self._stacks.values() for item in stack.items])
+
+    def __len__(self):
+        return self._count
+
+    def __bool__(self):
+        return self._count > 0
+
+    def __repr__(self):
+        return f"Inventory({self.stacks()!r})"
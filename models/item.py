@@ -1,4 +1,6 @@
 class Item:
+    __slots__ = ("name", "description", "item_type", "value", "combat_usable", "effects", "rarity")
+
     def __init__(self, name, description, item_type="misc", value=0, combat_usable=False, effects=None, rarity="common"):
         self.name = name
         self.description = description
@@ -38,52 +40,18 @@ class Item:
         return f"You used {self.name}!"
     
     @classmethod
-    def create_random_item(cls, level):
+    def create_random_item(cls, level, rng=None):
         """Create a random item appropriate for the given level"""
         import random
-        
-        item_types = {
-            "weapon": [
-                ("Rusty Sword", "A worn but serviceable blade", 5, {"damage": 3}),
-                ("Steel Sword", "A reliable weapon", 10, {"damage": 5}),
-                ("Magic Sword", "Glows with mysterious energy", 20, {"damage": 8}),
-            ],
-            "armor": [
-                ("Leather Armor", "Basic protection", 5, {"defense": 2}),
-                ("Chain Mail", "Solid metal protection", 15, {"defense": 4}),
-                ("Plate Armor", "Heavy but effective", 25, {"defense": 6}),
-            ],
-            "consumable": [
-                ("Health Potion", "Restores HP", 5, {"heal": 20}, True),
-                ("Strength Potion", "Temporarily boosts attack", 8, {"temp_attack": 3}, True),
-                ("Defense Potion", "Temporarily boosts defense", 8, {"temp_defense": 3}, True),
-            ]
-        }
-        
-        # Select random item type and item
-        item_type = random.choice(list(item_types.keys()))
-        base_item = random.choice(item_types[item_type])
-        
-        # Scale effects based on level
-        effects = base_item[3].copy()
-        for key in effects:
-            effects[key] = int(effects[key] * (1 + (level - 1) * 0.2))
-        
-        combat_usable = len(base_item) > 4 and base_item[4]
-        
-        return cls(
-            name=base_item[0],
-            description=base_item[1],
-            item_type=item_type,
-            value=base_item[2] * level,
-            combat_usable=combat_usable,
-            effects=effects
-        )
+        from models.item_templates import ITEM_TEMPLATES
+        return ITEM_TEMPLATES.roll(level, rng or random)
 
     def describe(self):
         return f"{self.name}: {self.description}"
 
 class ScrollOfRevelation(Item):
+    __slots__ = ()
+
     def __init__(self):
         description = "A weathered scroll inscribed with ancient runes."
         super().__init__(
@@ -0,0 +1,212 @@
+# models/item_templates.py
+
+from collections.abc import MutableMapping
+from types import MappingProxyType
+
+from models.item import Item
+
+# Levels whose scaled stats are computed up front; higher levels are filled in on first use
+MAX_PRECOMPUTED_LEVEL = 50
+
+
+def scale_effects(effects, level):
+    """Effect values grow 20% per level above the first"""
+    factor = 1 + (level - 1) * 0.2
+    return {key: int(value * factor) for key, value in effects.items()}
+
+
+class ItemTemplate:
+    """The immutable part of an item kind, shared by every item rolled from it.
+
+    Holds the name, description and base effects once, plus a per-level table
+    of (value, effects) so rolling an item is a list index rather than a
+    rebuild and rescale of its effects. Scaled effects are read-only views
+    shared by every item of that template and level.
+    """
+
+    __slots__ = ("key", "name", "description", "item_type", "base_value", "combat_usable",
+                 "base_effects", "rarity", "_levels")
+
+    def __init__(self, name, description, item_type, base_value, effects, combat_usable=False, rarity="common"):
+        self.key = name
+        self.name = name
+        self.description = description
+        self.item_type = item_type
+        self.base_value = base_value
+        self.combat_usable = combat_usable
+        self.base_effects = MappingProxyType(dict(effects))
+        self.rarity = rarity
+        self._levels = [None]  # level -> (value, effects); index 0 unused
+        self._extend(MAX_PRECOMPUTED_LEVEL)
+
+    def _extend(self, level):
+        for lvl in range(len(self._levels), level + 1):
+            self._levels.append((self.base_value * lvl, MappingProxyType(scale_effects(self.base_effects, lvl))))
+
+    def stats(self, level):
+        """(value, effects) for an item of this template at a level"""
+        if level < 1:
+            return self.base_value * level, MappingProxyType(scale_effects(self.base_effects, level))
+        if level >= len(self._levels):
+            self._extend(level)
+        return self._levels[level]
+
+    def create(self, level=1):
+        return TemplatedItem(self, level)
+
+    def __copy__(self):
+        return self  # immutable and shared by design
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # Rebuilt from its definition; the per-level table of read-only views can't be pickled
+        return ItemTemplate, (self.name, self.description, self.item_type, self.base_value, dict(self.base_effects),
+                              self.combat_usable, self.rarity)
+
+    def __repr__(self):
+        return f"ItemTemplate({self.key!r})"
+
+
+class CopyOnWriteDict(MutableMapping):
+    """A dict that reads from a shared mapping until it is first changed.
+
+    Until then every read goes straight to ``shared``, which may be read-only
+    (a MappingProxyType). The first write copies it into a dict of its own
+    and everything after that works on the copy; ``shared`` itself is never
+    modified.
+    """
+
+    __slots__ = ("_shared", "_own")
+
+    def __init__(self, shared, own=None):
+        self._shared = shared
+        self._own = own
+
+    @property
+    def copied(self):
+        """Whether this dict has its own entries yet"""
+        return self._own is not None
+
+    def _write(self):
+        if self._own is None:
+            self._own = dict(self._shared)
+        return self._own
+
+    def __getitem__(self, key):
+        own = self._own
+        return (self._shared if own is None else own)[key]
+
+    def get(self, key, default=None):
+        own = self._own
+        return (self._shared if own is None else own).get(key, default)
+
+    def __contains__(self, key):
+        own = self._own
+        return key in (self._shared if own is None else own)
+
+    def __iter__(self):
+        own = self._own
+        return iter(self._shared if own is None else own)
+
+    def __len__(self):
+        own = self._own
+        return len(self._shared if own is None else own)
+
+    def __setitem__(self, key, value):
+        self._write()[key] = value
+
+    def __delitem__(self, key):
+        del self._write()[key]
+
+    def __reduce__(self):
+        return CopyOnWriteDict, (dict(self._shared), self._own)
+
+    def __repr__(self):
+        return f"CopyOnWriteDict({dict(self)!r})"
+
+
+class TemplatedItem(Item):
+    """An Item rolled from an ItemTemplate; only the template and level are its own.
+
+    ``effects`` reads the template's shared table for the level until the
+    item changes one of them, which gives the item a copy of its own.
+    """
+
+    __slots__ = ("template", "level")
+
+    def __init__(self, template, level=1):
+        # Every field points at the template's shared objects, nothing is copied
+        self.template = template
+        self.level = level
+        self.name = template.name
+        self.description = template.description
+        self.item_type = template.item_type
+        self.value, effects = template.stats(level)
+        self.effects = CopyOnWriteDict(effects)
+        self.combat_usable = template.combat_usable
+        self.rarity = template.rarity
+
+
+class ItemTemplateRegistry:
+    """Item templates by key and by item_type, used to roll random loot."""
+
+    def __init__(self, templates=()):
+        self._templates = {}  # key -> ItemTemplate
+        self._by_type = {}  # item_type -> [ItemTemplate]
+        self._types = []  # item types in registration order, for random rolls
+        for template in templates:
+            self.register(template)
+
+    def register(self, template):
+        if template.key in self._templates:
+            raise ValueError(f"duplicate item template {template.key!r}")
+        self._templates[template.key] = template
+        if template.item_type not in self._by_type:
+            self._by_type[template.item_type] = []
+            self._types.append(template.item_type)
+        self._by_type[template.item_type].append(template)
+        return template
+
+    def get(self, key):
+        return self._templates[key]
+
+    def by_type(self, item_type):
+        return list(self._by_type.get(item_type, ()))
+
+    def __contains__(self, key):
+        return key in self._templates
+
+    def __iter__(self):
+        return iter(self._templates.values())
+
+    def __len__(self):
+        return len(self._templates)
+
+    def create(self, key, level=1):
+        return TemplatedItem(self._templates[key], level)
+
+    def roll(self, level, rng):
+        """A random item for a level: an item type first, then a template of that type"""
+        templates = self._by_type[rng.choice(self._types)]
+        return TemplatedItem(rng.choice(templates), level)
+
+    def roll_many(self, level, count, rng):
+        types, by_type = self._types, self._by_type
+        choice = rng.choice
+        return [TemplatedItem(choice(by_type[choice(types)]), level) for _ in range(count)]
+
+
+# Loot that create_random_item can roll
+ITEM_TEMPLATES = ItemTemplateRegistry([
+    ItemTemplate("Rusty Sword", "A worn but serviceable blade", "weapon", 5, {"damage": 3}),
+    ItemTemplate("Steel Sword", "A reliable weapon", "weapon", 10, {"damage": 5}),
+    ItemTemplate("Magic Sword", "Glows with mysterious energy", "weapon", 20, {"damage": 8}),
+    ItemTemplate("Leather Armor", "Basic protection", "armor", 5, {"defense": 2}),
+    ItemTemplate("Chain Mail", "Solid metal protection", "armor", 15, {"defense": 4}),
+    ItemTemplate("Plate Armor", "Heavy but effective", "armor", 25, {"defense": 6}),
+    ItemTemplate("Health Potion", "Restores HP", "consumable", 5, {"heal": 20}, combat_usable=True),
+    ItemTemplate("Strength Potion", "Temporarily boosts attack", "consumable", 8, {"temp_attack": 3}, combat_usable=True),
+    ItemTemplate("Defense Potion", "Temporarily boosts defense", "consumable", 8, {"temp_defense": 3}, combat_usable=True),
+])
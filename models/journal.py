@@ -0,0 +1,94 @@
+# models/journal.py
+
+MESSAGE_LOG_CAPACITY = 50  # messages kept in the game's message log
+COMBAT_LOG_CAPACITY = 200  # events kept in one fight's combat log
+
+ENTRY_KINDS = ("info", "damage", "heal", "loot", "level_up", "quest")
+
+
+class JournalEntry:
+    """One typed line of the message log, e.g. a "loot" pickup or a "level_up"."""
+
+    __slots__ = ("kind", "text", "amount")
+
+    def __init__(self, kind, text, amount=0):
+        if kind not in ENTRY_KINDS:
+            raise ValueError(f"unknown journal entry kind {kind!r}")
+        self.kind = kind
+        self.text = text
+        self.amount = amount  # HP, gold or XP involved, 0 if none
+
+    def __repr__(self):
+        return f"JournalEntry({self.kind!r}, {self.text!r})"
+
+
+class Journal:
+    """A bounded log that numbers everything written to it.
+
+    Entries live in a fixed-size ring: once ``capacity`` is reached each new
+    entry overwrites the oldest, so appending never copies or trims a list.
+    Sequence numbers keep counting up across overwrites, so a reader can ask
+    for everything after the last number it saw (``since``) or for one page
+    of the retained entries (``page``) without walking the whole log.
+    """
+
+    __slots__ = ("capacity", "next_seq", "_ring")
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("a journal needs room for at least one entry")
+        self.capacity = capacity
+        self.next_seq = 0  # sequence number the next entry will get
+        self._ring = [None] * capacity
+
+    @property
+    def first_seq(self):
+        """Sequence number of the oldest entry still retained"""
+        return max(0, self.next_seq - self.capacity)
+
+    def append(self, entry):
+        """Add an entry and return its sequence number"""
+        seq = self.next_seq
+        self._ring[seq % self.capacity] = entry
+        self.next_seq = seq + 1
+        return seq
+
+    def extend(self, entries):
+        ring, capacity, seq = self._ring, self.capacity, self.next_seq
+        for entry in entries:
+            ring[seq % capacity] = entry
+            seq += 1
+        self.next_seq = seq
+
+    def get(self, seq):
+        if not self.first_seq <= seq < self.next_seq:
+            raise IndexError(f"journal entry {seq} is not retained")
+        return self._ring[seq % self.capacity]
+
+    def entries(self, start, stop):
+        """(seq, entry) pairs for retained sequence numbers in [start, stop)"""
+        start, stop = max(start, self.first_seq), min(stop, self.next_seq)
+        ring, capacity = self._ring, self.capacity
+        return [(seq, ring[seq % capacity]) for seq in range(start, stop)]
+
+    def since(self, seq):
+        """Everything written after sequence number `seq`, oldest first"""
+        return self.entries(seq + 1, self.next_seq)
+
+    def latest(self, count):
+        """The newest `count` entries, oldest first"""
+        return self.entries(self.next_seq - count, self.next_seq)
+
+    def page(self, number, size):
+        """Page `number` of the retained entries, counting back from 0 = newest; oldest first within a page"""
+        stop = self.next_seq - number * size
+        return self.entries(stop - size, stop)
+
+    def page_count(self, size):
+        return -(-len(self) // size)
+
+    def __len__(self):
+        return self.next_seq - self.first_seq
+
+    def __iter__(self):
+        return (entry for _, entry in self.entries(self.first_seq, self.next_seq))
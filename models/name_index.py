@@ -0,0 +1,224 @@
+# models/name_index.py
+
+
+def fold(name):
+    """Normalise a name for case-insensitive lookups"""
+    return name.casefold()
+
+
+class NameIndexedList(list):
+    """A list of named things (items, NPCs) with a case-folded name index.
+
+    Behaves like a plain list for iteration, membership, slicing and every
+    mutating method, while keeping ``{folded name: [entries]}`` in sync so
+    ``find(name)`` is a dict lookup instead of a scan over the list.
+    """
+
+    def __init__(self, entries=(), on_change=None):
+        super().__init__(entries)
+        self.on_change = on_change  # called after every mutation
+        self._reindex()
+
+    def _reindex(self):
+        self._index = {}
+        for entry in self:
+            self._index.setdefault(fold(entry.name), []).append(entry)
+        if self.on_change:
+            self.on_change()
+
+    def _add(self, entry):
+        self._index.setdefault(fold(entry.name), []).append(entry)
+        if self.on_change:
+            self.on_change()
+
+    def _discard(self, entry):
+        if self.on_change:
+            self.on_change()
+        key = fold(entry.name)
+        bucket = self._index.get(key)
+        if bucket:
+            for i, other in enumerate(bucket):
+                if other is entry:
+                    del bucket[i]
+                    break
+            if not bucket:
+                del self._index[key]
+
+    def find(self, name):
+        """Return the first entry with this name (any case), or None"""
+        bucket = self._index.get(fold(name))
+        return bucket[0] if bucket else None
+
+    def find_all(self, name):
+        """Return every entry with this name (any case)"""
+        return list(self._index.get(fold(name), ()))
+
+    def count_named(self, name):
+        return len(self._index.get(fold(name), ()))
+
+    def append(self, entry):
+        super().append(entry)
+        self._add(entry)
+
+    def extend(self, entries):
+        entries = list(entries)
+        super().extend(entries)
+        for entry in entries:
+            self._add(entry)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def insert(self, position, entry):
+        super().insert(position, entry)
+        self._add(entry)
+
+    def remove(self, entry):
+        super().remove(entry)
+        self._discard(entry)
+
+    def pop(self, position=-1):
+        entry = super().pop(position)
+        self._discard(entry)
+        return entry
+
+    def clear(self):
+        super().clear()
+        self._index = {}
+        if self.on_change:
+            self.on_change()
+
+    def __setitem__(self, position, value):
+        super().__setitem__(position, value)
+        self._reindex()
+
+    def __delitem__(self, position):
+        if isinstance(position, slice):
+            super().__delitem__(position)
+            self._reindex()
+        else:
+            entry = self[position]
+            super().__delitem__(position)
+            self._discard(entry)
+
+    def copy(self):
+        return NameIndexedList(self)
+
+    def __reduce__(self):
+        # Rebuild through __init__: list's own pickling extends the new object before _index exists
+        return type(self), (list(self), self.on_change)
+
+
+_EMPTY = NameIndexedList()  # shared by every CopyOnWriteList with nothing to share; never changed
+
+
+class CopyOnWriteList:
+    """A NameIndexedList that reads from a shared one until it is first changed.
+
+    Until then every read goes straight to ``shared``, so many owners can
+    start from the same entries at the cost of one small object each. The
+    first change copies the entries into a NameIndexedList of its own (calling
+    ``on_change`` as usual) and everything after that works on the copy;
+    ``shared`` itself is never modified.
+
+    When the entries are mutable objects, ``copy`` turns each shared entry
+    into one of this list's own. The copy is then made on the first read as
+    well, so a shared entry is never handed out.
+    """
+
+    __slots__ = ("_shared", "_own", "_copy", "on_change")
+
+    def __init__(self, shared, on_change=None, copy=None):
+        self._shared = shared if shared else _EMPTY
+        self._own = None
+        self._copy = copy
+        self.on_change = on_change
+
+    @property
+    def copied(self):
+        """Whether this list has its own entries yet"""
+        return self._own is not None
+
+    def _read(self):
+        if self._own is not None:
+            return self._own
+        if self._copy is not None and self._shared is not _EMPTY:
+            return self._write()
+        return self._shared
+
+    def _write(self):
+        own = self._own
+        if own is None:
+            entries = map(self._copy, self._shared) if self._copy else self._shared
+            own = self._own = NameIndexedList(entries, on_change=self.on_change)
+        return own
+
+    # Reads
+    def __iter__(self):
+        return iter(self._read())
+
+    def __reversed__(self):
+        return reversed(self._read())
+
+    def __len__(self):
+        return len(self._read())
+
+    def __contains__(self, entry):
+        return entry in self._read()
+
+    def __getitem__(self, position):
+        return self._read()[position]
+
+    def __eq__(self, other):
+        return self._read() == other
+
+    def index(self, entry, *args):
+        return self._read().index(entry, *args)
+
+    def count(self, entry):
+        return self._read().count(entry)
+
+    def find(self, name):
+        return self._read().find(name)
+
+    def find_all(self, name):
+        return self._read().find_all(name)
+
+    def count_named(self, name):
+        return self._read().count_named(name)
+
+    def copy(self):
+        return NameIndexedList(self._read())
+
+    # Writes
+    def append(self, entry):
+        self._write().append(entry)
+
+    def extend(self, entries):
+        self._write().extend(entries)
+
+    def __iadd__(self, entries):
+        self._write().extend(entries)
+        return self
+
+    def insert(self, position, entry):
+        self._write().insert(position, entry)
+
+    def remove(self, entry):
+        self._write().remove(entry)
+
+    def pop(self, position=-1):
+        return self._write().pop(position)
+
+    def clear(self):
+        self._write().clear()
+
+    def __setitem__(self, position, value):
+        self._write()[position] = value
+
+    def __delitem__(self, position):
+        del self._write()[position]
+
+    def __repr__(self):
+        return f"CopyOnWriteList({list(self._read())!r})"
@@ -0,0 +1,225 @@
+# models/pathfinding.py
+
+import heapq
+from collections import OrderedDict, deque
+
+from models.room import add_exit_listener, remove_exit_listener
+
+
+def room_exits(room):
+    """Neighbours of an object-graph Room as (direction, room) pairs"""
+    return room.exits.items()
+
+
+def manhattan(a, b):
+    """Grid distance between two (x, y) coordinates"""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def bfs(start, neighbors, max_depth=None):
+    """Breadth-first search from start.
+
+    Returns (dist, parent) where parent maps each reached node to the
+    (previous node, direction) pair it was first reached through.
+    """
+    dist = {start: 0}
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        depth = dist[node] + 1
+        if max_depth is not None and depth > max_depth:
+            continue
+        for direction, neighbor in neighbors(node):
+            if neighbor not in dist:
+                dist[neighbor] = depth
+                parent[neighbor] = (node, direction)
+                queue.append(neighbor)
+    return dist, parent
+
+
+def astar(start, goal, neighbors, heuristic, max_expansions=None):
+    """A* search with unit edge costs; returns parent pointers or None if unreachable"""
+    parent = {start: None}
+    cost = {start: 0}
+    counter = 0  # tie-breaker so nodes never need to be comparable
+    frontier = [(heuristic(start, goal), counter, start)]
+    expansions = 0
+    while frontier:
+        _, _, node = heapq.heappop(frontier)
+        if node == goal:
+            return parent
+        expansions += 1
+        if max_expansions is not None and expansions > max_expansions:
+            return None
+        step = cost[node] + 1
+        for direction, neighbor in neighbors(node):
+            if step < cost.get(neighbor, step + 1):
+                cost[neighbor] = step
+                parent[neighbor] = (node, direction)
+                counter += 1
+                heapq.heappush(frontier, (step + heuristic(neighbor, goal), counter, neighbor))
+    return None
+
+
+def _walk_back(parent, goal):
+    """Turn parent pointers into [(direction, node), ...] from the start to goal"""
+    steps = []
+    node = goal
+    while parent[node] is not None:
+        previous, direction = parent[node]
+        steps.append((direction, node))
+        node = previous
+    steps.reverse()
+    return steps
+
+
+class Landmarks:
+    """ALT heuristic: exact distances from a few far-apart landmark nodes.
+
+    For any landmark L, |d(L, goal) - d(L, node)| never overestimates the
+    distance from node to goal (exits are two-way), so the best of them is an
+    admissible A* heuristic for graphs without coordinates.
+    """
+
+    def __init__(self, start, neighbors, count=4):
+        self.tables = []
+        dist, _ = bfs(start, neighbors)
+        for _ in range(count):
+            # Next landmark: the node farthest from every landmark so far
+            landmark = max(dist, key=lambda n: min((t.get(n, 0) for t in self.tables), default=dist[n]))
+            table, _ = bfs(landmark, neighbors)
+            self.tables.append(table)
+
+    def __call__(self, node, goal):
+        best = 0
+        for table in self.tables:
+            a, b = table.get(node), table.get(goal)
+            if a is not None and b is not None and abs(a - b) > best:
+                best = abs(a - b)
+        return best
+
+
+class PathFinder:
+    """Shortest routes over a room graph with a cache of BFS distance tables.
+
+    Tables are kept per start node (at most ``max_sources``, least recently used
+    dropped first) and patched incrementally when Room.connect/remove_exit
+    change the graph: a new exit relaxes distances outward from its target, and
+    removing an exit only discards the tables whose shortest-path tree used it.
+
+    With a ``heuristic`` (e.g. ``manhattan`` for generated grid worlds, or
+    ``Landmarks``), routes are found with A* instead, for graphs too large or
+    unbounded to flood-fill. With a ``world`` it only listens to that world's
+    exit changes, so one session's path cache never runs for another's.
+    """
+
+    def __init__(self, neighbors=room_exits, key=None, heuristic=None, max_sources=32, max_expansions=None,
+                 world=None):
+        self.neighbors = neighbors
+        self.key = key or (lambda room: room)  # Room -> node used in the tables
+        self.heuristic = heuristic
+        self.max_sources = max_sources
+        self.max_expansions = max_expansions
+        self._tables = OrderedDict()  # start node -> (dist, parent)
+        self.world = world
+        add_exit_listener(self, world)
+
+    @classmethod
+    def for_graph(cls, graph, **kwargs):
+        """PathFinder over a compiled RoomGraph using integer room IDs"""
+        directions = graph.directions
+
+        def neighbors(room_id):
+            return [(directions[code], target) for code, target in graph.neighbors(room_id)]
+
+        def key(room):
+            return room.room_id if getattr(room, "graph", None) is graph else None
+
+        return cls(neighbors, key=key, **kwargs)
+
+    @classmethod
+    def for_grid(cls, world, **kwargs):
+        """A* PathFinder over a ChunkedWorld using grid coordinates"""
+        def neighbors(coords):
+            return [(direction, room.coords) for direction, room in world.room_at(*coords).exits.items()]
+
+        kwargs.setdefault("max_expansions", 20000)
+        return cls(neighbors, key=lambda room: getattr(room, "coords", None), heuristic=manhattan, world=world,
+                   **kwargs)
+
+    def close(self):
+        """Stop listening for exit changes"""
+        remove_exit_listener(self, self.world)
+        self._tables.clear()
+
+    def table(self, start):
+        """Return the cached (dist, parent) BFS table for a start node"""
+        entry = self._tables.get(start)
+        if entry is None:
+            entry = self._tables[start] = bfs(start, self.neighbors)
+            while len(self._tables) > self.max_sources:
+                self._tables.popitem(last=False)
+        else:
+            self._tables.move_to_end(start)
+        return entry
+
+    def steps(self, start, goal):
+        """Return [(direction, node), ...] from start to goal, or None if unreachable"""
+        if start == goal:
+            return []
+        if self.heuristic is not None:
+            parent = astar(start, goal, self.neighbors, self.heuristic, self.max_expansions)
+        else:
+            dist, parent = self.table(start)
+            if goal not in dist:
+                return None
+        if parent is None:
+            return None
+        return _walk_back(parent, goal)
+
+    def route(self, start_room, goal_room):
+        """Directions to walk from one room to another, or None if there is no way"""
+        steps = self.steps(self.key(start_room), self.key(goal_room))
+        return None if steps is None else [direction for direction, _ in steps]
+
+    def distance(self, start_room, goal_room):
+        """Number of moves between two rooms, or None if unreachable"""
+        start, goal = self.key(start_room), self.key(goal_room)
+        if self.heuristic is not None:
+            steps = self.steps(start, goal)
+            return None if steps is None else len(steps)
+        dist, _ = self.table(start)
+        return dist.get(goal)
+
+    # Exit listener hooks, called by Room.connect / Room.remove_exit
+
+    def exit_added(self, room, direction, target):
+        source, node = self.key(room), self.key(target)
+        if source is None or node is None:
+            return
+        for dist, parent in self._tables.values():
+            if source not in dist:
+                continue
+            if node in dist and dist[node] <= dist[source] + 1:
+                continue
+            dist[node] = dist[source] + 1
+            parent[node] = (source, direction)
+            queue = deque([node])
+            while queue:
+                current = queue.popleft()
+                depth = dist[current] + 1
+                for step_dir, neighbor in self.neighbors(current):
+                    if dist.get(neighbor, depth + 1) > depth:
+                        dist[neighbor] = depth
+                        parent[neighbor] = (current, step_dir)
+                        queue.append(neighbor)
+
+    def exit_removed(self, room, direction, target):
+        source, node = self.key(room), self.key(target)
+        if source is None or node is None:
+            return
+        stale = [start for start, (_, parent) in self._tables.items()
+                 if parent.get(node) == (source, direction)]
+        for start in stale:
+            del self._tables[start]
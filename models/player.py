@@ -1,10 +1,16 @@
+from models.inventory import Inventory
+from models.progression import PROGRESSION
+from models.status_effects import EffectStore
+
+# HP lost each combat round to an ongoing status
+STATUS_DAMAGE = {"Burning": 5, "Poisoned": 3}
+
 class Player:
     def __init__(self, name, character_class):
         self.name = name
         self.character_class = character_class
         self.level = 1
-        self.xp = 0
-        self.xp_to_next_level = 100  # Scales with level
+        self.total_xp = 0  # lifetime XP; level and XP into the level follow from it
         
         # Base stats
         self.max_hp = 100
@@ -12,81 +18,119 @@ class Player:
         self.base_attack = 10
         self.base_defense = 5
         self.gold = 0
+        self._attack = None  # cached totals, cleared on equip/effect/level changes
+        self._defense = None
         
         # Apply class modifiers
         self._apply_class_modifiers()
         
         # Equipment
-        self.equipped_weapon = None
-        self.equipped_armor = None
+        self._equipped_weapon = None
+        self._equipped_armor = None
         self.inventory = []
-        self.inventory_capacity = 10
+        self.inventory_capacity = 10  # slots; identical items stack in one slot
         
-        # Status effects (temporary buffs/debuffs)
-        self.status_effects = []  # [{effect: str, value: int, duration: int}]
+        # Status effects (temporary buffs/debuffs and afflictions like "Burning")
+        self._status_effects = EffectStore(on_change=self._invalidate_stats)
         
         # Quest tracking
         self.quests = {}
         self.visited_rooms = set()
+
+        # Where the player is and what they have found or learned
+        self.current_room = None
+        self.discovered_rooms = set()  # room names available for fast travel
+        self.found_secret = False
+        self.spells = set()
+
+        # Display name of the chosen class and the title shown under it
+        self.player_class = character_class
+        self.title = ""
     
+    @property
+    def inventory(self):
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, items):
+        self._inventory = Inventory(items)
+
     def _apply_class_modifiers(self):
         """Apply stat modifiers based on character class"""
-        if self.character_class == "warrior":
-            self.max_hp *= 1.2
-            self.hp = self.max_hp
-            self.base_defense *= 1.2
-        elif self.character_class == "mage":
-            self.max_hp *= 0.8
-            self.hp = self.max_hp
-            self.base_attack *= 1.3
-        elif self.character_class == "rogue":
-            self.base_attack *= 1.2
-            self.base_defense *= 0.9
+        self.max_hp, self.base_attack, self.base_defense = PROGRESSION.stats(self.character_class, 1)
+        self.hp = self.max_hp
     
+    @property
+    def status_effects(self):
+        return self._status_effects
+
+    @status_effects.setter
+    def status_effects(self, effects):
+        """Replace all effects; accepts status names, legacy dicts or StatusEffects"""
+        store = self._status_effects
+        effects = list(effects)  # read before clearing, in case it is this store
+        store.clear()
+        for effect in effects:
+            if isinstance(effect, str):
+                store.add_status(effect)
+            elif isinstance(effect, dict):
+                store.add(effect["effect"], effect["value"], effect["duration"])
+            else:
+                store.add(effect.name, effect.value, store.remaining(effect))
+
+    @property
+    def equipped_weapon(self):
+        return self._equipped_weapon
+
+    @equipped_weapon.setter
+    def equipped_weapon(self, weapon):
+        self._equipped_weapon = weapon
+        self._invalidate_stats()
+
+    @property
+    def equipped_armor(self):
+        return self._equipped_armor
+
+    @equipped_armor.setter
+    def equipped_armor(self, armor):
+        self._equipped_armor = armor
+        self._invalidate_stats()
+
+    # Short names used by the game interface
+    weapon = equipped_weapon
+    armor = equipped_armor
+
+    def _invalidate_stats(self):
+        self._attack = None
+        self._defense = None
+
     @property
     def attack(self):
-        """Calculate total attack power including equipment and effects"""
-        total = self.base_attack
-        if self.equipped_weapon:
-            total += self.equipped_weapon.damage
-        
-        # Add status effect bonuses
-        for effect in self.status_effects:
-            if effect["effect"] == "attack_boost":
-                total += effect["value"]
-        
-        return total
+        """Total attack power including equipment and effects (cached)"""
+        if self._attack is None:
+            total = self.base_attack
+            if self.equipped_weapon:
+                total += self.equipped_weapon.effects.get("damage", 0)
+            self._attack = total + self.status_effects.total("attack")
+        return self._attack
     
     @property
     def defense(self):
-        """Calculate total defense including equipment and effects"""
-        total = self.base_defense
-        if self.equipped_armor:
-            total += self.equipped_armor.defense
-        
-        # Add status effect bonuses
-        for effect in self.status_effects:
-            if effect["effect"] == "defense_boost":
-                total += effect["value"]
-        
-        return total
+        """Total defense including equipment and effects (cached)"""
+        if self._defense is None:
+            total = self.base_defense
+            if self.equipped_armor:
+                total += self.equipped_armor.effects.get("defense", 0)
+            self._defense = total + self.status_effects.total("defense")
+        return self._defense
     
     def update_status_effects(self):
-        """Update duration of status effects and remove expired ones"""
-        active_effects = []
-        for effect in self.status_effects:
-            effect["duration"] -= 1
-            if effect["duration"] > 0:
-                active_effects.append(effect)
-        self.status_effects = active_effects
+        """Advance status effect timers, remove expired ones and return them"""
+        return self.status_effects.tick()
     
     def add_status_effect(self, effect, value, duration):
         """Add a temporary status effect"""
-        self.status_effects.append({
-            "effect": effect,
-            "value": value,
-            "duration": duration
-        })
+        self.status_effects.add(effect, value, duration)
     
     def take_damage(self, damage):
         """Take damage considering defense and return actual damage taken"""
@@ -102,33 +146,53 @@ class Player:
         self.hp = min(self.max_hp, self.hp + amount)
         return self.hp - old_hp
     
+    @property
+    def xp(self):
+        """XP earned towards the next level"""
+        return self.total_xp - PROGRESSION.threshold(self.level)
+
+    @xp.setter
+    def xp(self, value):
+        self.total_xp = PROGRESSION.threshold(self.level) + value
+        self._reach_level(PROGRESSION.level_for(self.total_xp))
+
+    @property
+    def xp_to_next_level(self):
+        """XP needed to go from the current level to the next"""
+        return PROGRESSION.xp_to_next[self.level]
+
     def add_xp(self, amount):
-        """Add XP and handle leveling up"""
-        self.xp += amount
-        level_ups = 0
-        
-        while self.xp >= self.xp_to_next_level:
-            self.level_up()
-            level_ups += 1
-        
-        return level_ups
+        """Add XP and handle leveling up; returns the number of levels gained"""
+        old_level = self.level
+        self.total_xp += amount
+        self._reach_level(PROGRESSION.level_for(self.total_xp))
+        return self.level - old_level
+
+    def gain_xp(self, amount):
+        """Add XP and return a level-up message, or None if the level didn't change"""
+        if self.add_xp(amount):
+            return f"🌟 Level up! You are now level {self.level}!"
+        return None
     
     def level_up(self):
-        """Handle level up mechanics"""
-        self.level += 1
-        self.xp -= self.xp_to_next_level
-        self.xp_to_next_level = int(self.xp_to_next_level * 1.5)
-        
-        # Increase stats
+        """Advance exactly one level, topping XP up to that level's threshold"""
+        if self.level < PROGRESSION.max_level:
+            self.total_xp = max(self.total_xp, PROGRESSION.threshold(self.level + 1))
+            self._reach_level(self.level + 1)
+
+    def _reach_level(self, level):
+        """Set stats for a new level from the progression table"""
+        if level == self.level:
+            return
+        self.level = level
         old_max_hp = self.max_hp
-        self.max_hp = int(self.max_hp * 1.1)
+        self.max_hp, self.base_attack, self.base_defense = PROGRESSION.stats(self.character_class, level)
         self.hp += (self.max_hp - old_max_hp)
-        self.base_attack = int(self.base_attack * 1.1)
-        self.base_defense = int(self.base_defense * 1.1)
+        self._invalidate_stats()
     
     def add_to_inventory(self, item):
         """Add item to inventory if there's space"""
-        if len(self.inventory) >= self.inventory_capacity:
+        if not self.inventory.fits(item, self.inventory_capacity):
             return False
         self.inventory.append(item)
         return True
@@ -196,7 +260,11 @@ class Player:
         if self.status_effects:
             status.append("\nActive Effects:")
             for effect in self.status_effects:
-                status.append(f"- {effect['effect']}: +{effect['value']} ({effect['duration']} turns)")
+                remaining = self.status_effects.remaining(effect)
+                if remaining is None:
+                    status.append(f"- {effect.name}")
+                else:
+                    status.append(f"- {effect.name}: +{effect.value} ({remaining} turns)")
         
         return "\n".join(status)
 
@@ -210,64 +278,63 @@ class Player:
         return self.current_room.look()
 
     def add_status(self, status):
-        if status not in self.status_effects:
-            self.status_effects.append(status)
+        self.status_effects.add_status(status)
 
     def apply_status_damage(self):
         damage_log = ""
         if "Burning" in self.status_effects:
-            self.hp -= 5
-            damage_log += "\n🔥 You are burning! Lose 5 HP."
+            self.hp -= STATUS_DAMAGE["Burning"]
+            damage_log += f"\n🔥 You are burning! Lose {STATUS_DAMAGE['Burning']} HP."
         if "Poisoned" in self.status_effects:
-            self.hp -= 3
-            damage_log += "\n🧪 You are poisoned! Lose 3 HP."
+            self.hp -= STATUS_DAMAGE["Poisoned"]
+            damage_log += f"\n🧪 You are poisoned! Lose {STATUS_DAMAGE['Poisoned']} HP."
         if self.hp < 0:
             self.hp = 0
         return damage_log
 
     def clear_status(self, status):
-        if status in self.status_effects:
-            self.status_effects.remove(status)
+        self.status_effects.remove(status)
 
     def list_statuses(self):
         if not self.status_effects:
             return "Normal"
-        return ", ".join(effect['effect'] for effect in self.status_effects)
+        return ", ".join(self.status_effects.names())
 
     def pick_item(self, item_name):
-        for item in self.current_room.items:
-            if item.name.lower() == item_name.lower():
-                self.inventory.append(item)
-                self.current_room.items.remove(item)
-                return f"You picked up {item.name}."
-        return "There's no such item here."
+        item = self.current_room.items.find(item_name)
+        if item is None:
+            return "There's no such item here."
+        self.inventory.append(item)
+        self.current_room.items.remove(item)
+        return f"You picked up {item.name}."
 
     def drop_item(self, item_name):
-        for item in self.inventory:
-            if item.name.lower() == item_name.lower():
-                self.inventory.remove(item)
-                self.current_room.items.append(item)
-                return f"🗑️ You dropped {item.name}."
-        return "You don't have that item."
+        item = self.inventory.find(item_name)
+        if item is None:
+            return "You don't have that item."
+        self.inventory.remove(item)
+        self.current_room.items.append(item)
+        return f"🗑️ You dropped {item.name}."
 
     def equip_item(self, item_name):
-        for item in self.inventory:
-            if item.name.lower() == item_name.lower():
-                if item.item_type == "weapon":
-                    self.equipped_weapon = item
-                    return f"🗡️ You equipped {item.name}!"
-                elif item.item_type == "armor":
-                    self.equipped_armor = item
-                    return f"🛡️ You equipped {item.name}!"
-                else:
-                    return "You can't equip that item."
-        return "You don't have that item."
+        item = self.inventory.find(item_name)
+        if item is None:
+            return "You don't have that item."
+        if item.item_type == "weapon":
+            self.equipped_weapon = item
+            return f"🗡️ You equipped {item.name}!"
+        elif item.item_type == "armor":
+            self.equipped_armor = item
+            return f"🛡️ You equipped {item.name}!"
+        else:
+            return "You can't equip that item."
 
     def show_inventory(self):
         if not self.inventory:
             return "🎒 Your inventory is empty."
 
-        inv = "\n".join(f"- {item.describe()}" for item in self.inventory)
+        inv = "\n".join(f"- {stack.item.describe()}" + (f" x{stack.count}" if stack.count > 1 else "")
+                        for stack in self.inventory.stacks())
         equipped = f"\n🗡️ Equipped Weapon: {self.equipped_weapon.name if self.equipped_weapon else 'None'}"
         equipped += f"\n🛡️ Equipped Armor: {self.equipped_armor.name if self.equipped_armor else 'None'}"
 
@@ -280,12 +347,17 @@ class Player:
         empty_blocks = total_blocks - filled_blocks
         return "[" + "█" * filled_blocks + "-" * empty_blocks + f"] {self.hp}/{self.max_hp} HP"
 
+    def xp_progress(self):
+        """(XP into the current level, XP the level needs, fraction filled) for XP bars"""
+        xp, needed = self.xp, self.xp_to_next_level
+        return xp, needed, min(1, xp / needed)
+
     def xp_bar(self):
         total_blocks = 20
-        xp_ratio = self.xp / (100 * self.level)
-        filled_blocks = int(total_blocks * xp_ratio)
+        xp, needed, ratio = self.xp_progress()
+        filled_blocks = int(total_blocks * ratio)
         empty_blocks = total_blocks - filled_blocks
-        return "[" + "█" * filled_blocks + "-" * empty_blocks + f"] {self.xp}/{100 * self.level} XP"
+        return "[" + "█" * filled_blocks + "-" * empty_blocks + f"] {xp}/{needed} XP"
 
     def learn_spell(self, spell_name: str):
         self.spells.add(spell_name.lower())
@@ -298,13 +370,13 @@ class Player:
         room = self.current_room
         if s == "reveal":
             if room.name == "Whispering Caverns" and "up" not in room.exits:
-                room.add_exit('up', world.rooms["Hidden Chamber"])
+                room.add_exit('up', world.registry.by_name("Hidden Chamber"))
                 return "✨ You whisper the secret words… a hidden passage opens upward!"
             else:
                 return "🔒 The spell fizzles—there's nothing to reveal here."
         if s == "exit":
             if room.name == "Hidden Chamber" and "up" not in room.exits:
-                room.add_exit('up', world.rooms["Whispering Caverns"])
+                room.add_exit('up', world.registry.by_name("Whispering Caverns"))
                 return "✨ A swirling portal appears, leading back up!"
             else:
                 return "🔒 The spell fizzles—there's no exit to conjure here."
@@ -0,0 +1,298 @@
+# models/procedural.py
+
+import random
+import re
+from collections import Counter, OrderedDict
+
+from models.enemy import Enemy
+from models.item import Item
+from models.world import World
+from models.world_loader import LazyRoom
+
+# Generated room names end in their grid coordinates, e.g. "Misty Moors (3, -2)"
+_ROOM_NAME = re.compile(r"^(.*) \((-?\d+), (-?\d+)\)$")
+
+# Grid steps for each compass exit; "up"/"down" are never generated
+STEPS = {"north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0)}
+
+BIOMES = [
+    ("Whispering Woods", [
+        "Ancient trees lean together overhead, their leaves murmuring in a language you almost understand.",
+        "Moss-covered roots twist across the path. Somewhere nearby, an owl watches you.",
+    ]),
+    ("Misty Moors", [
+        "A cold fog clings to the heather. Distant bells ring, though no village is in sight.",
+        "The ground squelches underfoot. Will-o'-wisps flicker at the edge of your vision.",
+    ]),
+    ("Sunken Ruins", [
+        "Broken columns rise from the earth like the ribs of some great beast.",
+        "Faded murals line a half-buried wall, depicting a kingdom long forgotten.",
+    ]),
+    ("Crystal Barrens", [
+        "Shards of violet crystal jut from cracked stone, humming softly in the wind.",
+        "The air tastes of lightning. Crystals pulse with a slow, steady light.",
+    ]),
+]
+
+
+def _mix(seed, x, y, salt):
+    """Deterministic 64-bit hash of a seed, a coordinate and a salt"""
+    h = (seed * 0x9E3779B97F4A7C15 + x * 0xBF58476D1CE4E5B9 + y * 0x94D049BB133111EB + salt) & 0xFFFFFFFFFFFFFFFF
+    h ^= h >> 30
+    h = (h * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    h ^= h >> 27
+    h = (h * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    h ^= h >> 31
+    return h
+
+
+class ProceduralRoom(LazyRoom):
+    """A generated room; exits hold grid coordinates, resolved through the world."""
+
+    __slots__ = ("coords", "generated_items", "generated_npcs", "generated_npc_hp", "generated_exits")
+
+    # Neighbours may be evicted and regenerated, so never hold on to them
+    cache_exits = False
+
+    def __init__(self, name, description, coords, resolver):
+        super().__init__(name, description, resolver=resolver)
+        self.coords = coords
+        # What the generator produced, so evictions can store only the differences
+        self.generated_items = ()
+        self.generated_npcs = ()
+        self.generated_npc_hp = ()
+        self.generated_exits = {}
+
+    def _link(self, direction, room):
+        self._exits[direction] = getattr(room, "coords", room)
+
+
+class RoomDelta:
+    """Player-made changes to one generated room."""
+
+    def __init__(self):
+        self.items_removed = Counter()  # item name -> count taken
+        self.items_added = []  # Item objects dropped here
+        self.npcs_removed = set()  # indexes into the generated NPC list
+        self.npc_hp = {}  # generated NPC index -> current hp
+        self.npcs_added = []  # NPCs that were not generated (e.g. spawned on entry)
+        self.exits = {}  # direction -> coords/Room, or None when removed
+        self.visited = False
+
+    def __bool__(self):
+        return bool(self.items_removed or self.items_added or self.npcs_removed or self.npc_hp
+                    or self.npcs_added or self.exits or self.visited)
+
+    @classmethod
+    def capture(cls, room):
+        """Diff a room against what its generator produced"""
+        delta = cls()
+        delta.visited = room.visited
+
+        current = Counter(item.name for item in room.items)
+        generated = Counter(item.name for item in room.generated_items)
+        delta.items_removed = generated - current
+        extra = current - generated
+        for item in reversed(room.items):
+            if extra[item.name]:
+                delta.items_added.append(item)
+                extra[item.name] -= 1
+        delta.items_added.reverse()
+
+        present = {id(npc) for npc in room.npcs}
+        for index, npc in enumerate(room.generated_npcs):
+            if id(npc) not in present or not npc.is_alive():
+                delta.npcs_removed.add(index)
+            elif npc.hp != room.generated_npc_hp[index]:
+                delta.npc_hp[index] = npc.hp
+        generated_ids = {id(npc) for npc in room.generated_npcs}
+        delta.npcs_added = [npc for npc in room.npcs if id(npc) not in generated_ids]
+
+        for direction in set(room.generated_exits) | set(room._exits):
+            target = room._exits.get(direction)
+            if target != room.generated_exits.get(direction):
+                delta.exits[direction] = target
+        return delta
+
+    def apply(self, room):
+        """Replay the changes onto a freshly generated room"""
+        room.visited = self.visited
+        removed = Counter(self.items_removed)
+        kept = []
+        for item in room.items:
+            if removed[item.name]:
+                removed[item.name] -= 1
+            else:
+                kept.append(item)
+        room.items[:] = kept + self.items_added
+
+        npcs = []
+        for index, npc in enumerate(room.npcs):
+            if index in self.npcs_removed:
+                continue
+            if index in self.npc_hp:
+                npc.hp = self.npc_hp[index]
+            npcs.append(npc)
+        room.npcs[:] = npcs + self.npcs_added
+
+        for direction, target in self.exits.items():
+            if target is None:
+                room._exits.pop(direction, None)
+            else:
+                room._exits[direction] = target
+
+
+class ChunkedWorld(World):
+    """Open world generated on demand from a seed, chunk by chunk.
+
+    Rooms live on an integer grid and are grouped into square chunks. Chunks
+    around the player are generated as needed and kept in an LRU; chunks far
+    away are evicted, keeping only a RoomDelta for rooms the player changed so
+    a regenerated chunk comes back exactly as it was left.
+    """
+
+    def __init__(self, seed=0, chunk_size=8, max_chunks=64, view_radius=1,
+                 exit_chance=0.75, item_chance=0.15, enemy_chance=0.2):
+        super().__init__(rooms={})
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.view_radius = view_radius
+        self.exit_chance = exit_chance
+        self.item_chance = item_chance
+        self.enemy_chance = enemy_chance
+        self.chunks = OrderedDict()  # (cx, cy) -> {coords: ProceduralRoom}, least recent first
+        self.deltas = {}  # (cx, cy) -> {coords: RoomDelta}
+        self._pinned = set()
+        start = self.room_at(0, 0)
+        self.start_room_name = start.name
+        self.focus(start)
+
+    def chunk_key(self, x, y):
+        return x // self.chunk_size, y // self.chunk_size
+
+    def room_at(self, x, y):
+        """Return the room at grid coordinates, generating its chunk if needed"""
+        key = self.chunk_key(x, y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(key)
+        else:
+            self.chunks.move_to_end(key)
+        return chunk[(x, y)]
+
+    def _resolve(self, coords):
+        return self.room_at(*coords)
+
+    def locate_room(self, key):
+        return self.room_at(*key)
+
+    def _coords_named(self, name):
+        """Grid coordinates of the room generated with this name, or None"""
+        match = _ROOM_NAME.match(name)
+        if match is None:
+            return None
+        x, y = int(match[2]), int(match[3])
+        return (x, y) if self._biome(x, y)[0] == match[1] else None
+
+    def room_named(self, name):
+        # Evicted rooms leave world.rooms, but their name still says where to regenerate them
+        room = self.rooms.get(name)
+        if room is None:
+            coords = self._coords_named(name)
+            if coords is None:
+                raise KeyError(name)
+            room = self.room_at(*coords)
+        return room
+
+    def has_room(self, name):
+        return name in self.rooms or self._coords_named(name) is not None
+
+    def focus(self, room):
+        """Stream chunks around a room in and far-away chunks out"""
+        cx, cy = self.chunk_key(*room.coords)
+        radius = self.view_radius
+        self._pinned = {(cx + dx, cy + dy)
+                        for dx in range(-radius, radius + 1)
+                        for dy in range(-radius, radius + 1)}
+        for key in self._pinned:
+            if key in self.chunks:
+                self.chunks.move_to_end(key)
+            else:
+                self._load_chunk(key)
+        self._evict()
+
+    def _evict(self, keep=None):
+        """Unload least recently used chunks down to max_chunks, sparing pinned ones and keep"""
+        for key in list(self.chunks):
+            if len(self.chunks) <= self.max_chunks:
+                break
+            if key not in self._pinned and key != keep:
+                self._unload_chunk(key)
+
+    def _load_chunk(self, key):
+        chunk = self._generate_chunk(key)
+        for coords, delta in self.deltas.get(key, {}).items():
+            delta.apply(chunk[coords])
+        self.chunks[key] = chunk
+        for room in chunk.values():
+            self.rooms[room.name] = room
+            self.registry.register(room)
+        self._evict(keep=key)
+        return chunk
+
+    def _unload_chunk(self, key):
+        chunk = self.chunks.pop(key)
+        deltas = {}
+        for coords, room in chunk.items():
+            delta = RoomDelta.capture(room)
+            if delta:
+                deltas[coords] = delta
+            del self.rooms[room.name]
+            self.registry.unregister(room)
+        if deltas:
+            self.deltas[key] = deltas
+        else:
+            self.deltas.pop(key, None)
+
+    def _edge_open(self, x, y, direction):
+        # Hash the edge from its west/north end so both sides agree
+        if direction in ("west", "north"):
+            dx, dy = STEPS[direction]
+            x, y = x + dx, y + dy
+            direction = "east" if direction == "west" else "south"
+        salt = 1 if direction == "east" else 2
+        return _mix(self.seed, x, y, salt) / 2 ** 64 < self.exit_chance
+
+    def _generate_chunk(self, key):
+        cx, cy = key
+        rng = random.Random(_mix(self.seed, cx, cy, 0))
+        chunk = {}
+        size = self.chunk_size
+        for y in range(cy * size, (cy + 1) * size):
+            for x in range(cx * size, (cx + 1) * size):
+                chunk[(x, y)] = self._generate_room(x, y, rng)
+        return chunk
+
+    def _biome(self, x, y):
+        return BIOMES[_mix(self.seed, x // 16, y // 16, 3) % len(BIOMES)]
+
+    def _generate_room(self, x, y, rng):
+        biome, descriptions = self._biome(x, y)
+        room = ProceduralRoom(f"{biome} ({x}, {y})", rng.choice(descriptions), (x, y), self._resolve)
+        for direction, (dx, dy) in STEPS.items():
+            if self._edge_open(x, y, direction):
+                room._exits[direction] = (x + dx, y + dy)
+        room.generated_exits = dict(room._exits)
+
+        # Things get more dangerous further from the start
+        level = 1 + (abs(x) + abs(y)) // 10
+        if (x, y) != (0, 0):
+            if rng.random() < self.item_chance:
+                room.items.append(Item.create_random_item(level, rng))
+            if rng.random() < self.enemy_chance:
+                room.npcs.append(Enemy.create_random_enemy(level, rng))
+        room.generated_items = tuple(room.items)
+        room.generated_npcs = tuple(room.npcs)
+        room.generated_npc_hp = tuple(npc.hp for npc in room.npcs)
+        return room
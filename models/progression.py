@@ -0,0 +1,62 @@
+# models/progression.py
+
+from bisect import bisect_right
+
+MAX_LEVEL = 100
+FIRST_LEVEL_XP = 100  # XP needed to go from level 1 to 2
+XP_GROWTH = 1.5  # each level needs this much more XP than the last
+STAT_GROWTH = 1.1  # max HP, attack and defense per level
+
+# (max_hp, attack, defense) at level 1 for each class; None is the classless default
+CLASS_BASE_STATS = {
+    None: (100, 10, 5),
+    "warrior": (100 * 1.2, 10, 5 * 1.2),
+    "mage": (100 * 0.8, 10 * 1.3, 5),
+    "rogue": (100, 10 * 1.2, 5 * 0.9),
+}
+
+
+class ProgressionTable:
+    """XP thresholds and per-class stats for every level, worked out once.
+
+    ``thresholds[i]`` is the total XP needed to reach level ``i + 1``, so the
+    level for any XP total is one binary search, and a level's stats are one
+    row lookup instead of compounding ``int(x * 1.1)`` level by level.
+    """
+
+    def __init__(self, max_level=MAX_LEVEL, first_level_xp=FIRST_LEVEL_XP, class_stats=CLASS_BASE_STATS):
+        self.max_level = max_level
+        self.xp_to_next = [0]  # level -> XP from that level to the next; index 0 unused
+        self.thresholds = [0]
+        needed = first_level_xp
+        for _ in range(max_level):
+            self.xp_to_next.append(needed)
+            self.thresholds.append(self.thresholds[-1] + needed)
+            needed = int(needed * XP_GROWTH)
+        del self.thresholds[-1]  # nothing past max_level
+
+        self.stats_by_class = {}  # class -> [None, (max_hp, attack, defense) for level 1, 2, ...]
+        for character_class, (max_hp, attack, defense) in class_stats.items():
+            rows = [None, (max_hp, attack, defense)]
+            for _ in range(max_level - 1):
+                max_hp, attack, defense = int(max_hp * STAT_GROWTH), int(attack * STAT_GROWTH), int(defense * STAT_GROWTH)
+                rows.append((max_hp, attack, defense))
+            self.stats_by_class[character_class] = rows
+
+    def level_for(self, total_xp):
+        """The level a character with this much lifetime XP has reached"""
+        return bisect_right(self.thresholds, total_xp)
+
+    def threshold(self, level):
+        """Lifetime XP at which a level is reached"""
+        return self.thresholds[level - 1]
+
+    def stats(self, character_class, level):
+        """(max_hp, attack, defense) for a class at a level"""
+        rows = self.stats_by_class.get(character_class)
+        if rows is None:
+            rows = self.stats_by_class[None]
+        return rows[level]
+
+
+PROGRESSION = ProgressionTable()
@@ -1,6 +1,8 @@
 # models/quest.py
 
 class Quest:
+    __slots__ = ("id", "description", "action", "target", "count", "progress", "completed", "reward")
+
     def __init__(self, id, description, action, target, count, reward):
         self.id = id
         self.description = description
@@ -41,7 +43,7 @@ class Quest:
             reward_text += f"+{self.reward['gold']} gold "
 
         if 'xp' in self.reward:
-            player.xp += self.reward['xp']
+            player.add_xp(self.reward['xp'])
             reward_text += f"+{self.reward['xp']} XP "
 
         return f"✅ Quest '{self.description}' Completed! Rewards: {reward_text}"
@@ -0,0 +1,96 @@
+# models/registry.py
+
+import weakref
+
+
+class RoomRegistry:
+    """World-scoped room lookup by name or by a stable integer handle.
+
+    Every room a world creates is registered once and keeps its handle until
+    the world drops it (an open world evicting a chunk), even if the room
+    object is rebuilt (lazily loaded worlds). Handles are never reused: a
+    handle kept past its room's eviction raises LookupError instead of
+    finding another room, and only rooms still registered take up space.
+    The registry only holds weak references: the world's own room storage
+    owns the rooms, and rooms point back at the registry weakly, so a
+    retired world is freed as soon as it is dropped.
+    """
+
+    def __init__(self, world):
+        self._world = weakref.ref(world)
+        self._keys = {}  # handle -> key the world can rebuild the room from
+        self._refs = {}  # handle -> weakref to the live Room
+        self._handles = {}  # room name -> handle
+        self._next_handle = 0
+        self.exit_listeners = weakref.WeakSet()  # told about exit changes in this world's rooms
+
+    @property
+    def world(self):
+        """The world this registry belongs to, or None once it has been discarded"""
+        return self._world()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __contains__(self, name):
+        if name in self._handles:
+            return True
+        world = self._world()
+        return world is not None and world.has_room(name)
+
+    def register(self, room):
+        """Register a room (or a rebuilt copy of one) and return its handle"""
+        handle = self._handles.get(room.name)
+        key = getattr(room, "coords", room.name)
+        if handle is None:
+            handle = self._handles[room.name] = self._next_handle
+            self._next_handle += 1
+        self._keys[handle] = key
+        self._refs[handle] = weakref.ref(room)
+        room._registry = weakref.ref(self)
+        return handle
+
+    def unregister(self, room):
+        """Forget a room its world has dropped; its handle goes stale for good"""
+        handle = self._handles.pop(room.name, None)
+        if handle is not None:
+            del self._keys[handle], self._refs[handle]
+
+    def _live_world(self):
+        world = self._world()
+        if world is None:
+            raise LookupError("the world owning this registry has been discarded")
+        return world
+
+    def handle(self, name):
+        """Return the stable handle for a room name"""
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = self.register(self._live_world().room_named(name))
+        return handle
+
+    def by_id(self, handle):
+        """Return the room for a handle, rebuilding it through the world if needed"""
+        try:
+            room = self._refs[handle]()
+        except KeyError:
+            raise LookupError(f"no room has handle {handle}") from None
+        if room is None:
+            room = self._live_world().locate_room(self._keys[handle])
+            self.register(room)
+        return room
+
+    def by_name(self, name):
+        """Return the room with the given name"""
+        handle = self._handles.get(name)
+        if handle is None:
+            room = self._live_world().room_named(name)
+            self.register(room)
+            return room
+        return self.by_id(handle)
+
+    def get(self, name, default=None):
+        try:
+            return self.by_name(name)
+        except KeyError:
+            return default
@@ -1,15 +1,47 @@
 import random
+import weakref
 from models.enemy import Enemy
 from models.item import Item
+from models.name_index import NameIndexedList
+from models.chamber import CLOSING_DOOR_FRAMES, DOOR_FRAMES, SECRET_PHRASE, chamber_loot
+
+REVERSE_DIRECTIONS = {
+    "north": "south", "south": "north",
+    "east": "west", "west": "east",
+    "up": "down", "down": "up"
+}
+
+# Objects told about exit changes in any room (path caches and the like); held weakly.
+# Listeners for one world's rooms live on that world's RoomRegistry instead.
+_exit_listeners = weakref.WeakSet()
+
+def _listeners(world=None):
+    return _exit_listeners if world is None else world.registry.exit_listeners
+
+def add_exit_listener(listener, world=None):
+    """Call listener.exit_added/exit_removed(room, direction, target) on exit changes
+
+    With a world, only changes to that world's rooms are reported.
+    """
+    _listeners(world).add(listener)
+
+def remove_exit_listener(listener, world=None):
+    _listeners(world).discard(listener)
 
 class Room:
+    __slots__ = ("name", "description", "room_type", "_exits", "_version", "_render_cache", "items", "npcs",
+                 "enemy_spawn_chance", "cleared", "visited", "shop_inventory", "has_chest", "chest_opened",
+                 "trap", "special_features", "events", "is_secret", "_door_state", "_registry", "__weakref__")
+
     def __init__(self, name, description, room_type="normal"):
         self.name = name
         self.description = description
         self.room_type = room_type  # normal, combat, boss, shop, rest
-        self.exits = {}  # direction: room
-        self.items = []
-        self.npcs = []  # List of NPCs (including enemies) in the room
+        self._exits = {}  # direction: room
+        self._version = 0  # bumped by every change that shows up in describe()/look()
+        self._render_cache = {}  # view -> (state key, text)
+        self.items = NameIndexedList(on_change=self._touch)
+        self.npcs = NameIndexedList(on_change=self._touch)  # List of NPCs (including enemies) in the room
         self.enemy_spawn_chance = 0.3 if room_type == "normal" else 1.0 if room_type == "combat" else 0
         self.cleared = False  # For combat rooms
         self.visited = False
@@ -22,19 +54,70 @@ class Room:
         self.special_features = {}  # For quest-related or unique room features
         self.events = {}
         self.is_secret = name == "Hidden Chamber"
-        self.door_state = "closed" if self.is_secret else "open"
+        self._door_state = "closed" if self.is_secret else "open"
+        self._registry = None  # weakref to the owning world's RoomRegistry
     
+    @property
+    def version(self):
+        """Render version; changes whenever the room's description would"""
+        return self._version
+
+    def _touch(self):
+        self._version += 1
+
+    @property
+    def door_state(self):
+        return self._door_state
+
+    @door_state.setter
+    def door_state(self, state):
+        self._door_state = state
+        self._touch()
+
+    @property
+    def registry(self):
+        """The RoomRegistry of the world this room belongs to, if any"""
+        return self._registry() if self._registry else None
+
+    @property
+    def exits(self):
+        """Mapping of direction -> neighbouring room"""
+        return self._exits
+
+    def _link(self, direction, room):
+        """Store a single one-way exit"""
+        self._exits[direction] = room
+
+    def _unlink(self, direction):
+        """Drop a single one-way exit"""
+        del self._exits[direction]
+
     def connect(self, direction, room):
         """Connect this room to another in the given direction with proper bidirectional linking"""
-        self.exits[direction] = room
+        if direction in self.exits:
+            # Replacing an exit removes the old one; caches built on it must hear about that
+            old_room = self.exits[direction]
+            if old_room is not room:
+                self._notify_exit_change(direction, old_room, added=False)
+        self._link(direction, room)
+        self._notify_exit_change(direction, room, added=True)
         # Add reverse connection if not already present
-        reverse_dirs = {
-            "north": "south", "south": "north",
-            "east": "west", "west": "east",
-            "up": "down", "down": "up"
-        }
-        if direction in reverse_dirs and reverse_dirs[direction] not in room.exits:
-            room.exits[reverse_dirs[direction]] = self
+        reverse_dir = REVERSE_DIRECTIONS.get(direction)
+        if reverse_dir and reverse_dir not in room.exits:
+            room._link(reverse_dir, self)
+            room._notify_exit_change(reverse_dir, self, added=True)
+
+    def _notify_exit_change(self, direction, room, added):
+        self._touch()
+        registry = self.registry
+        listeners = list(_exit_listeners)
+        if registry is not None:
+            listeners += registry.exit_listeners
+        for listener in listeners:
+            if added:
+                listener.exit_added(self, direction, room)
+            else:
+                listener.exit_removed(self, direction, room)
     
     def add_exit(self, direction, room):
         """Legacy method - redirects to connect for consistency"""
@@ -44,16 +127,13 @@ class Room:
         """Remove an exit and its corresponding reverse connection"""
         if direction in self.exits:
             other_room = self.exits[direction]
-            reverse_dirs = {
-                "north": "south", "south": "north",
-                "east": "west", "west": "east",
-                "up": "down", "down": "up"
-            }
-            if direction in reverse_dirs:
-                reverse_dir = reverse_dirs[direction]
-                if reverse_dir in other_room.exits:
-                    del other_room.exits[reverse_dir]
-            del self.exits[direction]
+            reverse_dir = REVERSE_DIRECTIONS.get(direction)
+            if reverse_dir and reverse_dir in other_room.exits:
+                back_room = other_room.exits[reverse_dir]
+                other_room._unlink(reverse_dir)
+                other_room._notify_exit_change(reverse_dir, back_room, added=False)
+            self._unlink(direction)
+            self._notify_exit_change(direction, other_room, added=False)
     
     def get_exits(self):
         """Get available exits from the room"""
@@ -84,11 +164,13 @@ class Room:
     def add_trap(self, trap_type, damage):
         """Add a trap to the room"""
         self.trap = {"type": trap_type, "damage": damage, "detected": False}
+        self._touch()
     
     def detect_trap(self):
         """Mark trap as detected"""
         if self.trap:
             self.trap["detected"] = True
+            self._touch()
     
     def trigger_trap(self, player):
         """Trigger the room's trap if it exists"""
@@ -98,33 +180,43 @@ class Room:
         if self.trap["detected"]:
             return f"You carefully avoid the {self.trap['type']} trap."
         
-        damage = self.trap["damage"]
+        trap_type, damage = self.trap["type"], self.trap["damage"]
         actual_damage = player.take_damage(damage)
         self.trap = None  # Trap is expended
-        return f"You triggered a {self.trap['type']} trap! Took {actual_damage} damage."
+        self._touch()
+        return f"You triggered a {trap_type} trap! Took {actual_damage} damage."
     
     def add_chest(self, is_locked=False):
         """Add a treasure chest to the room"""
         self.has_chest = True
         self.chest_opened = False
         self.special_features["chest_locked"] = is_locked
+        self._touch()
     
-    def open_chest(self, player):
+    def _rng(self, rng):
+        """rng if given, else the session stream of this room's world, else the random module"""
+        if rng is None:
+            world = self.registry.world if self.registry else None
+            rng = world.rng if world is not None else None
+        return rng or random
+
+    def open_chest(self, player, rng=None):
         """Open a chest in the room if it exists"""
+        rng = self._rng(rng)
         if not self.has_chest or self.chest_opened:
             return "There is no unopened chest here."
         
         if self.special_features.get("chest_locked", False):
             key_name = "Rusty Key"  # Example key name
-            has_key = any(item.name == key_name for item in player.inventory)
-            if not has_key:
+            if not player.inventory.find(key_name):
                 return "The chest is locked. You need a key to open it."
         
         self.chest_opened = True
+        self._touch()
         # Generate chest loot based on player level
         loot = []
-        gold = player.level * 50 + random.randint(10, 100)
-        item = Item.create_random_item(player.level)
+        gold = player.level * 50 + rng.randint(10, 100)
+        item = Item.create_random_item(player.level, rng)
         loot.append(item)
         
         # Add items to room
@@ -133,8 +225,9 @@ class Room:
         
         return f"You found {gold} gold and {item.name} in the chest!"
     
-    def enter(self, player):
+    def enter(self, player, rng=None):
         """Handle room entry events"""
+        rng = self._rng(rng)
         self.visited = True
         events = []
         
@@ -145,15 +238,30 @@ class Room:
                 events.append(trap_result)
         
         # Spawn enemies in normal rooms
-        if not self.cleared and not any(isinstance(n, Enemy) for n in self.npcs) and random.random() < self.enemy_spawn_chance:
-            enemy = Enemy.create_random_enemy(player.level)
+        if not self.cleared and not any(isinstance(n, Enemy) for n in self.npcs) and rng.random() < self.enemy_spawn_chance:
+            enemy = Enemy.create_random_enemy(player.level, rng)
             self.add_npc(enemy)
             events.append(f"A {enemy.name} appears!")
         
         return "\n".join(events) if events else None
     
+    def _cached_render(self, view, render):
+        """Return render() output, reusing the last result while nothing changed"""
+        # NPC hp and statuses change in combat without touching the room
+        key = (self._version, tuple((npc.hp, npc.status_effects.version) for npc in self.npcs))
+        cached = self._render_cache.get(view)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = render()
+        self._render_cache[view] = (key, text)
+        return text
+
     def describe(self, show_items=True, show_npcs=True):
         """Get a full description of the room"""
+        return self._cached_render(("describe", show_items, show_npcs),
+                                   lambda: self._render_description(show_items, show_npcs))
+
+    def _render_description(self, show_items, show_npcs):
         desc = f"{self.name}\n{self.description}"
         
         if self.trap and self.trap["detected"]:
@@ -178,6 +286,9 @@ class Room:
 
     def look(self):
         """Enhanced look method with special handling for Hidden Chamber"""
+        return self._cached_render("look", self._render_look)
+
+    def _render_look(self):
         desc = f"\n🏰 {self.name} 🏰\n\n{self.description}\n"
 
         if self.items:
@@ -239,35 +350,27 @@ class Room:
 
     def get_item(self, item_name):
         """Get an item from the room by name."""
-        for item in self.items:
-            if item.name.lower() == item_name.lower():
-                return item
-        return None
+        return self.items.find(item_name)
 
     def validate_secret_phrase(self, phrase):
         """Validate the secret phrase for the Hidden Chamber"""
         if not self.is_secret:
             return False
-        from models.world import SECRET_PHRASE
         return phrase.lower() == SECRET_PHRASE.lower()
 
     def play_door_animation(self, opening=True):
         """Return the door animation frames for opening/closing the secret door."""
-        from models.world import DOOR_FRAMES
-        frames = DOOR_FRAMES if opening else list(reversed(DOOR_FRAMES))
-        return frames
+        return DOOR_FRAMES if opening else CLOSING_DOOR_FRAMES
 
     def spawn_chamber_loot(self):
         """Add special loot to the Hidden Chamber."""
-        from models.world import CHAMBER_LOOT
-        for item in CHAMBER_LOOT:
+        for item in chamber_loot():
             if item not in self.items:
                 self.items.append(item)
 
     def remove_chamber_loot(self):
         """Remove special loot from the Hidden Chamber."""
-        from models.world import CHAMBER_LOOT
-        for item in CHAMBER_LOOT:
+        for item in chamber_loot():
             if item in self.items:
                 self.items.remove(item)
 
@@ -283,5 +386,6 @@ class Room:
         if self.is_secret:
             self.door_state = "open"
             # Restore the exit
-            from models.world import World
-            self.connect("up", World().rooms["Whispering Caverns"])
+            caverns = self.registry.get("Whispering Caverns") if self.registry else None
+            if caverns:
+                self.connect("up", caverns)
@@ -0,0 +1,323 @@
+# models/room_graph.py
+
+import copy
+from array import array
+from collections.abc import Mapping
+from operator import attrgetter
+
+from models.room import Room, REVERSE_DIRECTIONS
+
+# Small-int direction codes shared by every compiled graph. Unusual directions
+# ("portal", "ladder", ...) get the next free code when first seen.
+DIRECTIONS = ("north", "south", "east", "west", "up", "down")
+# Room state carried over when compiling; everything else comes from the graph or is per-facade
+ADOPTED_SLOTS = tuple(attr for attr in Room.__slots__
+                      if attr not in ("name", "description", "room_type", "_exits", "items", "npcs", "events",
+                                      "_version", "_render_cache", "_registry", "__weakref__"))
+_adopted_state = attrgetter(*ADOPTED_SLOTS)
+DIRECTION_CODE_TYPE = "H"  # array typecode for direction codes
+MAX_DIRECTIONS = 1 << 16  # codes a DIRECTION_CODE_TYPE element can hold
+
+
+def _new_direction(directions, codes, direction):
+    """Give a direction the next free code"""
+    code = len(directions)
+    if code >= MAX_DIRECTIONS:
+        raise ValueError(f"a room graph holds at most {MAX_DIRECTIONS} distinct directions")
+    directions.append(direction)
+    codes[direction] = code
+    return code
+
+
+class RoomGraphBuilder:
+    """Collects rooms and exits by name, then packs them into a RoomGraph."""
+
+    def __init__(self):
+        self.names = []
+        self.descriptions = []
+        self.room_types = []
+        self.room_ids = {}
+        self.directions = list(DIRECTIONS)
+        self._direction_codes = {d: i for i, d in enumerate(self.directions)}
+        self._edges = []  # (source_id, direction_code, target_id)
+
+    def add_room(self, name, description, room_type="normal"):
+        """Register a room and return its integer ID"""
+        if name in self.room_ids:
+            return self.room_ids[name]
+        room_id = len(self.names)
+        self.room_ids[name] = room_id
+        self.names.append(name)
+        self.descriptions.append(description)
+        self.room_types.append(room_type)
+        return room_id
+
+    def direction_code(self, direction):
+        code = self._direction_codes.get(direction)
+        if code is None:
+            code = _new_direction(self.directions, self._direction_codes, direction)
+        return code
+
+    def add_exit(self, source, direction, target):
+        """Add a one-way exit between two room IDs"""
+        self._edges.append((source, self.direction_code(direction), target))
+
+    def connect(self, source, direction, target):
+        """Add an exit plus its reverse, mirroring Room.connect"""
+        self.add_exit(source, direction, target)
+        reverse_dir = REVERSE_DIRECTIONS.get(direction)
+        if reverse_dir:
+            self.add_exit(target, reverse_dir, source)
+
+    def build(self):
+        """Pack the collected edges into CSR arrays"""
+        count = len(self.names)
+        offsets = array("I", [0]) * (count + 1)
+        for source, _, _ in self._edges:
+            offsets[source + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+
+        fill = array("I", offsets[:-1])
+        dir_codes = array(DIRECTION_CODE_TYPE, [0]) * len(self._edges)
+        targets = array("I", [0]) * len(self._edges)
+        seen = set()
+        for source, code, target in self._edges:
+            # Later exits in the same direction replace earlier ones, like dict assignment
+            if (source, code) in seen:
+                start = offsets[source]
+                for slot in range(start, fill[source]):
+                    if dir_codes[slot] == code:
+                        targets[slot] = target
+                        break
+                continue
+            seen.add((source, code))
+            slot = fill[source]
+            dir_codes[slot] = code
+            targets[slot] = target
+            fill[source] += 1
+
+        # Squeeze out the slots left unused by replaced exits
+        if len(seen) != len(self._edges):
+            packed_offsets = array("I", [0])
+            packed_codes = array(DIRECTION_CODE_TYPE)
+            packed_targets = array("I")
+            for room_id in range(count):
+                start, end = offsets[room_id], fill[room_id]
+                packed_codes.extend(dir_codes[start:end])
+                packed_targets.extend(targets[start:end])
+                packed_offsets.append(len(packed_targets))
+            offsets, dir_codes, targets = packed_offsets, packed_codes, packed_targets
+
+        return RoomGraph(self.names, self.descriptions, self.room_types,
+                         offsets, dir_codes, targets, self.directions)
+
+
+class RoomGraph:
+    """Array-backed room graph with integer room IDs.
+
+    The exits of room ``i`` are ``targets[offsets[i]:offsets[i + 1]]`` with the
+    matching direction codes in ``dir_codes``. Exits changed after compiling are
+    kept in a small patch table until ``recompile()`` folds them back in.
+    """
+
+    def __init__(self, names, descriptions, room_types, offsets, dir_codes, targets, directions):
+        self.names = names
+        self.descriptions = descriptions
+        self.room_types = room_types
+        self.offsets = offsets
+        self.dir_codes = dir_codes
+        self.targets = targets
+        self.directions = list(directions)
+        self.room_ids = {name: i for i, name in enumerate(names)}
+        self.rooms = GraphRoomsView(self)
+        self._direction_codes = {d: i for i, d in enumerate(self.directions)}
+        self._patches = {}  # room_id -> {direction_code: target_id or None}
+        self._facades = {}  # room_id -> GraphRoom, created on first use
+        self.on_load = None  # called with each facade as it is created
+
+    @classmethod
+    def compile(cls, rooms):
+        """Compile an iterable of Room objects, carrying their contents over"""
+        rooms = list(rooms)
+        builder = RoomGraphBuilder()
+        for room in rooms:
+            builder.add_room(room.name, room.description, room.room_type)
+        for room in rooms:
+            source = builder.room_ids[room.name]
+            for direction, target in room.exits.items():
+                builder.add_exit(source, direction, builder.room_ids[target.name])
+        graph = builder.build()
+        for room in rooms:
+            if _carries_state(room):
+                graph.room(graph.room_ids[room.name])._adopt(room)
+        return graph
+
+    def __len__(self):
+        return len(self.names)
+
+    def direction_code(self, direction):
+        code = self._direction_codes.get(direction)
+        if code is None:
+            code = _new_direction(self.directions, self._direction_codes, direction)
+        return code
+
+    def room_id(self, name):
+        """Return the integer ID for a room name"""
+        return self.room_ids[name]
+
+    def neighbors(self, room_id):
+        """Return [(direction_code, target_id), ...] for a room"""
+        start, end = self.offsets[room_id], self.offsets[room_id + 1]
+        exits = list(zip(self.dir_codes[start:end], self.targets[start:end]))
+        patch = self._patches.get(room_id)
+        if patch:
+            exits = [(code, target) for code, target in exits if code not in patch]
+            exits.extend((code, target) for code, target in patch.items() if target is not None)
+        return exits
+
+    def neighbor_ids(self, room_id):
+        """Return just the target IDs reachable from a room"""
+        if room_id in self._patches:
+            return [target for _, target in self.neighbors(room_id)]
+        return self.targets[self.offsets[room_id]:self.offsets[room_id + 1]]
+
+    def exit_target(self, room_id, direction):
+        """Return the room ID behind an exit, or None"""
+        code = self._direction_codes.get(direction)
+        if code is None:
+            return None
+        patch = self._patches.get(room_id)
+        if patch and code in patch:
+            return patch[code]
+        for slot in range(self.offsets[room_id], self.offsets[room_id + 1]):
+            if self.dir_codes[slot] == code:
+                return self.targets[slot]
+        return None
+
+    def set_exit(self, room_id, direction, target_id):
+        """Add or replace a one-way exit after compiling"""
+        self._patches.setdefault(room_id, {})[self.direction_code(direction)] = target_id
+
+    def remove_exit(self, room_id, direction):
+        """Remove a one-way exit after compiling"""
+        self._patches.setdefault(room_id, {})[self.direction_code(direction)] = None
+
+    def recompile(self):
+        """Fold patched exits back into the CSR arrays"""
+        if not self._patches:
+            return
+        offsets = array("I", [0])
+        dir_codes = array(DIRECTION_CODE_TYPE)
+        targets = array("I")
+        for room_id in range(len(self.names)):
+            for code, target in self.neighbors(room_id):
+                dir_codes.append(code)
+                targets.append(target)
+            offsets.append(len(targets))
+        self.offsets, self.dir_codes, self.targets = offsets, dir_codes, targets
+        self._patches.clear()
+
+    def room(self, room_id):
+        """Return the Room facade for an ID, creating it on first use"""
+        facade = self._facades.get(room_id)
+        if facade is None:
+            facade = self._facades[room_id] = GraphRoom(self, room_id)
+            if self.on_load:
+                self.on_load(facade)
+        return facade
+
+    def built_rooms(self):
+        """Facades created so far"""
+        return list(self._facades.values())
+
+
+class GraphRoom(Room):
+    """Room facade over one node of a RoomGraph.
+
+    Behaves like a normal Room, but its exits are read from (and written to)
+    the graph's arrays instead of a per-room dict.
+    """
+
+    __slots__ = ("graph", "room_id")
+
+    def __init__(self, graph, room_id):
+        super().__init__(graph.names[room_id], graph.descriptions[room_id], graph.room_types[room_id])
+        self.graph = graph
+        self.room_id = room_id
+
+    @property
+    def exits(self):
+        return GraphExitsView(self.graph, self.room_id)
+
+    def _link(self, direction, room):
+        if getattr(room, "graph", None) is not self.graph:
+            raise ValueError(f"{room.name} is not part of this room graph")
+        self.graph.set_exit(self.room_id, direction, room.room_id)
+
+    def _unlink(self, direction):
+        self.graph.remove_exit(self.room_id, direction)
+
+    def _adopt(self, room):
+        """Take over a copy of the contents and state of an object-graph Room"""
+        # Deep copies, so the compiled world and the source never share an NPC, item, trap or shop list.
+        # Event handlers are code rather than state: only their table is copied.
+        memo = {}
+        self.items.extend(copy.deepcopy(list(room.items), memo))
+        self.npcs.extend(copy.deepcopy(list(room.npcs), memo))
+        self.events = dict(room.events)
+        for attr in ADOPTED_SLOTS:
+            setattr(self, attr, copy.deepcopy(getattr(room, attr), memo))
+        self._touch()
+
+
+def _carries_state(room):
+    """Whether a room differs from the fresh facade its graph node would give"""
+    if room.items or room.npcs or room.events:
+        return True
+    return _adopted_state(room) != _adopted_state(Room(room.name, room.description, room.room_type))
+
+
+class GraphExitsView(Mapping):
+    """Read-only direction -> GraphRoom mapping for one room"""
+
+    __slots__ = ("graph", "room_id")
+
+    def __init__(self, graph, room_id):
+        self.graph = graph
+        self.room_id = room_id
+
+    def __getitem__(self, direction):
+        target = self.graph.exit_target(self.room_id, direction)
+        if target is None:
+            raise KeyError(direction)
+        return self.graph.room(target)
+
+    def __contains__(self, direction):
+        return self.graph.exit_target(self.room_id, direction) is not None
+
+    def __iter__(self):
+        directions = self.graph.directions
+        return (directions[code] for code, _ in self.graph.neighbors(self.room_id))
+
+    def __len__(self):
+        return len(self.graph.neighbors(self.room_id))
+
+
+class GraphRoomsView(Mapping):
+    """Name -> GraphRoom mapping, usable wherever World.rooms is expected"""
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __getitem__(self, name):
+        return self.graph.room(self.graph.room_ids[name])
+
+    def __contains__(self, name):
+        return name in self.graph.room_ids
+
+    def __iter__(self):
+        return iter(self.graph.names)
+
+    def __len__(self):
+        return len(self.graph.names)
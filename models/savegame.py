@@ -0,0 +1,682 @@
+# models/savegame.py
+
+import copy
+import hashlib
+import os
+import re
+import struct
+import tempfile
+import zlib
+from collections import Counter
+from functools import cache
+
+from models.chamber import chamber_loot
+from models.enemy import Enemy
+from models.enemy_archetypes import ENEMY_ARCHETYPES, ArchetypeEnemy
+from models.inventory import stack_key
+from models.item import Item, ScrollOfRevelation
+from models.item_templates import ITEM_TEMPLATES, TemplatedItem
+from models.npc import NPC
+from models.player import Player
+from models.procedural import ChunkedWorld, RoomDelta
+from models.quest import Quest
+from models.rng import RandomStreams
+from models.shop_npc import ShopNPC
+from models.world import World
+from models.world_template import TemplateRooms, load_template
+
+SAVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "saves")
+
+SAVE_MAGIC = b"MRSV"
+SAVE_VERSION = 1
+FULL, DELTA = 0, 1
+COMPRESSED = 0x01  # header flag: the payload is zlib-compressed
+REBASE_RATIO = 0.5  # write a new full snapshot once the delta is this big a fraction of it
+
+# A save file is a 15-byte header followed by the payload:
+#
+#   magic "MRSV" | version u8 | kind u8 (full/delta) | flags u8 | base id (8 bytes)
+#
+# The payload is a string table (a count, then each string as a length and
+# UTF-8 bytes) and one encoded value. Values are a tag byte and a body;
+# strings are indexes into the table, so every name and description is
+# stored once however often it appears. A full snapshot's value is
+# {section key: section}; a delta's is ({changed section key: section},
+# (removed section keys)), and its base id names the full snapshot it applies to.
+_HEADER = struct.Struct("<4sBBB8s")
+_FLOAT = struct.Struct("<d")
+
+_NONE, _FALSE, _TRUE, _INT, _NEG, _FLOAT_TAG, _STR, _SEQ, _MAP = range(9)
+
+
+def _write_varint(out, n):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+class _Encoder:
+    """Values to bytes, collecting a string table as it goes."""
+
+    __slots__ = ("out", "strings")
+
+    def __init__(self):
+        self.out = bytearray()
+        self.strings = {}  # str -> index in the table
+
+    def value(self, value):
+        out = self.out
+        kind = type(value)
+        if kind is str:
+            index = self.strings.get(value)
+            if index is None:
+                index = self.strings[value] = len(self.strings)
+            out.append(_STR)
+            if index < 0x80:
+                out.append(index)
+            else:
+                _write_varint(out, index)
+        elif kind is int:
+            # Most numbers (counts, levels, coordinates) fit one varint byte; skip the call for those
+            if value >= 0:
+                out.append(_INT)
+                if value < 0x80:
+                    out.append(value)
+                else:
+                    _write_varint(out, value)
+            else:
+                out.append(_NEG)
+                if value >= -0x80:
+                    out.append(-value - 1)
+                else:
+                    _write_varint(out, -value - 1)
+        elif kind is tuple or kind is list:
+            out.append(_SEQ)
+            _write_varint(out, len(value))
+            for entry in value:
+                self.value(entry)
+        elif value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif kind is dict:
+            out.append(_MAP)
+            _write_varint(out, len(value))
+            for key, entry in value.items():
+                self.value(key)
+                self.value(entry)
+        elif kind is float:
+            out.append(_FLOAT_TAG)
+            out += _FLOAT.pack(value)
+        else:
+            raise TypeError(f"cannot save a {kind.__name__}")
+
+    def payload(self):
+        table = bytearray()
+        _write_varint(table, len(self.strings))
+        for string in self.strings:
+            data = string.encode("utf-8")
+            _write_varint(table, len(data))
+            table += data
+        return bytes(table + self.out)
+
+
+class _Decoder:
+    """Bytes back to values: sequences come back as tuples, maps as dicts."""
+
+    __slots__ = ("data", "pos", "strings")
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.strings = []
+        for _ in range(self.varint()):
+            length = self.varint()
+            self.strings.append(bytes(data[self.pos:self.pos + length]).decode("utf-8"))
+            self.pos += length
+
+    def varint(self):
+        data, pos = self.data, self.pos
+        n = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return n
+            shift += 7
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return self.strings[self.varint()]
+        if tag == _INT:
+            return self.varint()
+        if tag == _SEQ:
+            return tuple(self.value() for _ in range(self.varint()))
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _NEG:
+            return -self.varint() - 1
+        if tag == _MAP:
+            return {self.value(): self.value() for _ in range(self.varint())}
+        if tag == _FLOAT_TAG:
+            value, = _FLOAT.unpack_from(self.data, self.pos)
+            self.pos += _FLOAT.size
+            return value
+        raise ValueError(f"corrupt save: unknown tag {tag}")
+
+
+def save_id(payload):
+    """The id a delta uses to name the full snapshot it applies to"""
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def encode_save(value, kind=FULL, base_id=None, compress=True):
+    """(file bytes, id) for a value; a full snapshot's id is its own, a delta's is its base's"""
+    encoder = _Encoder()
+    encoder.value(value)
+    payload = encoder.payload()
+    if kind == FULL:
+        base_id = save_id(payload)
+    flags = 0
+    if compress:
+        packed = zlib.compress(payload)
+        if len(packed) < len(payload):
+            payload, flags = packed, COMPRESSED
+    return _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, kind, flags, base_id) + payload, base_id
+
+
+def decode_save(data):
+    """(kind, id, value) from the bytes of a save file"""
+    if len(data) < _HEADER.size:
+        raise ValueError("save file is truncated")
+    magic, version, kind, flags, base_id = _HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError("not a save file")
+    if version > SAVE_VERSION:
+        raise ValueError(f"save uses format v{version}, expected v{SAVE_VERSION}")
+    payload = memoryview(data)[_HEADER.size:]
+    try:
+        if flags & COMPRESSED:
+            payload = zlib.decompress(payload)
+        return kind, base_id, _Decoder(payload).value()
+    except (zlib.error, IndexError) as e:
+        raise ValueError(f"corrupt save: {e}") from e
+
+
+# Game objects as plain values. Each kind of item and NPC is a tuple led by
+# a small integer; rooms are referenced by their position in the world file's
+# index, or by grid coordinates in an open world.
+
+_PLAIN, _TEMPLATED, _SCROLL = range(3)
+_NPC, _SHOP, _ARCHETYPE, _ENEMY = range(4)
+
+
+def item_value(item):
+    if type(item) is TemplatedItem and not item.effects.copied:
+        return (_TEMPLATED, item.template.key, item.level)
+    if type(item) is ScrollOfRevelation:
+        return (_SCROLL,)
+    return (_PLAIN, item.name, item.description, item.item_type, item.value, item.combat_usable,
+            dict(item.effects), item.rarity)
+
+
+def item_from_value(value):
+    kind = value[0]
+    if kind == _TEMPLATED:
+        return ITEM_TEMPLATES.create(value[1], value[2])
+    if kind == _SCROLL:
+        return ScrollOfRevelation()
+    _, name, description, item_type, worth, combat_usable, effects, rarity = value
+    return Item(name, description, item_type, worth, combat_usable, effects, rarity)
+
+
+@cache
+def _chamber_items():
+    return {stack_key(item): item for item in chamber_loot()}
+
+
+def _room_item(value):
+    """A room's item, as the shared chamber loot instance when it is one, as the Hidden Chamber expects"""
+    item = item_from_value(value)
+    return _chamber_items().get(stack_key(item), item) if value[0] == _PLAIN else item
+
+
+def npc_value(npc):
+    if isinstance(npc, ShopNPC):
+        return (_SHOP, npc.name, tuple((item_value(item), price) for item, price in npc.shop_inventory.items()))
+    if isinstance(npc, ArchetypeEnemy):
+        return (_ARCHETYPE, npc.archetype.name, npc.level, npc.hp, tuple(item_value(item) for item in npc.drops))
+    if isinstance(npc, Enemy):
+        return (_ENEMY, npc.name, npc.level, npc.hp, npc.max_hp, npc.attack_power, npc.defense,
+                npc.xp_reward, npc.loot_gold, tuple(item_value(item) for item in npc.drops))
+    return (_NPC, npc.name, npc.hp, npc.attack_power, npc.loot_gold, npc.xp_reward, npc.is_boss)
+
+
+def npc_from_value(value):
+    kind = value[0]
+    if kind == _SHOP:
+        return ShopNPC(value[1], {item_from_value(item): price for item, price in value[2]})
+    if kind == _ARCHETYPE:
+        _, name, level, hp, drops = value
+        npc = ArchetypeEnemy(ENEMY_ARCHETYPES.get(name), level, [item_from_value(item) for item in drops])
+    elif kind == _ENEMY:
+        _, name, level, hp, max_hp, attack, defense, xp, gold, drops = value
+        # Level 1 stats are taken as given, so the saved totals come back unchanged
+        npc = Enemy(name, 1, max_hp, attack, defense, xp, gold, [item_from_value(item) for item in drops])
+        npc.level = level
+    else:
+        _, name, hp, attack, gold, xp, is_boss = value
+        npc = NPC(name, hp, attack, gold, xp, is_boss)
+    npc.hp = hp
+    return npc
+
+
+def _quest_value(quest):
+    if isinstance(quest, Quest):
+        return (quest.id, quest.description, quest.action, quest.target, quest.count,
+                quest.progress, quest.completed, dict(quest.reward))
+    return quest
+
+
+def _quest_from_value(value):
+    if not isinstance(value, tuple):
+        return value
+    id, description, action, target, count, progress, completed, reward = value
+    quest = Quest(id, description, action, target, count, reward)
+    quest.progress = progress
+    quest.completed = completed
+    return quest
+
+
+@cache
+def _room_ids(template):
+    """(names by id, {name: id}) for a world template's rooms"""
+    names = tuple(template.index)
+    return names, {name: i for i, name in enumerate(names)}
+
+
+class _RoomRefs:
+    """Rooms to integers and back for one world.
+
+    Rooms from a world file are their index in it; open-world rooms are
+    their (x, y) grid coordinates. Names the world doesn't know are kept as
+    strings.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        if isinstance(world, ChunkedWorld):
+            self.names, self.ids = (), {}
+        else:
+            self.names, self.ids = _room_ids(world.rooms.template)
+
+    def ref(self, room):
+        coords = getattr(room, "coords", None)
+        return coords if coords is not None else self.ids.get(room.name, room.name)
+
+    def name_ref(self, name):
+        return self.ids.get(name, name)
+
+    def name(self, ref):
+        return self.names[ref] if type(ref) is int else ref
+
+    def room(self, ref):
+        if type(ref) is tuple:
+            return self.world.room_at(*ref)
+        return self.world.rooms[self.name(ref)]
+
+    def names_value(self, names):
+        return tuple(self.name_ref(name) for name in sorted(names))
+
+
+# Capturing a session as sections: {key: value}, where a key is a string or a
+# ("room", ...) tuple. Sections are compared against the last full snapshot
+# to write deltas, so a save after one fight stores the player and little else.
+
+def _trap_value(trap):
+    return None if trap is None else (trap["type"], trap["damage"], trap["detected"])
+
+
+def _template_room_value(room, refs):
+    """A world-file room's changes from its template, or None when it has none"""
+    template = room.template
+    items = npcs = exits = None
+    if room.items.copied:
+        items = tuple(item_value(item) for item in room.items)
+        if items == tuple(item_value(item) for item in template.items):
+            items = None
+    if room.npcs.copied:
+        npcs = tuple(npc_value(npc) for npc in room.npcs)
+        if npcs == tuple(npc_value(npc) for npc in template.npcs):
+            npcs = None
+    if room.changed_exits:
+        exits = {direction: refs.name_ref(target if isinstance(target, str) else target.name)
+                 for direction, target in room._exits.items()}
+        if exits == {direction: refs.name_ref(name) for direction, name in template.exits.items()}:
+            exits = None
+    flags = (room.visited, room.cleared, room.door_state, room.chest_opened, _trap_value(room.trap))
+    if items is None and npcs is None and exits is None and flags == _pristine_flags(room):
+        return None
+    return (items, npcs, exits) + flags
+
+
+def _pristine_flags(room):
+    return (False, False, "closed" if room.is_secret else "open", False, None)
+
+
+# A generated room the player has only walked through is stored as True
+_WALKED_THROUGH = ((), (), (), {}, (), {}, True)
+
+
+def _delta_value(delta):
+    value = (tuple(sorted(delta.items_removed.items())),
+             tuple(item_value(item) for item in delta.items_added),
+             tuple(sorted(delta.npcs_removed)),
+             dict(delta.npc_hp),
+             tuple(npc_value(npc) for npc in delta.npcs_added),
+             {direction: getattr(target, "coords", target) for direction, target in delta.exits.items()},
+             delta.visited)
+    return True if value == _WALKED_THROUGH else value
+
+
+def _generated_room_value(room):
+    """An open-world room's RoomDelta as a value, or None when it is as generated"""
+    # Most rooms are only walked through; tell those apart without building a RoomDelta
+    if (room._exits == room.generated_exits and tuple(room.items) == room.generated_items
+            and tuple(room.npcs) == room.generated_npcs
+            and tuple(npc.hp for npc in room.npcs) == room.generated_npc_hp):
+        return True if room.visited else None
+    delta = RoomDelta.capture(room)
+    return _delta_value(delta) if delta else None
+
+
+def _delta_from_value(value):
+    delta = RoomDelta()
+    if value is True:
+        delta.visited = True
+        return delta
+    items_removed, items_added, npcs_removed, npc_hp, npcs_added, exits, visited = value
+    delta.items_removed = Counter(dict(items_removed))
+    delta.items_added = [item_from_value(item) for item in items_added]
+    delta.npcs_removed = set(npcs_removed)
+    delta.npc_hp = dict(npc_hp)
+    delta.npcs_added = [npc_from_value(npc) for npc in npcs_added]
+    delta.exits = dict(exits)
+    delta.visited = visited
+    return delta
+
+
+def _world_value(world):
+    if isinstance(world, ChunkedWorld):
+        return ("chunked", world.seed, world.chunk_size, world.max_chunks, world.view_radius,
+                world.exit_chance, world.item_chance, world.enemy_chance)
+    if isinstance(world.rooms, TemplateRooms):
+        template = world.rooms.template
+        return ("template", len(template), template.start)
+    raise TypeError("only worlds opened from a world file or generated chunk by chunk can be saved")
+
+
+def _room_sections(world, refs):
+    sections = {}
+    if isinstance(world, ChunkedWorld):
+        for chunk_key, deltas in world.deltas.items():
+            if chunk_key not in world.chunks:
+                for (x, y), delta in deltas.items():
+                    sections[("room", x, y)] = _delta_value(delta)
+        for chunk in world.chunks.values():
+            for (x, y), room in chunk.items():
+                # Only the player changes rooms, and only ones they have been in or next to
+                if room.visited or room._exits != room.generated_exits:
+                    value = _generated_room_value(room)
+                    if value is not None:
+                        sections[("room", x, y)] = value
+    else:
+        for name, room in world.rooms.loaded.items():
+            value = _template_room_value(room, refs)
+            if value is not None:
+                sections[("room", refs.name_ref(name))] = value
+    return sections
+
+
+def capture(game_state, flags=None):
+    """A game session as save sections.
+
+    `flags` holds any other plain values the interface wants back on load.
+    A fight or shop visit in progress is not saved; the game resumes outside it.
+    """
+    world, player = game_state["world"], game_state["player"]
+    refs = _RoomRefs(world)
+    effects = player.status_effects
+    sections = {
+        "game": (_world_value(world), game_state["rng"].seed, dict(world.quest_state),
+                 tuple(sorted(game_state.get("discovered_secrets", ()))), dict(flags or {})),
+        "player": (player.name,
+                   # Only a class name is kept; anything else plays as the classless default
+                   player.character_class if isinstance(player.character_class, str) else None,
+                   player.player_class if isinstance(player.player_class, str) else None,
+                   player.title, player.level, player.total_xp, player.hp, player.max_hp,
+                   player.base_attack, player.base_defense, player.gold, player.inventory_capacity,
+                   player.found_secret, tuple(sorted(player.spells)),
+                   {key: _quest_value(quest) for key, quest in player.quests.items()},
+                   refs.ref(player.current_room),
+                   None if player.weapon is None else item_value(player.weapon),
+                   None if player.armor is None else item_value(player.armor)),
+        # Rooms seen only grow, and slowly, so they are kept out of the section every fight changes
+        "map": (refs.names_value(player.visited_rooms), refs.names_value(player.discovered_rooms)),
+        "inventory": tuple((item_value(stack.item), stack.count) for stack in player.inventory.stacks()),
+        "effects": (effects.turn, tuple((effect.name, effect.value, effects.remaining(effect))
+                                        for effect in effects)),
+    }
+    sections.update(_room_sections(world, refs))
+    return sections
+
+
+def _restore_template_room(room, value, refs):
+    items, npcs, exits, visited, cleared, door_state, chest_opened, trap = value
+    if items is not None:
+        room.items[:] = [_room_item(item) for item in items]
+    if npcs is not None:
+        room.npcs[:] = [npc_from_value(npc) for npc in npcs]
+    if exits is not None:
+        # Stored as room ids; the room resolves names to rooms when an exit is followed
+        own = room._own_exits()
+        own.clear()
+        own.update((direction, refs.name(ref)) for direction, ref in exits.items())
+    room.visited = visited
+    room.cleared = cleared
+    room.door_state = door_state
+    room.chest_opened = chest_opened
+    room.trap = None if trap is None else {"type": trap[0], "damage": trap[1], "detected": trap[2]}
+
+
+def _open_world(value, world_file):
+    kind = value[0]
+    if kind == "chunked":
+        _, seed, chunk_size, max_chunks, view_radius, exit_chance, item_chance, enemy_chance = value
+        return ChunkedWorld(seed, chunk_size, max_chunks, view_radius, exit_chance, item_chance, enemy_chance)
+    template = load_template(world_file)
+    if (len(template), template.start) != value[1:]:
+        raise ValueError("save was made for a different world file")
+    return World.from_template(template)
+
+
+def restore(sections, world_file):
+    """Rebuild a session from save sections.
+
+    Returns {"world", "player", "discovered_secrets", "rng", "flags"}; random
+    streams start again from the session seed.
+    """
+    world_value, seed, quest_state, secrets, flags = sections["game"]
+    world = _open_world(world_value, world_file)
+    world.quest_state.update(quest_state)
+    refs = _RoomRefs(world)
+
+    rooms = {key[1:]: value for key, value in sections.items() if type(key) is tuple and key[0] == "room"}
+    if isinstance(world, ChunkedWorld):
+        for coords, value in rooms.items():
+            world.deltas.setdefault(world.chunk_key(*coords), {})[coords] = _delta_from_value(value)
+        # Chunks around the start were generated before the deltas were known
+        for chunk_key, chunk in world.chunks.items():
+            for coords, delta in world.deltas.get(chunk_key, {}).items():
+                delta.apply(chunk[coords])
+    else:
+        for (ref,), value in rooms.items():
+            _restore_template_room(world.rooms[refs.name(ref)], value, refs)
+
+    (name, character_class, player_class, title, level, total_xp, hp, max_hp, base_attack, base_defense,
+     gold, capacity, found_secret, spells, quests, room_ref, weapon, armor) = sections["player"]
+    visited, discovered = sections["map"]
+    player = Player(name, character_class)
+    player.player_class = player_class
+    player.title = title
+    player.level = level
+    player.total_xp = total_xp
+    player.max_hp, player.base_attack, player.base_defense = max_hp, base_attack, base_defense
+    player.hp = hp
+    player.gold = gold
+    player.inventory_capacity = capacity
+    player.found_secret = found_secret
+    player.spells = set(spells)
+    player.quests = {key: _quest_from_value(quest) for key, quest in quests.items()}
+    player.visited_rooms = {refs.name(ref) for ref in visited}
+    player.discovered_rooms = {refs.name(ref) for ref in discovered}
+    player.weapon = None if weapon is None else item_from_value(weapon)
+    player.armor = None if armor is None else item_from_value(armor)
+
+    items = []
+    for value, count in sections["inventory"]:
+        item = item_from_value(value)
+        items.append(item)
+        items.extend(copy.copy(item) for _ in range(count - 1))
+    player.inventory = items
+
+    turn, effects = sections["effects"]
+    store = player.status_effects
+    store.clear()
+    store.turn = turn
+    for effect_name, value, remaining in effects:
+        store.add(effect_name, value, remaining)
+
+    room = refs.room(room_ref)
+    player.current_room = room
+    world.starting_room = world.get_starting_room()
+    world.current_room = room
+    if isinstance(world, ChunkedWorld):
+        world.focus(room)
+    return {"world": world, "player": player, "discovered_secrets": set(secrets),
+            "rng": RandomStreams(seed), "flags": dict(flags)}
+
+
+def slot_name(player_name):
+    """A file-system safe name for a player's save slot.
+
+    Names differing only in case share a slot; any other difference, even
+    one the safe part drops ("Bob!" and "bob"), gets its own.
+    """
+    folded = player_name.casefold()
+    safe = re.sub(r"[^\w-]+", "_", folded).strip("_") or "player"
+    return f"{safe}-{hashlib.sha256(folded.encode()).hexdigest()[:12]}"
+
+
+def _write_atomic(path, data):
+    # A temporary file of its own in the same directory, so concurrent saves never write to the same one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+class SaveSlot:
+    """One player's saved game: a full snapshot plus the changes made since it.
+
+    The first save writes ``<slot>.save``. Later saves compare the session
+    with that snapshot and write only the sections that differ to
+    ``<slot>.delta``, replacing the previous delta; once a delta grows past
+    REBASE_RATIO of the snapshot the next save writes a new snapshot instead.
+    Files are written to a temporary name and renamed, so a crash mid-save
+    leaves the previous save intact.
+
+    Slots are found by player name. Without an ``owner`` every slot on the
+    server is shared, so anyone using the same name reaches the same save;
+    with one (e.g. a signed-in user's email) the slots live in that owner's
+    own subdirectory.
+    """
+
+    def __init__(self, player_name, directory=SAVE_DIR, compress=True, owner=None):
+        if owner is not None:
+            directory = os.path.join(directory, slot_name(owner))
+        self.name = slot_name(player_name)
+        self.directory = directory
+        self.compress = compress
+        self.path = os.path.join(directory, f"{self.name}.save")
+        self.delta_path = os.path.join(directory, f"{self.name}.delta")
+        self._base = None  # sections of the full snapshot on disk
+        self._base_id = None
+        self._base_size = 0
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def save(self, game_state, flags=None):
+        """Write the session; returns ("full" or "delta", bytes written)"""
+        sections = capture(game_state, flags)
+        os.makedirs(self.directory, exist_ok=True)
+        if self._base is not None:
+            changed = {key: value for key, value in sections.items() if self._base.get(key) != value}
+            removed = tuple(key for key in self._base if key not in sections)
+            data, _ = encode_save((changed, removed), DELTA, self._base_id, self.compress)
+            if len(data) <= self._base_size * REBASE_RATIO:
+                _write_atomic(self.delta_path, data)
+                return "delta", len(data)
+        data, self._base_id = encode_save(sections, FULL, compress=self.compress)
+        _write_atomic(self.path, data)
+        if os.path.exists(self.delta_path):
+            os.remove(self.delta_path)  # it describes the old snapshot
+        self._base, self._base_size = sections, len(data)
+        return "full", len(data)
+
+    def read(self):
+        """The saved sections, with the delta applied when it belongs to the snapshot"""
+        with open(self.path, "rb") as f:
+            data = f.read()
+        kind, base_id, sections = decode_save(data)
+        if kind != FULL:
+            raise ValueError(f"{self.path} is not a full snapshot")
+        self._base, self._base_id, self._base_size = sections, base_id, len(data)
+        if not os.path.exists(self.delta_path):
+            return sections
+        with open(self.delta_path, "rb") as f:
+            kind, delta_base, (changed, removed) = decode_save(f.read())
+        if kind != DELTA or delta_base != base_id:
+            return sections  # left over from an older snapshot
+        merged = dict(sections)
+        merged.update(changed)
+        for key in removed:
+            merged.pop(key, None)
+        return merged
+
+    def load(self, world_file):
+        """Restore the saved session (see restore)"""
+        return restore(self.read(), world_file)
+
+    def delete(self):
+        for path in (self.path, self.delta_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._base = self._base_id = None
+        self._base_size = 0
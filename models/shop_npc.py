@@ -1,12 +1,49 @@
 # models/shop_npc.py
 
+import copy
+
 from models.npc import NPC
+from models.name_index import fold
+
+
+def _check_count(count):
+    if count < 1:
+        raise ValueError(f"can't trade {count} items; the count must be at least 1")
+
 
 class ShopNPC(NPC):
+    __slots__ = ("shop_inventory", "_stock_index")
+
     def __init__(self, name, shop_inventory):
         # Shop NPC is a non-combatant: 100 hp, 0 attack, no loot
         super().__init__(name=name, hp=100, attack_power=0, loot_gold=0, xp_reward=0, is_boss=False)
         self.shop_inventory = shop_inventory  # Dictionary: {Item: price}
+        self._index_stock()
+
+    def _index_stock(self):
+        self._stock_index = {fold(item.name): item for item in self.shop_inventory}
+
+    def _stocked(self, item_name):
+        """The stock item with this name (any case), or None.
+
+        The index is rebuilt when it misses or points at an item no longer
+        for sale, so direct edits to shop_inventory are picked up too.
+        """
+        key = fold(item_name)
+        item = self._stock_index.get(key)
+        if item is None or item not in self.shop_inventory:
+            self._index_stock()
+            item = self._stock_index.get(key)
+        return item
+
+    def restock(self, item, price):
+        """Add (or reprice) an item for sale, replacing any stocked item with the same name."""
+        key = fold(item.name)
+        stocked = self._stock_index.get(key)
+        if stocked is not None and stocked is not item:
+            self.shop_inventory.pop(stocked, None)
+        self.shop_inventory[item] = price
+        self._stock_index[key] = item
 
     def list_items(self):
         """List items available for sale."""
@@ -18,30 +55,38 @@ class ShopNPC(NPC):
             shop_list += f"- {item.name}: {price} gold\n"
         return shop_list
 
-    def buy_from(self, player, item_name):
-        """Player buys an item from the shop."""
-        for item, price in self.shop_inventory.items():
-            if item.name.lower() == item_name.lower():
-                if player.gold >= price:
-                    player.gold -= price
-                    player.inventory.append(item)
-                    return f"✅ You bought {item.name} for {price} gold."
-                else:
-                    return "❌ You don't have enough gold."
-        return "❓ That item is not sold here."
-
-    def sell_to(self, player, item_name):
-        """Player sells an item to the shopkeeper."""
-        for item in player.inventory:
-            if item.name.lower() == item_name.lower():
-                sell_price = 10  # Default fixed sell price
-                if hasattr(item, "value"):  # Allow better dynamic prices later
-                    sell_price = item.value // 2  # Half value if value attribute exists
-
-                player.gold += sell_price
-                player.inventory.remove(item)
-                return f"💰 You sold {item.name} for {sell_price} gold."
-        return "❌ You don't have that item in your inventory."
+    def buy_from(self, player, item_name, count=1):
+        """Player buys one or more of an item from the shop."""
+        _check_count(count)
+        item = self._stocked(item_name)
+        if item is None:
+            return "❓ That item is not sold here."
+        price = self.shop_inventory[item] * count
+        if player.gold >= price:
+            player.gold -= price
+            # Each purchase is its own copy so the stock item is never shared
+            player.inventory.add_many(copy.copy(item) for _ in range(count))
+            bought = item.name if count == 1 else f"{count} x {item.name}"
+            return f"✅ You bought {bought} for {price} gold."
+        else:
+            return "❌ You don't have enough gold."
+
+    def sell_to(self, player, item_name, count=1):
+        """Player sells one or more of an item to the shopkeeper."""
+        _check_count(count)
+        if not player.inventory.find(item_name):
+            return "❌ You don't have that item in your inventory."
+        sold = player.inventory.take(item_name, count)
+        sell_price = 0
+        for item in sold:
+            if hasattr(item, "value"):  # Allow better dynamic prices later
+                sell_price += item.value // 2  # Half value if value attribute exists
+            else:
+                sell_price += 10  # Default fixed sell price
+
+        player.gold += sell_price
+        name = sold[0].name if len(sold) == 1 else f"{len(sold)} x {sold[0].name}"
+        return f"💰 You sold {name} for {sell_price} gold."
 
     def describe(self):
         """Override the default NPC description for shopkeepers."""
@@ -0,0 +1,136 @@
+# models/status_effects.py
+
+import heapq
+
+# Effects that modify a stat while active, and the stat they modify
+MODIFIER_STATS = {
+    "attack_boost": "attack",
+    "defense_boost": "defense",
+}
+
+
+class StatusEffect:
+    """One active effect: a timed stat modifier or a named affliction like "Burning"."""
+
+    __slots__ = ("name", "stat", "value", "expires_at")
+
+    def __init__(self, name, stat=None, value=0, expires_at=None):
+        self.name = name
+        self.stat = stat  # "attack", "defense" or None for afflictions
+        self.value = value
+        self.expires_at = expires_at  # turn on which it wears off, None = until cleared
+
+    def __repr__(self):
+        return f"StatusEffect({self.name!r}, stat={self.stat!r}, value={self.value!r}, expires_at={self.expires_at!r})"
+
+
+class EffectStore:
+    """Active status effects for a Player or NPC.
+
+    Keeps a running total per modified stat so stat reads are O(1), a count
+    per effect name for membership checks, and a min-heap of expiry turns so
+    ``tick()`` only touches effects that actually run out.
+    """
+
+    __slots__ = ("turn", "version", "on_change", "_effects", "_totals", "_counts", "_expiry", "_sequence")
+
+    def __init__(self, on_change=None):
+        self.turn = 0
+        self.version = 0  # bumped on every change
+        self.on_change = on_change  # called after every change
+        self._effects = []
+        self._totals = {}  # stat -> summed modifier value
+        self._counts = {}  # effect name -> number of active effects
+        self._expiry = []  # heap of (expires_at, sequence, effect)
+        self._sequence = 0
+
+    def _changed(self):
+        self.version += 1
+        if self.on_change:
+            self.on_change()
+
+    def add(self, name, value=0, duration=None):
+        """Add an effect; modifiers stack, timed effects last `duration` ticks"""
+        stat = MODIFIER_STATS.get(name)
+        expires_at = None if duration is None else self.turn + duration
+        effect = StatusEffect(name, stat, value, expires_at)
+        self._effects.append(effect)
+        self._counts[name] = self._counts.get(name, 0) + 1
+        if stat:
+            self._totals[stat] = self._totals.get(stat, 0) + value
+        if expires_at is not None:
+            self._sequence += 1
+            heapq.heappush(self._expiry, (expires_at, self._sequence, effect))
+        self._changed()
+        return effect
+
+    def add_status(self, name):
+        """Add a named affliction unless it is already active"""
+        if name not in self._counts:
+            self.add(name)
+
+    def _drop(self, effect):
+        self._effects.remove(effect)
+        count = self._counts[effect.name] - 1
+        if count:
+            self._counts[effect.name] = count
+        else:
+            del self._counts[effect.name]
+        if effect.stat:
+            self._totals[effect.stat] -= effect.value
+        effect.expires_at = -1  # marks heap entries for this effect as stale
+
+    def remove(self, *names):
+        """Remove every effect with any of the given names"""
+        doomed = [effect for effect in self._effects if effect.name in names]
+        for effect in doomed:
+            self._drop(effect)
+        if doomed:
+            self._changed()
+
+    def clear(self):
+        if self._effects:
+            self._effects.clear()
+            self._counts.clear()
+            self._totals.clear()
+            self._expiry.clear()
+            self._changed()
+
+    def tick(self):
+        """Advance one turn, expire effects whose time is up and return them"""
+        turn = self.turn = self.turn + 1
+        if not self._expiry or self._expiry[0][0] > turn:
+            return ()  # the usual case: nothing runs out this turn
+        expired = []
+        while self._expiry and self._expiry[0][0] <= turn:
+            expires_at, _, effect = heapq.heappop(self._expiry)
+            if effect.expires_at == expires_at:
+                self._drop(effect)
+                expired.append(effect)
+        if expired:
+            self._changed()
+        return expired
+
+    def total(self, stat):
+        """Summed value of all active modifiers for a stat"""
+        return self._totals.get(stat, 0)
+
+    def remaining(self, effect):
+        """Turns left on a timed effect, or None if it lasts until cleared"""
+        return None if effect.expires_at is None else effect.expires_at - self.turn
+
+    def names(self):
+        """Names of the active effects, without duplicates, in the order added"""
+        return list(dict.fromkeys(effect.name for effect in self._effects))
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def __iter__(self):
+        return iter(list(self._effects))
+
+    def __len__(self):
+        return len(self._effects)
+
+    def __bool__(self):
+        return bool(self._effects)
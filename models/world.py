@@ -1,67 +1,51 @@
 # models/world.py
 
 from models.room import Room
+from models.room_graph import RoomGraph
+from models.world_loader import WorldFile, LazyRooms, write_world_file
+from models.world_template import TemplateRooms
+from models.registry import RoomRegistry
 from models.npc import NPC
 from models.enemy import Enemy
 from models.item import Item
 from models.item import ScrollOfRevelation
 from models.shop_npc import ShopNPC
+from models.chamber import (DOOR_CLOSING_FRAMES, DOOR_FRAMES, DOOR_OPENING_FRAMES, HINT_TEXT, SECRET_PHRASE,
+                            chamber_loot, special_chamber_loot)
+
+
+def __getattr__(name):
+    # The loot tables are built on first use (see models.chamber), not when this module loads
+    if name == "CHAMBER_LOOT":
+        return chamber_loot()
+    if name == "SPECIAL_CHAMBER_LOOT":
+        return special_chamber_loot()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Hidden Chamber Constants
-SECRET_PHRASE = "whispers of the ancients"
-HINT_TEXT = "Listen to the whispers of the cavern walls..."
-
-# Door Animation Frames
-DOOR_FRAMES = [
-    """
-    +----------+
-    |    ||    |
-    |    ||    |
-    |    ||    |
-    +----------+
-    """,
-    """
-    +----------+
-    |   |  |   |
-    |   |  |   |
-    |   |  |   |
-    +----------+
-    """,
-    """
-    +----------+
-    |  |    |  |
-    |  |    |  |
-    |  |    |  |
-    +----------+
-    """,
-    """
-    +----------+
-    | |      | |
-    | |      | |
-    | |      | |
-    +----------+
-    """,
-    """
-    +----------+
-    |          |
-    |          |
-    |          |
-    +----------+
-    """
-]
-
-# Special Chamber Loot
-CHAMBER_LOOT = [
-    Item("Ancient Relic", "A mysterious artifact pulsing with magical energy", item_type="artifact", value=500),
-    Item("Enchanted Scroll", "Contains powerful forgotten spells", item_type="scroll", value=300),
-    Item("Crystal Shard", "A fragment of pure magical essence", item_type="material", value=250)
-]
 
 class World:
-    def __init__(self):
+    def __init__(self, rooms=None):
         """Initialize the game world with all rooms and connections."""
         self.rooms = {}
-        self.build_world()
+        self.graph = None  # RoomGraph when this world was compiled
+        self.start_room_name = "Sacred Grove"
+        self.registry = RoomRegistry(self)
+        self.starting_room = None  # set when a game starts in this world
+        self.rng = None  # the session's "room" stream once a game starts; rooms roll with it by default
+        self.current_room = None
+        self.quest_state = {
+            'sacred_grove_cleared': False,
+            'shadow_temple_unlocked': False,
+            'hidden_chamber_discovered': False,
+            'final_boss_defeated': False
+        }
+        if rooms is None:
+            self.build_world()
+        else:
+            self.rooms = rooms
+        if isinstance(self.rooms, dict):
+            for room in self.rooms.values():
+                self.registry.register(room)
 
     def build_world(self):
         """Create and connect all rooms in the game world."""
@@ -145,22 +129,56 @@ class World:
 
     def get_starting_room(self):
         """Return the starting room (Sacred Grove)."""
-        return self.rooms["Sacred Grove"]
-
-# Constants
-SECRET_PHRASE = "whispers of the ancients"
-DOOR_OPENING_FRAMES = [
-    "╔════╗\n║    ║\n║    ║\n╚════╝",
-    "╔════╗\n║ ░░ ║\n║ ░░ ║\n╚════╝",
-    "╔════╗\n║ ▒▒ ║\n║ ▒▒ ║\n╚════╝",
-    "╔════╗\n║ ▓▓ ║\n║ ▓▓ ║\n╚════╝",
-    "╔════╗\n║ ██ ║\n║ ██ ║\n╚════╝"
-]
-
-DOOR_CLOSING_FRAMES = DOOR_OPENING_FRAMES[::-1]
-
-SPECIAL_CHAMBER_LOOT = [
-    Item("Ancient Scroll", "A mysterious scroll covered in glowing runes", "scroll", "legendary"),
-    Item("Crystal Staff", "A staff humming with magical energy", "weapon", "epic"),
-    Item("Mystic Amulet", "An amulet that pulses with an otherworldly light", "accessory", "rare")
-]
+        return self.registry.by_name(self.start_room_name)
+
+    def locate_room(self, key):
+        """Return the room for a registry key (its name in hand-built worlds)."""
+        return self.rooms[key]
+
+    def room_named(self, name):
+        """Return the room with this name, building it if the world builds rooms on demand."""
+        return self.rooms[name]
+
+    def has_room(self, name):
+        return name in self.rooms
+
+    @classmethod
+    def load(cls, path):
+        """Open a world file; rooms are built the first time they are looked up."""
+        world_file = WorldFile(path)
+        world = cls(rooms=LazyRooms(world_file))
+        world.rooms.on_load = world.registry.register
+        world.start_room_name = world_file.start
+        return world
+
+    @classmethod
+    def from_template(cls, template):
+        """A session's world over a shared WorldTemplate; only this session's changes are stored here."""
+        world = cls(rooms=TemplateRooms(template))
+        world.rooms.on_load = world.registry.register
+        world.start_room_name = template.start
+        return world
+
+    def save(self, path):
+        """Write this world's rooms to a world file."""
+        write_world_file(path, self.rooms.values(), self.start_room_name)
+
+    def compile(self):
+        """Return a copy of this world backed by an array-based RoomGraph.
+
+        Rooms in the compiled world are GraphRoom facades with integer IDs;
+        exits, items and NPCs keep working through the usual Room API.
+        """
+        graph = RoomGraph.compile(self.rooms.values())
+        world = World(rooms=graph.rooms)
+        world.graph = graph
+        world.quest_state = dict(self.quest_state)
+        world.start_room_name = self.start_room_name
+        graph.on_load = world.registry.register
+        for room in graph.built_rooms():
+            world.registry.register(room)
+        if self.starting_room is not None:
+            world.starting_room = graph.rooms[self.starting_room.name]
+        if self.current_room is not None:
+            world.current_room = graph.rooms[self.current_room.name]
+        return world
@@ -0,0 +1,192 @@
+# models/world_loader.py
+
+import json
+from collections.abc import Mapping
+
+from models.room import Room
+from models.npc import NPC
+from models.item import Item
+from models.shop_npc import ShopNPC
+
+WORLD_FORMAT = "mystic-realms-world"
+WORLD_VERSION = 1
+
+# World files are JSON Lines. The first line is a header holding the room
+# index ({name: [offset, length]}, offsets relative to the end of the header);
+# every following line is one room record:
+#
+#   {"name": ..., "description": ..., "type": ..., "exits": {direction: name},
+#    "items": [item, ...], "npcs": [npc, ...]}
+
+
+def item_to_record(item):
+    record = {"name": item.name, "description": item.description, "type": item.item_type}
+    if item.value:
+        record["value"] = item.value
+    if item.combat_usable:
+        record["combat_usable"] = True
+    if item.effects:
+        record["effects"] = dict(item.effects)
+    if item.rarity != "common":
+        record["rarity"] = item.rarity
+    return record
+
+
+def item_from_record(record):
+    return Item(record["name"], record.get("description", ""),
+                item_type=record.get("type", "misc"),
+                value=record.get("value", 0),
+                combat_usable=record.get("combat_usable", False),
+                effects=record.get("effects"),
+                rarity=record.get("rarity", "common"))
+
+
+def npc_to_record(npc):
+    if isinstance(npc, ShopNPC):
+        return {"kind": "shop", "name": npc.name,
+                "stock": [[item_to_record(item), price] for item, price in npc.shop_inventory.items()]}
+    return {"kind": "npc", "name": npc.name, "hp": npc.hp, "attack_power": npc.attack_power,
+            "loot_gold": npc.loot_gold, "xp_reward": npc.xp_reward, "is_boss": npc.is_boss}
+
+
+def npc_from_record(record):
+    if record.get("kind") == "shop":
+        stock = {item_from_record(item): price for item, price in record.get("stock", [])}
+        return ShopNPC(record["name"], stock)
+    return NPC(record["name"], hp=record["hp"], attack_power=record["attack_power"],
+               loot_gold=record.get("loot_gold", 0), xp_reward=record.get("xp_reward", 0),
+               is_boss=record.get("is_boss", False))
+
+
+def room_to_record(room):
+    return {"name": room.name, "description": room.description, "type": room.room_type,
+            "exits": {direction: target.name for direction, target in room.exits.items()},
+            "items": [item_to_record(item) for item in room.items],
+            "npcs": [npc_to_record(npc) for npc in room.npcs]}
+
+
+def write_world_file(path, rooms, start):
+    """Write rooms (an iterable of Room) to a world file"""
+    rooms = list(rooms)
+    lines = [json.dumps(room_to_record(room), ensure_ascii=False).encode("utf-8") + b"\n"
+             for room in rooms]
+    index = {}
+    offset = 0
+    for room, line in zip(rooms, lines):
+        index[room.name] = [offset, len(line)]
+        offset += len(line)
+    header = {"format": WORLD_FORMAT, "version": WORLD_VERSION, "start": start, "rooms": index}
+    with open(path, "wb") as f:
+        f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+        f.writelines(lines)
+
+
+class WorldFile:
+    """An on-disk world: the room index is read up front, records on demand."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header_line = f.readline()
+        header = json.loads(header_line)
+        if header.get("format") != WORLD_FORMAT:
+            raise ValueError(f"{path} is not a world file")
+        if header.get("version", 0) > WORLD_VERSION:
+            raise ValueError(f"{path} uses world format v{header['version']}, expected v{WORLD_VERSION}")
+        self.start = header["start"]
+        self.index = header["rooms"]
+        self._body_offset = len(header_line)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def read_record(self, name):
+        """Read and decode one room record"""
+        offset, length = self.index[name]
+        with open(self.path, "rb") as f:
+            f.seek(self._body_offset + offset)
+            return json.loads(f.read(length))
+
+
+class LazyRoom(Room):
+    """Room whose exits are stored by name and resolved on first use."""
+
+    __slots__ = ("resolver",)
+
+    cache_exits = True  # keep resolved neighbours instead of resolving every time
+
+    def __init__(self, name, description, room_type="normal", resolver=None):
+        super().__init__(name, description, room_type)
+        self.resolver = resolver  # name -> Room
+
+    @property
+    def exits(self):
+        return LazyExitsView(self)
+
+
+class LazyExitsView(Mapping):
+    """direction -> Room view that loads a neighbour only when it is followed"""
+
+    __slots__ = ("room",)
+
+    def __init__(self, room):
+        self.room = room
+
+    def __getitem__(self, direction):
+        exits = self.room._exits
+        target = exits[direction]
+        if not isinstance(target, Room):
+            target = self.room.resolver(target)
+            if self.room.cache_exits:
+                exits[direction] = target
+        return target
+
+    def __contains__(self, direction):
+        return direction in self.room._exits
+
+    def __iter__(self):
+        return iter(self.room._exits)
+
+    def __len__(self):
+        return len(self.room._exits)
+
+
+class LazyRooms(Mapping):
+    """name -> Room mapping that builds each room the first time it is looked up"""
+
+    def __init__(self, world_file):
+        self.world_file = world_file
+        self._loaded = {}
+        self.on_load = None  # called with each room as it is built
+
+    def __getitem__(self, name):
+        room = self._loaded.get(name)
+        if room is None:
+            if name not in self.world_file:
+                raise KeyError(name)
+            room = self._loaded[name] = self._build(self.world_file.read_record(name))
+            if self.on_load:
+                self.on_load(room)
+        return room
+
+    def __contains__(self, name):
+        return name in self._loaded or name in self.world_file
+
+    def __iter__(self):
+        return iter(self.world_file.index)
+
+    def __len__(self):
+        return len(self.world_file.index)
+
+    @property
+    def loaded(self):
+        """Rooms that have been built so far"""
+        return dict(self._loaded)
+
+    def _build(self, record):
+        room = LazyRoom(record["name"], record.get("description", ""),
+                        record.get("type", "normal"), resolver=self.__getitem__)
+        room._exits.update(record.get("exits", {}))
+        room.items.extend(item_from_record(item) for item in record.get("items", []))
+        room.npcs.extend(npc_from_record(npc) for npc in record.get("npcs", []))
+        return room
@@ -0,0 +1,126 @@
+# models/world_template.py
+
+import os
+from types import MappingProxyType
+
+from models.name_index import CopyOnWriteList, NameIndexedList
+from models.npc import NPC
+from models.shop_npc import ShopNPC
+from models.world_loader import LazyRoom, LazyRooms, WorldFile, item_from_record, npc_from_record
+
+
+def own_npc(npc):
+    """A session's own copy of a template NPC; items, which nothing modifies, stay shared"""
+    if isinstance(npc, ShopNPC):
+        return ShopNPC(npc.name, dict(npc.shop_inventory))
+    return NPC(npc.name, npc.hp, npc.attack_power, npc.loot_gold, npc.xp_reward, npc.is_boss)
+
+
+class RoomTemplate:
+    """A room as its world file describes it, shared read-only by every session."""
+
+    __slots__ = ("name", "description", "room_type", "exits", "items", "npcs")
+
+    def __init__(self, record):
+        self.name = record["name"]
+        self.description = record.get("description", "")
+        self.room_type = record.get("type", "normal")
+        self.exits = MappingProxyType(dict(record.get("exits", {})))  # direction -> room name
+        # Items are never modified, so every session can hold the same ones
+        self.items = NameIndexedList(item_from_record(item) for item in record.get("items", []))
+        # NPCs take damage in place, so these are only ever copied (own_npc), never handed out
+        self.npcs = tuple(npc_from_record(npc) for npc in record.get("npcs", ()))
+
+    def __repr__(self):
+        return f"RoomTemplate({self.name!r})"
+
+
+class WorldTemplate:
+    """A world file decoded once and shared by every game session in the process.
+
+    Rooms are decoded the first time any session asks for them and then kept.
+    Nothing ever changes a template: a World built on one with
+    World.from_template keeps each session's changes in its own TemplateRooms.
+    """
+
+    def __init__(self, world_file):
+        self.world_file = world_file
+        self.start = world_file.start
+        self.index = world_file.index
+        self._rooms = {}  # name -> RoomTemplate
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def read_record(self, name):
+        """The RoomTemplate for a room, decoded on first use (the record source for TemplateRooms)"""
+        room = self._rooms.get(name)
+        if room is None:
+            # Two sessions may decode the same room at once; both get the one stored first
+            room = self._rooms.setdefault(name, RoomTemplate(self.world_file.read_record(name)))
+        return room
+
+    def __len__(self):
+        return len(self.index)
+
+
+class TemplateRoom(LazyRoom):
+    """One session's view of a RoomTemplate, storing only what the session changes.
+
+    Exits and items are read from the template until the session changes
+    them; the first change copies that table into the room. NPCs fight and
+    take damage in place, so the room copies the template's the first time
+    its creatures are looked at. Flags such as ``visited`` or ``door_state``
+    live on the room itself.
+    """
+
+    __slots__ = ("template",)
+
+    # The exit table may be the template's, which resolving an exit must never write to
+    cache_exits = False
+
+    def __init__(self, template, resolver):
+        super().__init__(template.name, template.description, template.room_type, resolver)
+        self.template = template
+        self._exits = template.exits
+        self.items = CopyOnWriteList(template.items, on_change=self._touch)
+        self.npcs = CopyOnWriteList(template.npcs, on_change=self._touch, copy=own_npc)
+
+    @property
+    def changed_exits(self):
+        """Whether this room's exits differ from the template's"""
+        return self._exits is not self.template.exits
+
+    def _own_exits(self):
+        if self._exits is self.template.exits:
+            self._exits = dict(self._exits)
+        return self._exits
+
+    def _link(self, direction, room):
+        self._own_exits()[direction] = room
+
+    def _unlink(self, direction):
+        del self._own_exits()[direction]
+
+
+class TemplateRooms(LazyRooms):
+    """name -> TemplateRoom mapping over a shared WorldTemplate, one per session"""
+
+    def __init__(self, template):
+        super().__init__(template)
+        self.template = template
+
+    def _build(self, room_template):
+        return TemplateRoom(room_template, resolver=self.__getitem__)
+
+
+_templates = {}  # absolute path -> WorldTemplate
+
+
+def load_template(path):
+    """The process-wide WorldTemplate for a world file, read on first use"""
+    path = os.path.abspath(path)
+    template = _templates.get(path)
+    if template is None:
+        template = _templates.setdefault(path, WorldTemplate(WorldFile(path)))
+    return template